@@ -0,0 +1,131 @@
+"""
+Time running quality checks on a synthetic mixed-format batch of translations,
+comparing serial checks with a pool of worker processes.
+
+Usage:
+    python benchmarks/checks_bulk.py [--translations 20000] [--workers N]
+
+By default, one worker process is used per CPU.
+
+No database access is needed; the Pontoon settings still need to be importable,
+so e.g. SECRET_KEY and DATABASE_URL should be set in the environment.
+"""
+
+import argparse
+import os
+import sys
+
+from os.path import dirname
+from time import perf_counter
+
+
+sys.path.insert(0, dirname(dirname(__file__)))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "pontoon.settings")
+
+import django  # noqa: E402
+
+
+django.setup()
+
+from pontoon.base.models import Entity, Locale, Resource, Translation  # noqa: E402
+from pontoon.checks.utils import bulk_get_failed_checks  # noqa: E402
+
+
+# (format, path, source, translations) for each kind of synthetic entity
+CORPUS = [
+    (
+        Resource.Format.FLUENT,
+        "messages.ftl",
+        "msg-{i} = Hello { $user }, you have { $count } messages\n",
+        [
+            "msg-{i} = Bonjour { $user }, vous avez { $count } messages\n",
+            "msg-{i} = Bonjour, vous avez des messages\n",
+            "msg-{i} = Bonjour { $user\n",
+        ],
+    ),
+    (
+        Resource.Format.PROPERTIES,
+        "messages.properties",
+        "Hello %S, you have %S messages",
+        ["Bonjour %S, vous avez %S messages", "Bonjour, vous avez %S messages"],
+    ),
+    (
+        Resource.Format.DTD,
+        "messages.dtd",
+        "Hello &brandShortName;",
+        ["Bonjour &brandShortName;", "Bonjour &unknownEntity;"],
+    ),
+    (
+        Resource.Format.ANDROID,
+        "strings.xml",
+        "Hello world, this is message {i}",
+        ["Bonjour le monde, voici le message {i}", ""],
+    ),
+    (
+        Resource.Format.GETTEXT,
+        "messages.po",
+        "Hello world, this is message {i}",
+        ["Bonjour le monde, voici le message {i}"],
+    ),
+]
+
+
+def build(count: int) -> list[Translation]:
+    locale = Locale(code="fr")
+    resources = []
+    for pk, (format, path, _, _) in enumerate(CORPUS, 1):
+        resource = Resource(pk=pk, path=path, format=format)
+        resource._prefetched_objects_cache = {"entities": []}
+        resources.append(resource)
+
+    translations: list[Translation] = []
+    i = 0
+    while len(translations) < count:
+        for resource, (_, _, source, targets) in zip(resources, CORPUS):
+            entity = Entity(
+                pk=i,
+                resource=resource,
+                key=[f"msg-{i}"],
+                string=source.replace("{i}", str(i)),
+                comment="",
+            )
+            references = resource._prefetched_objects_cache["entities"]
+            if resource.format == Resource.Format.DTD and len(references) < 200:
+                references.append(entity)
+            for target in targets:
+                translations.append(
+                    Translation(
+                        entity=entity,
+                        locale=locale,
+                        string=target.replace("{i}", str(i)),
+                    )
+                )
+            i += 1
+    return translations[:count]
+
+
+def run(label: str, translations: list[Translation], workers: int) -> None:
+    start = perf_counter()
+    failed = sum(
+        1 for checks in bulk_get_failed_checks(translations, workers) if checks
+    )
+    print(f"{label:>8}: {perf_counter() - start:8.3f}s ({failed} failed)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("--translations", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    translations = build(args.translations)
+    print(
+        f"Checking {len(translations)} translations in {len(CORPUS)} formats"
+        f" with {os.cpu_count()} CPUs"
+    )
+    run("serial", translations, 0)
+    run(f"{args.workers} procs", translations, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Time serializing a synthetic gettext resource for one locale,
+comparing the indexed translation lookup used by sync
+with the linear scan it replaced.
+
+Usage:
+    python benchmarks/sync_serialize.py [--entries 20000]
+
+No database access is needed; the Pontoon settings still need to be importable,
+so e.g. SECRET_KEY and DATABASE_URL should be set in the environment.
+"""
+
+import argparse
+import os
+import sys
+
+from os.path import dirname, join
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+
+sys.path.insert(0, dirname(dirname(__file__)))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "pontoon.settings")
+
+import django  # noqa: E402
+
+
+django.setup()
+
+from moz.l10n.resource import parse_resource, serialize_resource  # noqa: E402
+
+from pontoon.base.models import Entity, Locale, Translation  # noqa: E402
+from pontoon.sync.core.translations_to_repo import (  # noqa: E402
+    index_translations,
+    set_translations,
+)
+
+
+class LinearIndex(dict):
+    """Emulates the previous `next(tx for tx in translations if ...)` lookup."""
+
+    def get(self, key, default=None):
+        key = list(key)
+        return next(
+            (tx for tx in self.values() if tx.entity.key == key),
+            default,
+        )
+
+
+def build(root: str, count: int) -> tuple[str, list[Translation]]:
+    path = join(root, "messages.pot")
+    with open(path, "w", encoding="utf-8") as file:
+        file.write('#\nmsgid ""\nmsgstr ""\n\n')
+        for i in range(count):
+            file.write(f'msgid "Source message {i}"\nmsgstr ""\n\n')
+    translations = [
+        Translation(
+            entity=Entity(key=[f"Source message {i}"]),
+            string=f"Translated message {i}",
+            approved=True,
+        )
+        for i in range(count)
+    ]
+    return path, translations
+
+
+def run(label: str, ref_path: str, locale: Locale, index: dict) -> None:
+    start = perf_counter()
+    res = parse_resource(ref_path)
+    set_translations(locale, index, res)
+    size = sum(len(line) for line in serialize_resource(res))
+    print(f"{label:>8}: {perf_counter() - start:8.3f}s ({size} chars)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("--entries", type=int, default=20_000)
+    args = parser.parse_args()
+
+    locale = Locale(code="fr", cldr_plurals="1,5", plural_rule="(n > 1)")
+    with TemporaryDirectory() as root:
+        ref_path, translations = build(root, args.entries)
+        print(f"Serializing {args.entries} gettext entries")
+        run("before", ref_path, locale, LinearIndex(index_translations(translations)))
+        run("after", ref_path, locale, index_translations(translations))
+
+
+if __name__ == "__main__":
+    main()
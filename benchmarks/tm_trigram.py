@@ -0,0 +1,126 @@
+"""
+Time translation memory fuzzy matching on a synthetic translation memory,
+comparing the trigram candidate prefilter with scoring every entry
+of a similar length.
+
+Usage:
+    python benchmarks/tm_trigram.py [--entries 1000000] [--locales 50] [--queries 20] [--candidates 200]
+
+The entries are spread over temporary locales in the configured database,
+which needs the migrations applied, and are deleted at the end of the run.
+Matching is timed for one of the locales, as it is always filtered by locale.
+"""
+
+import argparse
+import os
+import random
+import sys
+
+from os.path import dirname
+from time import perf_counter
+
+
+sys.path.insert(0, dirname(dirname(__file__)))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "pontoon.settings")
+
+import django  # noqa: E402
+
+
+django.setup()
+
+from django.db import connection  # noqa: E402
+
+from pontoon.base.models import (  # noqa: E402
+    Locale,
+    TranslationMemoryEntry,
+    UniqueTranslationMemoryEntry,
+)
+
+
+WORDS = (
+    "account add address allow app back bookmark browser cancel change choose "
+    "close connect copy create data default delete device download edit email "
+    "enable error file find folder help history home import install learn link "
+    "manage menu message more new next open page password private profile "
+    "remove restart save search select send settings share show sign site start "
+    "sync tab theme update use view window your"
+).split()
+
+
+def build(locales: list[Locale], count: int) -> None:
+    """
+    Insert `count` entries of 3-12 random words, spread evenly over `locales`,
+    with SQL for speed.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO base_translationmemoryentry (source, target, locale_id)
+            SELECT src, upper(src), (%s::int[])[1 + n %% %s] FROM (
+                SELECT n, string_agg(
+                    (%s::text[])[1 + floor(random() * %s)::int], ' '
+                ) AS src
+                FROM generate_series(1, %s) AS n,
+                LATERAL generate_series(1, 3 + n %% 10) AS w
+                GROUP BY n
+            ) AS entries
+            """,
+            [[locale.pk for locale in locales], len(locales), WORDS, len(WORDS), count],
+        )
+        cursor.execute("ANALYZE base_translationmemoryentry")
+        cursor.execute("ANALYZE base_uniquetranslationmemoryentry")
+
+
+def query_texts(count: int) -> list[str]:
+    rng = random.Random(count)
+    return [
+        " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 12)))
+        for _ in range(count)
+    ]
+
+
+def run(label: str, locale: Locale, texts: list[str], candidates: int) -> None:
+    entries = UniqueTranslationMemoryEntry.objects.filter(locale=locale)
+    matches = 0
+    start = perf_counter()
+    for text in texts:
+        qs = entries.minimum_levenshtein_ratio(text, candidates=candidates)
+        matches += len(qs.values("source", "target", "quality"))
+    elapsed = perf_counter() - start
+    print(
+        f"{label:>8}: {elapsed:8.3f}s, {elapsed / len(texts) * 1000:8.1f}ms/query"
+        f" ({matches} matches)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    parser.add_argument("--locales", type=int, default=50)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--candidates", type=int, default=200)
+    args = parser.parse_args()
+
+    locales = Locale.objects.bulk_create(
+        Locale(code=f"x-benchmark-tm-{i}", name=f"Benchmark TM {i}")
+        for i in range(args.locales)
+    )
+    try:
+        print(
+            f"Creating {args.entries} translation memory entries"
+            f" in {args.locales} locales"
+        )
+        start = perf_counter()
+        build(locales, args.entries)
+        print(f"{'build':>8}: {perf_counter() - start:8.3f}s")
+
+        texts = query_texts(args.queries)
+        run("before", locales[0], texts, 0)
+        run("after", locales[0], texts, args.candidates)
+    finally:
+        TranslationMemoryEntry.objects.filter(locale__in=locales).delete()
+        Locale.objects.filter(pk__in=[locale.pk for locale in locales]).delete()
+
+
+if __name__ == "__main__":
+    main()
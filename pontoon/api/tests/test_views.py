@@ -1963,7 +1963,7 @@ def test_translations_download_zip(member):
     assert response.status_code == 200
     assert response["Content-Type"] == "application/zip"
     assert response["Content-Disposition"] == 'attachment; filename="dl-zip-fr-DL.zip"'
-    with ZipFile(BytesIO(response.content)) as zipfile:
+    with ZipFile(BytesIO(b"".join(response.streaming_content))) as zipfile:
         assert zipfile.namelist() == ["fr-DL/a.ftl", "fr-DL/b.po"]
         assert zipfile.read("fr-DL/a.ftl") == b"key-0 = Traduction 0\n"
     assert mock_serialize.call_args.args == (project, locale, None)
@@ -1,10 +1,9 @@
 import logging
 
 from datetime import datetime, timedelta
-from io import BytesIO
+from itertools import chain
 from os.path import basename
 from types import SimpleNamespace
-from zipfile import ZipFile
 
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import generics, status
@@ -14,7 +13,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from django.db.models import Prefetch, Q
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils.timezone import make_aware
 
@@ -34,6 +33,7 @@ from pontoon.base.models import (
 )
 from pontoon.base.models.entity import Entity
 from pontoon.base.models.translation import Translation
+from pontoon.base.utils import build_zip_file
 from pontoon.pretranslation.pretranslate import get_pretranslation
 from pontoon.settings.base import PRETRANSLATION_API_MAX_CHARS
 from pontoon.sync.repositories import PullFromRepositoryException
@@ -173,7 +173,9 @@ class ProjectLocaleTranslationsView(APIView):
 
         resource_path = request.query_params.get("resource")
         try:
-            files = list(serialize_locale(project, locale, resource_path))
+            # Repositories are checked out before the first file is serialized
+            files = iter(serialize_locale(project, locale, resource_path))
+            first = next(files, None)
         except PullFromRepositoryException as error:
             # Git stderr may contain sensitive details (e.g. a token-bearing
             # URL from .gitconfig); keep it server-side, return a generic body.
@@ -184,20 +186,20 @@ class ProjectLocaleTranslationsView(APIView):
             )
 
         if resource_path is not None:
-            if not files:
+            if first is None:
                 raise NotFound("Resource not found.")
-            rel_path, content = files[0]
+            rel_path, content = first
             response = HttpResponse(content, content_type="text/plain; charset=utf-8")
             response["Content-Disposition"] = (
                 f'attachment; filename="{basename(rel_path)}"'
             )
             return response
 
-        bytes_io = BytesIO()
-        with ZipFile(bytes_io, "w") as zipfile:
-            for rel_path, content in files:
-                zipfile.writestr(rel_path, content)
-        response = HttpResponse(bytes_io.getvalue(), content_type="application/zip")
+        if first is not None:
+            files = chain([first], files)
+        response = StreamingHttpResponse(
+            build_zip_file(files), content_type="application/zip"
+        )
         response["Content-Disposition"] = (
             f'attachment; filename="{project.slug}-{locale.code}.zip"'
         )
@@ -1,19 +1,51 @@
 from functools import cached_property
 
+from django.db.models import BooleanField, Case, F, QuerySet, Sum, Value, When
+
+
+def annotate_stats(query: QuerySet, rollup: str) -> QuerySet:
+    """
+    Annotate `query` with its string stats,
+    summed from the stats rollups at the `rollup` relation.
+    """
+    return query.annotate(
+        total=Sum(f"{rollup}__total_strings", default=0),
+        approved=Sum(f"{rollup}__approved_strings", default=0),
+        pretranslated=Sum(f"{rollup}__pretranslated_strings", default=0),
+        errors=Sum(f"{rollup}__strings_with_errors", default=0),
+        warnings=Sum(f"{rollup}__strings_with_warnings", default=0),
+        unreviewed=Sum(f"{rollup}__unreviewed_strings", default=0),
+    ).annotate(
+        missing=F("total")
+        - F("approved")
+        - F("pretranslated")
+        - F("errors")
+        - F("warnings"),
+        completed=F("approved") + F("warnings"),
+        is_complete=Case(
+            When(
+                total=F("approved") + F("warnings"),
+                then=Value(True),
+            ),
+            default=Value(False),
+            output_field=BooleanField(),
+        ),
+    )
+
 
 class AggregatedStats:
     aggregated_stats_query: object
     """
-    Must be set by the child class as a QuerySet of TranslatedResource objects.
+    Must be set by the child class as a QuerySet of stats rollups,
+    i.e. ProjectLocaleStats, ProjectStats or LocaleStats objects.
 
-    Should include any filters leaving out disabled or system projects.
+    Should include any filters leaving out disabled, system or private projects,
+    e.g. with `ProjectStatsRollupQuerySet.filter_projects()`.
     """
 
     @cached_property
     def _stats(self) -> dict[str, int]:
-        return self.aggregated_stats_query.string_stats(
-            count_disabled=True, count_system_projects=True
-        )
+        return self.aggregated_stats_query.string_stats()
 
     @property
     def total_strings(self) -> int:
@@ -0,0 +1,119 @@
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Count, F, Sum
+
+from pontoon.base.models import (
+    LocaleStats,
+    ProjectLocaleStats,
+    ProjectStats,
+    TranslatedResource,
+)
+
+
+log = logging.getLogger(__name__)
+
+FIELDS = [
+    "translated_resources",
+    "total_strings",
+    "approved_strings",
+    "pretranslated_strings",
+    "strings_with_errors",
+    "strings_with_warnings",
+    "unreviewed_strings",
+]
+
+
+def recount(keys: list[str], translated_resources) -> dict[tuple, dict[str, int]]:
+    """`translated_resources` need to be grouped by `keys` with `values()`."""
+    rows = translated_resources.annotate(
+        translated_resources=Count("id"),
+        **{field: Sum(field) for field in FIELDS[1:]},
+    )
+    return {tuple(row[key] for key in keys): row for row in rows}
+
+
+def rollups(keys: list[str], model) -> dict[tuple, dict[str, int]]:
+    rows = model.objects.values(*keys, *FIELDS)
+    return {tuple(row[key] for key in keys): row for row in rows}
+
+
+class Command(BaseCommand):
+    help = """
+        Check the stats rollups of projects, locales and project locales,
+        which are maintained by database triggers, against a full recount
+        of their translated resources.
+
+        With --fix, the rollups that differ are replaced with the recount.
+        """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Replace the rollups that differ from the recount",
+        )
+
+    def handle(self, *args, **options):
+        fix = options["fix"]
+        tr = TranslatedResource.objects.all()
+        project = {"project_id": F("resource__project")}
+        checks = [
+            (
+                ProjectLocaleStats,
+                ["project_id", "locale_id"],
+                tr.values("locale_id", **project),
+            ),
+            (ProjectStats, ["project_id"], tr.values(**project)),
+            (
+                LocaleStats,
+                ["locale_id"],
+                tr.filter(
+                    resource__project__disabled=False,
+                    resource__project__system_project=False,
+                    resource__project__visibility="public",
+                ).values("locale_id"),
+            ),
+        ]
+
+        nested = connection.in_atomic_block
+        with transaction.atomic(), connection.cursor() as cursor:
+            if fix:
+                # Block writes until done, so that no changes are lost.
+                cursor.execute(
+                    "LOCK TABLE base_translatedresource, base_project IN SHARE MODE"
+                )
+            elif not nested:
+                # Read the rollups and translated resources from one snapshot.
+                cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+
+            mismatches = 0
+            for model, keys, translated_resources in checks:
+                expected = recount(keys, translated_resources)
+                actual = rollups(keys, model)
+                differ = [
+                    key
+                    for key in expected.keys() | actual.keys()
+                    if expected.get(key) != actual.get(key)
+                ]
+                for key in differ:
+                    log.warning(
+                        f"{model.__name__} {key}: "
+                        f"expected {expected.get(key)}, found {actual.get(key)}"
+                    )
+                mismatches += len(differ)
+
+                if fix and differ:
+                    for key in differ:
+                        model.objects.filter(**dict(zip(keys, key))).delete()
+                    model.objects.bulk_create(
+                        model(**expected[key]) for key in differ if key in expected
+                    )
+
+        if not mismatches:
+            log.info("Stats rollups are consistent.")
+        elif fix:
+            log.info(f"Fixed {mismatches} stats rollups.")
+        else:
+            raise CommandError(f"Found {mismatches} inconsistent stats rollups.")
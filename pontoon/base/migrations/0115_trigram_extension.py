@@ -0,0 +1,15 @@
+# Generated by Django 5.2.14 on 2026-10-18 09:12
+
+from django.contrib.postgres.operations import BtreeGistExtension, TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("base", "0114_repository_readonly"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        BtreeGistExtension(),
+    ]
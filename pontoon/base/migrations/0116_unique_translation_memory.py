@@ -0,0 +1,191 @@
+# Generated by Django 5.2.14 on 2026-10-18 10:41
+
+import django.db.models.deletion
+import django.db.models.functions.text
+
+from django.db import migrations, models
+
+
+# The hashes of new and changed entries are set by a row-level trigger.
+# Existing entries are hashed in batches by migration 0117, until then
+# their hashes are NULL and they are not counted as unique entries.
+SET_HASHES = """
+CREATE FUNCTION base_tm_set_hashes() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.source_hash := md5(NEW.source);
+    NEW.target_hash := md5(NEW.target);
+    RETURN NEW;
+END;
+$$;
+
+CREATE TRIGGER base_tm_set_hashes
+BEFORE INSERT OR UPDATE OF source, target ON base_translationmemoryentry
+FOR EACH ROW EXECUTE FUNCTION base_tm_set_hashes();
+"""
+
+# The unique entries are maintained by statement-level triggers,
+# so that bulk inserts, updates and deletes are counted with one query each.
+ADD_ENTRIES = """
+    INSERT INTO base_uniquetranslationmemoryentry (locale_id, source, target, count)
+    SELECT locale_id, min(source), min(target), count(*)
+    FROM {rows} AS changed
+    WHERE source_hash IS NOT NULL
+    GROUP BY locale_id, source_hash, target_hash
+    ON CONFLICT (locale_id, source_hash, target_hash)
+    DO UPDATE SET count = base_uniquetranslationmemoryentry.count + EXCLUDED.count;
+"""
+
+REMOVE_ENTRIES = """
+    DELETE FROM base_uniquetranslationmemoryentry AS u
+    USING (
+        SELECT locale_id, source_hash, target_hash, count(*) AS n
+        FROM {rows} AS changed
+        GROUP BY locale_id, source_hash, target_hash
+    ) AS removed
+    WHERE u.locale_id = removed.locale_id
+        AND u.source_hash = removed.source_hash
+        AND u.target_hash = removed.target_hash
+        AND u.count <= removed.n;
+    UPDATE base_uniquetranslationmemoryentry AS u
+    SET count = u.count - removed.n
+    FROM (
+        SELECT locale_id, source_hash, target_hash, count(*) AS n
+        FROM {rows} AS changed
+        GROUP BY locale_id, source_hash, target_hash
+    ) AS removed
+    WHERE u.locale_id = removed.locale_id
+        AND u.source_hash = removed.source_hash
+        AND u.target_hash = removed.target_hash;
+"""
+
+# Only updates that change the locale, source or target need to be counted.
+CHANGED_ROWS = """(
+    SELECT {side}.* FROM old_rows
+    JOIN new_rows ON old_rows.id = new_rows.id
+    WHERE (old_rows.locale_id, old_rows.source_hash, old_rows.target_hash)
+        IS DISTINCT FROM (new_rows.locale_id, new_rows.source_hash, new_rows.target_hash)
+)"""
+
+TRIGGER_FUNCTION = """
+CREATE FUNCTION {name}() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    {body}
+    RETURN NULL;
+END;
+$$;
+"""
+
+CREATE_TRIGGERS = (
+    TRIGGER_FUNCTION.format(
+        name="base_unique_tm_insert",
+        body=ADD_ENTRIES.format(rows="new_rows"),
+    )
+    + TRIGGER_FUNCTION.format(
+        name="base_unique_tm_delete",
+        body=REMOVE_ENTRIES.format(rows="old_rows"),
+    )
+    + TRIGGER_FUNCTION.format(
+        name="base_unique_tm_update",
+        body=REMOVE_ENTRIES.format(rows=CHANGED_ROWS.format(side="old_rows"))
+        + ADD_ENTRIES.format(rows=CHANGED_ROWS.format(side="new_rows")),
+    )
+    + """
+CREATE TRIGGER base_unique_tm_insert
+AFTER INSERT ON base_translationmemoryentry
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION base_unique_tm_insert();
+
+CREATE TRIGGER base_unique_tm_delete
+AFTER DELETE ON base_translationmemoryentry
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION base_unique_tm_delete();
+
+CREATE TRIGGER base_unique_tm_update
+AFTER UPDATE ON base_translationmemoryentry
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION base_unique_tm_update();
+"""
+)
+
+DROP_TRIGGERS = """
+DROP TRIGGER base_tm_set_hashes ON base_translationmemoryentry;
+DROP FUNCTION base_tm_set_hashes();
+DROP TRIGGER base_unique_tm_insert ON base_translationmemoryentry;
+DROP TRIGGER base_unique_tm_delete ON base_translationmemoryentry;
+DROP TRIGGER base_unique_tm_update ON base_translationmemoryentry;
+DROP FUNCTION base_unique_tm_insert();
+DROP FUNCTION base_unique_tm_delete();
+DROP FUNCTION base_unique_tm_update();
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("base", "0115_trigram_extension"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="translationmemoryentry",
+            name="source_hash",
+            field=models.CharField(editable=False, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name="translationmemoryentry",
+            name="target_hash",
+            field=models.CharField(editable=False, max_length=32, null=True),
+        ),
+        migrations.CreateModel(
+            name="UniqueTranslationMemoryEntry",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("source", models.TextField()),
+                ("target", models.TextField()),
+                (
+                    "source_hash",
+                    models.GeneratedField(
+                        db_persist=True,
+                        expression=django.db.models.functions.text.MD5("source"),
+                        output_field=models.CharField(max_length=32),
+                    ),
+                ),
+                (
+                    "target_hash",
+                    models.GeneratedField(
+                        db_persist=True,
+                        expression=django.db.models.functions.text.MD5("target"),
+                        output_field=models.CharField(max_length=32),
+                    ),
+                ),
+                ("count", models.PositiveIntegerField()),
+                (
+                    "locale",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="base.locale",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("locale", "source_hash", "target_hash"),
+                        name="base_unique_tm_locale_source_target",
+                    )
+                ],
+            },
+        ),
+        migrations.RunSQL(
+            sql=SET_HASHES + CREATE_TRIGGERS,
+            reverse_sql=DROP_TRIGGERS,
+        ),
+    ]
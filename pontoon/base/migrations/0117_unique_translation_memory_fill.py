@@ -0,0 +1,45 @@
+# Generated by Django 5.2.14 on 2026-10-18 10:43
+
+from django.db import migrations
+
+
+BATCH_SIZE = 10000
+
+
+def fill_hashes(apps, schema_editor):
+    """
+    Hash the existing translation memory entries in batches of ids,
+    each in a transaction of its own so that no lock is held for long.
+
+    The update trigger added in migration 0116 counts each hashed entry
+    as a unique entry. Entries created or changed since then are already
+    hashed and counted, and are skipped.
+    """
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT min(id), max(id) FROM base_translationmemoryentry")
+        min_id, max_id = cursor.fetchone()
+        if min_id is None:
+            return
+
+        for start in range(min_id, max_id + 1, BATCH_SIZE):
+            cursor.execute(
+                """
+                UPDATE base_translationmemoryentry
+                SET source_hash = md5(source), target_hash = md5(target)
+                WHERE id >= %s AND id < %s AND source_hash IS NULL
+                """,
+                [start, start + BATCH_SIZE],
+            )
+
+
+class Migration(migrations.Migration):
+    # Commit each batch on its own, rather than all in one transaction.
+    atomic = False
+
+    dependencies = [
+        ("base", "0116_unique_translation_memory"),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_hashes, migrations.RunPython.noop),
+    ]
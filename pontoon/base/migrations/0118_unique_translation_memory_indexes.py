@@ -0,0 +1,32 @@
+# Generated by Django 5.2.14 on 2026-10-18 10:45
+
+import django.contrib.postgres.indexes
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # The indexes are added concurrently, so as not to lock large tables.
+    atomic = False
+
+    dependencies = [
+        ("base", "0117_unique_translation_memory_fill"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="translationmemoryentry",
+            index=models.Index(
+                fields=["locale", "source_hash"], name="base_tm_locale_source_hash"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="uniquetranslationmemoryentry",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["locale", "source"],
+                name="base_unique_tm_locale_trgm",
+                opclasses=["gist_int4_ops", "gist_trgm_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.14 on 2026-10-18 03:49
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # The indexes are added concurrently, so as not to lock a large table.
+    atomic = False
+
+    dependencies = [
+        ("base", "0118_unique_translation_memory_indexes"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="uniquetranslationmemoryentry",
+            index=models.Index(
+                fields=["locale", "id"], name="base_unique_tm_locale_id"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="uniquetranslationmemoryentry",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("source"), name="gin_trgm_ops"
+                ),
+                name="base_unique_tm_source_upper",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="uniquetranslationmemoryentry",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("target"), name="gin_trgm_ops"
+                ),
+                name="base_unique_tm_target_upper",
+            ),
+        ),
+    ]
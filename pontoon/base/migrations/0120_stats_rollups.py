@@ -0,0 +1,344 @@
+# Generated by Django 5.2.14 on 2026-10-18 03:52
+
+import django.db.models.deletion
+
+from django.db import migrations, models
+
+
+# The rollups are maintained by statement-level triggers,
+# so that bulk inserts, updates and deletes of translated resources
+# update each rollup row with one query, in the same transaction.
+#
+# As a trade-off, each ProjectStats and LocaleStats row is updated by
+# every change to the stats of its project or locale, so concurrent
+# transactions changing the same project or locale wait for each other
+# to commit. To avoid deadlocks between them, the rollup rows of each
+# table are always locked in the order of their keys.
+STATS = [
+    "total_strings",
+    "approved_strings",
+    "pretranslated_strings",
+    "strings_with_errors",
+    "strings_with_warnings",
+    "unreviewed_strings",
+]
+
+# Whether a project's stats are counted in its locales' LocaleStats
+COUNTED = "(NOT {p}.disabled AND NOT {p}.system_project AND {p}.visibility = 'public')"
+
+# (table, key columns with their source, extra joins of the changed rows)
+ROLLUPS = [
+    (
+        "base_projectlocalestats",
+        {"project_id": "res.project_id", "locale_id": "tr.locale_id"},
+        "",
+    ),
+    ("base_projectstats", {"project_id": "res.project_id"}, ""),
+    (
+        "base_localestats",
+        {"locale_id": "tr.locale_id"},
+        "JOIN base_project AS p ON p.id = res.project_id AND " + COUNTED.format(p="p"),
+    ),
+]
+
+
+def changes(keys, joins, rows, update=False):
+    """
+    Sums of translated resource `rows` by the rollup `keys`.
+    For an `update`, the sums are of the differences between
+    the new and old stats, for the rows with changed stats.
+    Translated resources are never moved between resources or locales.
+    """
+    key_cols = ", ".join(f"{src} AS {key}" for key, src in keys.items())
+    group_by = ", ".join(keys.values())
+    if update:
+        count = "0"
+        sums = ", ".join(f"sum(tr.{s} - prev.{s}) AS {s}" for s in STATS)
+        prev = "JOIN old_rows AS prev ON prev.id = tr.id"
+        tr_stats = ", ".join(f"tr.{s}" for s in STATS)
+        prev_stats = ", ".join(f"prev.{s}" for s in STATS)
+        where = f"WHERE ({tr_stats}) IS DISTINCT FROM ({prev_stats})"
+    else:
+        count = "count(*)"
+        sums = ", ".join(f"sum(tr.{s}) AS {s}" for s in STATS)
+        prev = where = ""
+    return f"""(
+        SELECT {key_cols}, {count} AS translated_resources, {sums}
+        FROM {rows} AS tr {prev}
+        JOIN base_resource AS res ON res.id = tr.resource_id {joins}
+        {where}
+        GROUP BY {group_by}
+        ORDER BY {group_by}
+    )"""
+
+
+def add(table, keys, changed):
+    columns = ", ".join([*keys, "translated_resources", *STATS])
+    updates = ", ".join(
+        f"{col} = {table}.{col} + EXCLUDED.{col}"
+        for col in ["translated_resources", *STATS]
+    )
+    return f"""
+    INSERT INTO {table} ({columns})
+    SELECT {columns} FROM {changed} AS changed
+    ON CONFLICT ({", ".join(keys)}) DO UPDATE SET {updates};
+    """
+
+
+def lock(table, keys, changed):
+    """
+    Lock the rows of `table` matching the `changed` rows in key order,
+    before they are updated or deleted in the order of a join.
+    """
+    match = " AND ".join(f"s.{key} = changed.{key}" for key in keys)
+    order = ", ".join(f"s.{key}" for key in keys)
+    return f"""
+    PERFORM FROM {table} AS s JOIN {changed} AS changed ON {match}
+    ORDER BY {order} FOR UPDATE OF s;
+    """
+
+
+def remove(table, keys, changed):
+    match = " AND ".join(f"s.{key} = changed.{key}" for key in keys)
+    updates = ", ".join(
+        f"{col} = GREATEST(s.{col} - changed.{col}, 0)"
+        for col in ["translated_resources", *STATS]
+    )
+    return (
+        lock(table, keys, changed)
+        + f"""
+    DELETE FROM {table} AS s USING {changed} AS changed
+    WHERE {match} AND s.translated_resources <= changed.translated_resources;
+    UPDATE {table} AS s SET {updates} FROM {changed} AS changed WHERE {match};
+    """
+    )
+
+
+def adjust(table, keys, changed):
+    match = " AND ".join(f"s.{key} = changed.{key}" for key in keys)
+    updates = ", ".join(f"{s} = GREATEST(s.{s} + changed.{s}, 0)" for s in STATS)
+    return (
+        lock(table, keys, changed)
+        + f"""
+    UPDATE {table} AS s SET {updates} FROM {changed} AS changed WHERE {match};
+    """
+    )
+
+
+# When a project starts or stops being counted in LocaleStats,
+# its ProjectLocaleStats are added to or removed from them.
+PROJECT_CHANGES = """(
+    SELECT pls.locale_id, {sums}
+    FROM base_projectlocalestats AS pls
+    JOIN old_rows AS prev ON prev.id = pls.project_id
+    JOIN new_rows AS cur ON cur.id = prev.id
+    WHERE {condition}
+    GROUP BY pls.locale_id
+    ORDER BY pls.locale_id
+)"""
+
+
+def project_changes(condition):
+    sums = ", ".join(
+        f"sum(pls.{col}) AS {col}" for col in ["translated_resources", *STATS]
+    )
+    return PROJECT_CHANGES.format(sums=sums, condition=condition)
+
+
+TRIGGER_FUNCTION = """
+CREATE FUNCTION {name}() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    {body}
+    RETURN NULL;
+END;
+$$;
+"""
+
+CREATE_TRIGGERS = (
+    TRIGGER_FUNCTION.format(
+        name="base_stats_rollup_insert",
+        body="".join(
+            add(table, keys, changes(keys, joins, "new_rows"))
+            for table, keys, joins in ROLLUPS
+        ),
+    )
+    + TRIGGER_FUNCTION.format(
+        name="base_stats_rollup_delete",
+        body="".join(
+            remove(table, keys, changes(keys, joins, "old_rows"))
+            for table, keys, joins in ROLLUPS
+        ),
+    )
+    + TRIGGER_FUNCTION.format(
+        name="base_stats_rollup_update",
+        body="".join(
+            adjust(table, keys, changes(keys, joins, "new_rows", update=True))
+            for table, keys, joins in ROLLUPS
+        ),
+    )
+    + TRIGGER_FUNCTION.format(
+        name="base_stats_rollup_project_update",
+        body=remove(
+            "base_localestats",
+            ["locale_id"],
+            project_changes(
+                f"{COUNTED.format(p='prev')} AND NOT {COUNTED.format(p='cur')}"
+            ),
+        )
+        + add(
+            "base_localestats",
+            ["locale_id"],
+            project_changes(
+                f"NOT {COUNTED.format(p='prev')} AND {COUNTED.format(p='cur')}"
+            ),
+        ),
+    )
+    + """
+CREATE TRIGGER base_stats_rollup_insert
+AFTER INSERT ON base_translatedresource
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION base_stats_rollup_insert();
+
+CREATE TRIGGER base_stats_rollup_delete
+AFTER DELETE ON base_translatedresource
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION base_stats_rollup_delete();
+
+CREATE TRIGGER base_stats_rollup_update
+AFTER UPDATE ON base_translatedresource
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION base_stats_rollup_update();
+
+CREATE TRIGGER base_stats_rollup_project_update
+AFTER UPDATE ON base_project
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION base_stats_rollup_project_update();
+"""
+)
+
+# Run after the triggers are created, which locks the translated resources
+# and projects for writes until the end of the migration, so no changes are
+# missed or counted twice. Writes are blocked while all stats are recounted.
+FILL_ROLLUPS = "".join(
+    add(table, keys, changes(keys, joins, "base_translatedresource"))
+    for table, keys, joins in ROLLUPS
+)
+
+DROP_TRIGGERS = """
+DROP TRIGGER base_stats_rollup_insert ON base_translatedresource;
+DROP TRIGGER base_stats_rollup_delete ON base_translatedresource;
+DROP TRIGGER base_stats_rollup_update ON base_translatedresource;
+DROP TRIGGER base_stats_rollup_project_update ON base_project;
+DROP FUNCTION base_stats_rollup_insert();
+DROP FUNCTION base_stats_rollup_delete();
+DROP FUNCTION base_stats_rollup_update();
+DROP FUNCTION base_stats_rollup_project_update();
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("base", "0119_unique_tm_pagination_search"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LocaleStats",
+            fields=[
+                ("translated_resources", models.PositiveIntegerField(default=0)),
+                ("total_strings", models.PositiveIntegerField(default=0)),
+                ("approved_strings", models.PositiveIntegerField(default=0)),
+                ("pretranslated_strings", models.PositiveIntegerField(default=0)),
+                ("strings_with_errors", models.PositiveIntegerField(default=0)),
+                ("strings_with_warnings", models.PositiveIntegerField(default=0)),
+                ("unreviewed_strings", models.PositiveIntegerField(default=0)),
+                (
+                    "locale",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stats",
+                        serialize=False,
+                        to="base.locale",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="ProjectStats",
+            fields=[
+                ("translated_resources", models.PositiveIntegerField(default=0)),
+                ("total_strings", models.PositiveIntegerField(default=0)),
+                ("approved_strings", models.PositiveIntegerField(default=0)),
+                ("pretranslated_strings", models.PositiveIntegerField(default=0)),
+                ("strings_with_errors", models.PositiveIntegerField(default=0)),
+                ("strings_with_warnings", models.PositiveIntegerField(default=0)),
+                ("unreviewed_strings", models.PositiveIntegerField(default=0)),
+                (
+                    "project",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stats",
+                        serialize=False,
+                        to="base.project",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="ProjectLocaleStats",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("translated_resources", models.PositiveIntegerField(default=0)),
+                ("total_strings", models.PositiveIntegerField(default=0)),
+                ("approved_strings", models.PositiveIntegerField(default=0)),
+                ("pretranslated_strings", models.PositiveIntegerField(default=0)),
+                ("strings_with_errors", models.PositiveIntegerField(default=0)),
+                ("strings_with_warnings", models.PositiveIntegerField(default=0)),
+                ("unreviewed_strings", models.PositiveIntegerField(default=0)),
+                (
+                    "locale",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="project_locale_stats",
+                        to="base.locale",
+                    ),
+                ),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="project_locale_stats",
+                        to="base.project",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("project", "locale"),
+                        name="base_projectlocalestats_project_locale",
+                    )
+                ],
+            },
+        ),
+        migrations.RunSQL(
+            sql=CREATE_TRIGGERS + FILL_ROLLUPS,
+            reverse_sql=DROP_TRIGGERS,
+        ),
+    ]
@@ -9,9 +9,21 @@ from pontoon.base.models.project_locale import ProjectLocale
 from pontoon.base.models.repository import Repository, repository_url_validator
 from pontoon.base.models.resource import Resource
 from pontoon.base.models.section import Section
+from pontoon.base.models.stats_rollup import (
+    LocaleStats,
+    ProjectLocaleStats,
+    ProjectStats,
+)
 from pontoon.base.models.translated_resource import TranslatedResource
 from pontoon.base.models.translation import Translation
-from pontoon.base.models.translation_memory import TranslationMemoryEntry
+from pontoon.base.models.translation_memory import (
+    TranslationMemoryEntry,
+    UniqueTranslationMemoryEntry,
+)
+from pontoon.base.models.translation_memory_upload import (
+    TranslationMemoryUpload,
+    TranslationMemoryUploadChunk,
+)
 from pontoon.base.models.user import User
 from pontoon.base.models.user_banlog import UserBanLog
 from pontoon.base.models.user_profile import UserProfile
@@ -25,17 +37,23 @@ __all__ = [
     "ExternalResource",
     "Locale",
     "LocaleCodeHistory",
+    "LocaleStats",
     "PermissionChangelog",
     "Priority",
     "Project",
     "ProjectLocale",
+    "ProjectLocaleStats",
     "ProjectSlugHistory",
+    "ProjectStats",
     "Repository",
     "Resource",
     "Section",
     "TranslatedResource",
     "Translation",
     "TranslationMemoryEntry",
+    "TranslationMemoryUpload",
+    "TranslationMemoryUploadChunk",
+    "UniqueTranslationMemoryEntry",
     "User",
     "UserBanLog",
     "UserProfile",
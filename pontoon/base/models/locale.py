@@ -7,9 +7,8 @@ from django.conf import settings
 from django.contrib.auth.models import Group
 from django.core.exceptions import ValidationError
 from django.db import models
-from django.db.models import BooleanField, Case, F, Sum, Value, When
 
-from pontoon.base.aggregated_stats import AggregatedStats
+from pontoon.base.aggregated_stats import AggregatedStats, annotate_stats
 
 
 log = logging.getLogger(__name__)
@@ -78,53 +77,22 @@ class LocaleQuerySet(models.QuerySet):
 
     def stats_data(self, project=None, user=None):
         if project is not None:
-            query = self.filter(
-                translatedresources__resource__project=project,
-                translatedresources__resource__obsolete=False,
+            query = self.filter(project_locale_stats__project=project)
+            rollup = "project_locale_stats"
+        elif user is not None and not user.is_anonymous:
+            from pontoon.base.models.project import Project
+
+            visible_projects = Project.objects.visible_for(user).filter(
+                disabled=False,
+                system_project=False,
             )
+            query = self.filter(project_locale_stats__project__in=visible_projects)
+            rollup = "project_locale_stats"
         else:
-            if user is not None and not user.is_anonymous:
-                from pontoon.base.models.project import Project
+            query = self.filter(stats__isnull=False)
+            rollup = "stats"
 
-                visible_projects = Project.objects.visible_for(user).filter(
-                    disabled=False,
-                    system_project=False,
-                )
-                query = self.filter(
-                    translatedresources__resource__project__in=visible_projects,
-                    translatedresources__resource__obsolete=False,
-                )
-            else:
-                query = self.filter(
-                    translatedresources__resource__project__disabled=False,
-                    translatedresources__resource__project__system_project=False,
-                    translatedresources__resource__project__visibility="public",
-                    translatedresources__resource__obsolete=False,
-                )
-
-        return query.annotate(
-            total=Sum("translatedresources__total_strings", default=0),
-            approved=Sum("translatedresources__approved_strings", default=0),
-            pretranslated=Sum("translatedresources__pretranslated_strings", default=0),
-            errors=Sum("translatedresources__strings_with_errors", default=0),
-            warnings=Sum("translatedresources__strings_with_warnings", default=0),
-            unreviewed=Sum("translatedresources__unreviewed_strings", default=0),
-        ).annotate(
-            missing=F("total")
-            - F("approved")
-            - F("pretranslated")
-            - F("errors")
-            - F("warnings"),
-            completed=F("approved") + F("warnings"),
-            is_complete=Case(
-                When(
-                    total=F("approved") + F("warnings"),
-                    then=Value(True),
-                ),
-                default=Value(False),
-                output_field=BooleanField(),
-            ),
-        )
+        return annotate_stats(query, rollup)
 
     def stats_data_as_dict(self, project=None) -> dict[int, dict[str, int]]:
         """Mapping of locale `id` to dict with counts."""
@@ -145,14 +113,9 @@ class LocaleQuerySet(models.QuerySet):
 class Locale(models.Model, AggregatedStats):
     @property
     def aggregated_stats_query(self):
-        from pontoon.base.models.translated_resource import TranslatedResource
+        from pontoon.base.models.stats_rollup import LocaleStats
 
-        return TranslatedResource.objects.filter(
-            locale=self,
-            resource__project__disabled=False,
-            resource__project__system_project=False,
-            resource__project__visibility="public",
-        )
+        return LocaleStats.objects.filter(locale=self)
 
     code = models.CharField(max_length=20, unique=True)
 
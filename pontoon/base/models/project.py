@@ -6,11 +6,10 @@ from guardian.shortcuts import get_objects_for_user
 from django.conf import settings
 from django.contrib.auth.models import User
 from django.db import models
-from django.db.models import BooleanField, Case, F, Sum, Value, When
 from django.db.models.manager import BaseManager
 from django.utils import timezone
 
-from pontoon.base.aggregated_stats import AggregatedStats
+from pontoon.base.aggregated_stats import AggregatedStats, annotate_stats
 from pontoon.base.models.locale import Locale
 
 
@@ -77,34 +76,10 @@ class ProjectQuerySet(models.QuerySet):
         return self.force_syncable().filter(sync_disabled=False)
 
     def stats_data(self, locale=None):
-        query = (
-            self
-            if locale is None
-            else self.filter(resources__translatedresources__locale=locale)
-        )
-        tr = "resources__translatedresources"
-        return query.annotate(
-            total=Sum(f"{tr}__total_strings", default=0),
-            approved=Sum(f"{tr}__approved_strings", default=0),
-            pretranslated=Sum(f"{tr}__pretranslated_strings", default=0),
-            errors=Sum(f"{tr}__strings_with_errors", default=0),
-            warnings=Sum(f"{tr}__strings_with_warnings", default=0),
-            unreviewed=Sum(f"{tr}__unreviewed_strings", default=0),
-        ).annotate(
-            missing=F("total")
-            - F("approved")
-            - F("pretranslated")
-            - F("errors")
-            - F("warnings"),
-            completed=F("approved") + F("warnings"),
-            is_complete=Case(
-                When(
-                    total=F("approved") + F("warnings"),
-                    then=Value(True),
-                ),
-                default=Value(False),
-                output_field=BooleanField(),
-            ),
+        if locale is None:
+            return annotate_stats(self, "stats")
+        return annotate_stats(
+            self.filter(project_locale_stats__locale=locale), "project_locale_stats"
         )
 
     def stats_data_as_dict(self, locale=None) -> dict[int, dict[str, int]]:
@@ -126,9 +101,11 @@ class ProjectQuerySet(models.QuerySet):
 class Project(models.Model, AggregatedStats):
     @property
     def aggregated_stats_query(self):
-        from pontoon.base.models.translated_resource import TranslatedResource
+        from pontoon.base.models.stats_rollup import ProjectStats
 
-        return TranslatedResource.objects.filter(resource__project=self)
+        return ProjectStats.objects.filter(project=self).filter_projects(
+            count_disabled=True, count_system_projects=True
+        )
 
     name = models.CharField(max_length=128, unique=True)
     slug = models.SlugField(unique=True)
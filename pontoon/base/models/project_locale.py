@@ -1,8 +1,7 @@
 from django.contrib.auth.models import Group
 from django.db import models
-from django.db.models import BooleanField, Case, F, Sum, Value, When
 
-from pontoon.base.aggregated_stats import AggregatedStats
+from pontoon.base.aggregated_stats import AggregatedStats, annotate_stats
 from pontoon.base.models.locale import Locale
 from pontoon.base.models.project import Project
 
@@ -32,42 +31,18 @@ class ProjectLocaleQuerySet(models.QuerySet):
     def stats_data(self, project=None, locale=None, user=None):
         if project:
             query = self.filter(
-                locale__translatedresources__resource__project=project,
-                locale__translatedresources__resource__obsolete=False,
+                locale__project_locale_stats__project=project,
             ).prefetch_related("locale")
-            tr = "locale__translatedresources"
+            rollup = "locale__project_locale_stats"
         elif locale:
             query = self.filter(
-                project__resources__translatedresources__locale=locale,
+                project__project_locale_stats__locale=locale,
                 project__disabled=False,
                 project__system_project=False,
                 project__visibility="public",
-                project__resources__obsolete=False,
             ).prefetch_related("project")
-            tr = "project__resources__translatedresources"
-        return query.annotate(
-            total=Sum(f"{tr}__total_strings", default=0),
-            approved=Sum(f"{tr}__approved_strings", default=0),
-            pretranslated=Sum(f"{tr}__pretranslated_strings", default=0),
-            errors=Sum(f"{tr}__strings_with_errors", default=0),
-            warnings=Sum(f"{tr}__strings_with_warnings", default=0),
-            unreviewed=Sum(f"{tr}__unreviewed_strings", default=0),
-        ).annotate(
-            missing=F("total")
-            - F("approved")
-            - F("pretranslated")
-            - F("errors")
-            - F("warnings"),
-            completed=F("approved") + F("warnings"),
-            is_complete=Case(
-                When(
-                    total=F("approved") + F("warnings"),
-                    then=Value(True),
-                ),
-                default=Value(False),
-                output_field=BooleanField(),
-            ),
-        )
+            rollup = "project__project_locale_stats"
+        return annotate_stats(query, rollup)
 
 
 class ProjectLocale(models.Model, AggregatedStats):
@@ -75,11 +50,11 @@ class ProjectLocale(models.Model, AggregatedStats):
 
     @property
     def aggregated_stats_query(self):
-        from pontoon.base.models.translated_resource import TranslatedResource
+        from pontoon.base.models.stats_rollup import ProjectLocaleStats
 
-        return TranslatedResource.objects.filter(
-            locale=self.locale, resource__project=self.project
-        )
+        return ProjectLocaleStats.objects.filter(
+            locale=self.locale, project=self.project
+        ).filter_projects(count_disabled=True, count_system_projects=True)
 
     project = models.ForeignKey(Project, models.CASCADE, related_name="project_locale")
     locale = models.ForeignKey(Locale, models.CASCADE, related_name="project_locale")
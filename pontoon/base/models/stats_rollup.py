@@ -0,0 +1,115 @@
+from django.db import models
+from django.db.models import Sum
+
+from pontoon.base.models.locale import Locale
+from pontoon.base.models.project import Project
+from pontoon.base.models.user import User
+
+
+class StatsRollupQuerySet(models.QuerySet):
+    def string_stats(self) -> dict[str, int]:
+        return self.aggregate(
+            total=Sum("total_strings", default=0),
+            approved=Sum("approved_strings", default=0),
+            pretranslated=Sum("pretranslated_strings", default=0),
+            errors=Sum("strings_with_errors", default=0),
+            warnings=Sum("strings_with_warnings", default=0),
+            unreviewed=Sum("unreviewed_strings", default=0),
+        )
+
+
+class ProjectStatsRollupQuerySet(StatsRollupQuerySet):
+    def filter_projects(
+        self,
+        user: User | None = None,
+        *,
+        count_disabled: bool = False,
+        count_system_projects: bool = False,
+    ):
+        """
+        Leave out the rollups of disabled, system and private projects,
+        as `TranslatedResourceQuerySet.string_stats()` does.
+        """
+        query = self
+        if not count_disabled:
+            query = query.filter(project__disabled=False)
+        if not count_system_projects:
+            query = query.filter(project__system_project=False)
+        if user is None or not user.is_superuser:
+            query = query.filter(project__visibility="public")
+        return query
+
+
+class StatsRollup(models.Model):
+    """
+    Sums of the string counts of a set of TranslatedResource objects,
+    with the `translated_resources` count of the set.
+
+    Rows are only created, updated and deleted by database triggers on
+    the TranslatedResource and Project tables, added in migration 0120.
+    """
+
+    translated_resources = models.PositiveIntegerField(default=0)
+    total_strings = models.PositiveIntegerField(default=0)
+    approved_strings = models.PositiveIntegerField(default=0)
+    pretranslated_strings = models.PositiveIntegerField(default=0)
+    strings_with_errors = models.PositiveIntegerField(default=0)
+    strings_with_warnings = models.PositiveIntegerField(default=0)
+    unreviewed_strings = models.PositiveIntegerField(default=0)
+
+    objects = StatsRollupQuerySet.as_manager()
+
+    class Meta:
+        abstract = True
+
+    def stats_data(self) -> dict[str, int]:
+        return {
+            "total": self.total_strings,
+            "approved": self.approved_strings,
+            "pretranslated": self.pretranslated_strings,
+            "errors": self.strings_with_errors,
+            "warnings": self.strings_with_warnings,
+            "unreviewed": self.unreviewed_strings,
+        }
+
+
+class ProjectLocaleStats(StatsRollup):
+    """Stats of the translated resources of a project in a locale."""
+
+    project = models.ForeignKey(
+        Project, models.CASCADE, related_name="project_locale_stats"
+    )
+    locale = models.ForeignKey(
+        Locale, models.CASCADE, related_name="project_locale_stats"
+    )
+
+    objects = ProjectStatsRollupQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["project", "locale"],
+                name="base_projectlocalestats_project_locale",
+            ),
+        ]
+
+
+class ProjectStats(StatsRollup):
+    """Stats of all translated resources of a project."""
+
+    project = models.OneToOneField(
+        Project, models.CASCADE, primary_key=True, related_name="stats"
+    )
+
+    objects = ProjectStatsRollupQuerySet.as_manager()
+
+
+class LocaleStats(StatsRollup):
+    """
+    Stats of the translated resources of a locale
+    in enabled, public, non-system projects.
+    """
+
+    locale = models.OneToOneField(
+        Locale, models.CASCADE, primary_key=True, related_name="stats"
+    )
@@ -1,10 +1,14 @@
+from hashlib import md5
 from math import ceil, floor
 
 from rapidfuzz.distance.Indel import normalized_distance
 
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, GistIndex, OpClass
+from django.contrib.postgres.search import TrigramDistance
 from django.db import models
 from django.db.models import Case, ExpressionWrapper, F, Value, When
-from django.db.models.functions import Cast, Length, Substr
+from django.db.models.functions import MD5, Cast, Length, Substr, Upper
 
 from pontoon.base.models.entity import Entity
 from pontoon.base.models.locale import Locale
@@ -13,6 +17,24 @@ from pontoon.base.models.translation import Translation
 from pontoon.db import LevenshteinDistance
 
 
+def text_hash(text):
+    """
+    The hash of `text`, as stored in `source_hash` and `target_hash` columns.
+    """
+    return md5(text.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+def similar_length_range(text, min_quality):
+    """
+    The minimum and maximum length of a string
+    that may match `text` with a Levenshtein ratio of at least `min_quality`.
+    """
+    length = len(text)
+    min_dist = int(ceil(max(length * min_quality, 2)))
+    max_dist = int(floor(min(length / min_quality, 1000)))
+    return min_dist, max_dist
+
+
 class TranslationMemoryEntryQuerySet(models.QuerySet):
     def postgres_levenshtein_ratio(
         self, text, min_quality, min_dist, max_dist, levenshtein_param=None
@@ -123,19 +145,37 @@ class TranslationMemoryEntryQuerySet(models.QuerySet):
         )
         return entries
 
-    def minimum_levenshtein_ratio(self, text, min_quality=0.7):
+    def trigram_candidates(self, text, limit):
+        """
+        Limit entries to the `limit` ones with a source most similar to `text`,
+        as measured by the trigram distance of the `pg_trgm` module.
+
+        The nearest entries are found using the trigram index on `locale`
+        and `source`, so this is much cheaper than calculating the Levenshtein
+        distance for each entry of the locale.
+        """
+        nearest = self.order_by(TrigramDistance("source", text)).values("pk")
+        return self.filter(pk__in=nearest[:limit])
+
+    def minimum_levenshtein_ratio(self, text, min_quality=0.7, candidates=None):
         """
         Returns entries that match minimal levenshtein_ratio
+
+        Only the `candidates` entries most similar to `text` are scored,
+        by default `settings.TRANSLATION_MEMORY_CANDIDATES`.
+        If that is 0, all entries of a similar length are scored.
         """
         # Only check entities with similar length
-        length = len(text)
-        min_dist = int(ceil(max(length * min_quality, 2)))
-        max_dist = int(floor(min(length / min_quality, 1000)))
+        min_dist, max_dist = similar_length_range(text, min_quality)
 
-        get_matches = self.postgres_levenshtein_ratio
+        if candidates is None:
+            candidates = settings.TRANSLATION_MEMORY_CANDIDATES
+        entries = self.trigram_candidates(text, candidates) if candidates else self
+
+        get_matches = entries.postgres_levenshtein_ratio
 
         if min_dist > 255 or max_dist > 255:
-            get_matches = self.python_levenshtein_ratio
+            get_matches = entries.python_levenshtein_ratio
 
         return get_matches(
             text,
@@ -149,6 +189,10 @@ class TranslationMemoryEntry(models.Model):
     source = models.TextField()
     target = models.TextField()
 
+    # Indexable hashes of `source` and `target`, set by a database trigger.
+    source_hash = models.CharField(max_length=32, null=True, editable=False)
+    target_hash = models.CharField(max_length=32, null=True, editable=False)
+
     entity = models.ForeignKey(
         Entity, models.SET_NULL, null=True, related_name="memory_entries"
     )
@@ -161,3 +205,66 @@ class TranslationMemoryEntry(models.Model):
     )
 
     objects = TranslationMemoryEntryQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["locale", "source_hash"],
+                name="base_tm_locale_source_hash",
+            ),
+        ]
+
+
+class UniqueTranslationMemoryEntry(models.Model):
+    """
+    A unique (locale, source, target) combination of translation memory entries,
+    with the `count` of such entries.
+
+    Rows are only created, counted and deleted by database triggers on
+    the TranslationMemoryEntry table, added in migration 0116
+    and filled with the existing entries by migration 0117.
+    """
+
+    source = models.TextField()
+    target = models.TextField()
+    source_hash = models.GeneratedField(
+        expression=MD5("source"),
+        output_field=models.CharField(max_length=32),
+        db_persist=True,
+    )
+    target_hash = models.GeneratedField(
+        expression=MD5("target"),
+        output_field=models.CharField(max_length=32),
+        db_persist=True,
+    )
+    locale = models.ForeignKey(Locale, models.CASCADE, related_name="+")
+    count = models.PositiveIntegerField()
+
+    objects = TranslationMemoryEntryQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["locale", "source_hash", "target_hash"],
+                name="base_unique_tm_locale_source_target",
+            ),
+        ]
+        indexes = [
+            # Used by TranslationMemoryEntryQuerySet.trigram_candidates()
+            GistIndex(
+                fields=["locale", "source"],
+                name="base_unique_tm_locale_trgm",
+                opclasses=["gist_int4_ops", "gist_trgm_ops"],
+            ),
+            # Used for keyset pagination of the locale's entries by id
+            models.Index(fields=["locale", "id"], name="base_unique_tm_locale_id"),
+            # Used by case-insensitive `icontains` search, which matches UPPER(text)
+            GinIndex(
+                OpClass(Upper("source"), name="gin_trgm_ops"),
+                name="base_unique_tm_source_upper",
+            ),
+            GinIndex(
+                OpClass(Upper("target"), name="gin_trgm_ops"),
+                name="base_unique_tm_target_upper",
+            ),
+        ]
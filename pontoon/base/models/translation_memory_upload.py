@@ -0,0 +1,87 @@
+import io
+
+from collections.abc import Iterable
+from itertools import batched
+from typing import IO
+
+from django.db import models
+
+from pontoon.base.models.locale import Locale
+from pontoon.base.models.user import User
+
+
+# Size of the chunks an uploaded file is stored in, in bytes
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Number of chunks inserted or fetched with each query
+UPLOAD_CHUNK_BATCH_SIZE = 10
+
+
+class ChunkReader(io.RawIOBase):
+    """A readable binary stream of the concatenated `chunks`."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._chunk = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._chunk:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._chunk = memoryview(chunk)
+        size = min(len(buffer), len(self._chunk))
+        buffer[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        return size
+
+
+class TranslationMemoryUpload(models.Model):
+    """
+    An uploaded TMX file, stored in the database until it is imported
+    by a background task, which may not run on the same host as the upload.
+    """
+
+    locale = models.ForeignKey(Locale, models.CASCADE, related_name="+")
+    user = models.ForeignKey(User, models.CASCADE, related_name="+")
+    name = models.CharField(max_length=255)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.name
+
+    def write(self, chunks: Iterable[bytes]) -> None:
+        """Store the file content, in batches of chunks."""
+        for batch in batched(enumerate(chunks), UPLOAD_CHUNK_BATCH_SIZE):
+            TranslationMemoryUploadChunk.objects.bulk_create(
+                TranslationMemoryUploadChunk(upload=self, index=index, data=data)
+                for index, data in batch
+            )
+
+    def open(self) -> IO[bytes]:
+        """Read the file content, holding only a batch of chunks at a time."""
+        chunks = (
+            self.chunks.order_by("index")
+            .values_list("data", flat=True)
+            .iterator(chunk_size=UPLOAD_CHUNK_BATCH_SIZE)
+        )
+        return io.BufferedReader(ChunkReader(bytes(chunk) for chunk in chunks))
+
+
+class TranslationMemoryUploadChunk(models.Model):
+    upload = models.ForeignKey(
+        TranslationMemoryUpload, models.CASCADE, related_name="chunks"
+    )
+    index = models.PositiveIntegerField()
+    data = models.BinaryField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["upload", "index"],
+                name="base_tm_upload_chunk_index",
+            ),
+        ]
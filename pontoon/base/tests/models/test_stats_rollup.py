@@ -0,0 +1,152 @@
+"""
+Test that the stats rollups are maintained by the database triggers
+as translated resources are created, updated and deleted.
+"""
+
+import pytest
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from pontoon.base.models import (
+    LocaleStats,
+    ProjectLocaleStats,
+    ProjectStats,
+    TranslatedResource,
+)
+from pontoon.test.factories import ResourceFactory, TranslatedResourceFactory
+
+
+def stats(model, **filters):
+    return model.objects.filter(**filters).string_stats()
+
+
+@pytest.fixture
+def translated_resources(project_a, resource_a, locale_a, locale_b):
+    resource_b = ResourceFactory.create(project=project_a, path="resource_b.po")
+    return [
+        TranslatedResourceFactory.create(
+            resource=resource_a,
+            locale=locale_a,
+            total_strings=10,
+            approved_strings=5,
+            unreviewed_strings=1,
+        ),
+        TranslatedResourceFactory.create(
+            resource=resource_b,
+            locale=locale_a,
+            total_strings=4,
+            approved_strings=2,
+            strings_with_warnings=1,
+        ),
+        TranslatedResourceFactory.create(
+            resource=resource_a,
+            locale=locale_b,
+            total_strings=10,
+            pretranslated_strings=3,
+            strings_with_errors=2,
+        ),
+    ]
+
+
+@pytest.mark.django_db
+def test_rollups_insert(translated_resources, project_a, locale_a, locale_b):
+    assert stats(ProjectLocaleStats, project=project_a, locale=locale_a) == {
+        "total": 14,
+        "approved": 7,
+        "pretranslated": 0,
+        "errors": 0,
+        "warnings": 1,
+        "unreviewed": 1,
+    }
+    assert stats(ProjectStats, project=project_a) == {
+        "total": 24,
+        "approved": 7,
+        "pretranslated": 3,
+        "errors": 2,
+        "warnings": 1,
+        "unreviewed": 1,
+    }
+    assert stats(LocaleStats, locale=locale_b)["pretranslated"] == 3
+    assert ProjectLocaleStats.objects.get(locale=locale_a).translated_resources == 2
+
+
+@pytest.mark.django_db
+def test_rollups_update(translated_resources, project_a, locale_a):
+    tr = translated_resources[0]
+    tr.adjust_stats(
+        {
+            "approved": 0,
+            "pretranslated": 0,
+            "errors": 0,
+            "warnings": 0,
+            "unreviewed": 1,
+        },
+        {
+            "approved": 1,
+            "pretranslated": 0,
+            "errors": 0,
+            "warnings": 0,
+            "unreviewed": 0,
+        },
+        False,
+    )
+    TranslatedResource.objects.filter(pk=translated_resources[1].pk).update(
+        total_strings=6
+    )
+
+    assert stats(ProjectLocaleStats, project=project_a, locale=locale_a) == {
+        "total": 16,
+        "approved": 8,
+        "pretranslated": 0,
+        "errors": 0,
+        "warnings": 1,
+        "unreviewed": 0,
+    }
+    assert stats(ProjectStats, project=project_a)["total"] == 26
+    assert stats(LocaleStats, locale=locale_a)["approved"] == 8
+
+
+@pytest.mark.django_db
+def test_rollups_delete(translated_resources, project_a, locale_a, locale_b):
+    TranslatedResource.objects.filter(locale=locale_b).delete()
+
+    assert not ProjectLocaleStats.objects.filter(locale=locale_b).exists()
+    assert not LocaleStats.objects.filter(locale=locale_b).exists()
+    assert stats(ProjectStats, project=project_a)["total"] == 14
+
+    TranslatedResource.objects.all().delete()
+
+    assert not ProjectLocaleStats.objects.exists()
+    assert not ProjectStats.objects.exists()
+    assert not LocaleStats.objects.exists()
+
+
+@pytest.mark.django_db
+def test_rollups_project_disabled(translated_resources, project_a, locale_a):
+    project_a.disabled = True
+    project_a.save()
+
+    assert not LocaleStats.objects.filter(locale=locale_a).exists()
+    assert stats(ProjectStats, project=project_a)["total"] == 24
+
+    project_a.disabled = False
+    project_a.save()
+
+    assert stats(LocaleStats, locale=locale_a)["total"] == 14
+
+
+@pytest.mark.django_db
+def test_check_stats(translated_resources, project_a, locale_a):
+    call_command("check_stats")
+
+    ProjectLocaleStats.objects.filter(locale=locale_a).update(total_strings=1)
+    ProjectStats.objects.all().delete()
+
+    with pytest.raises(CommandError, match="Found 2 inconsistent stats rollups"):
+        call_command("check_stats")
+
+    call_command("check_stats", fix=True)
+    call_command("check_stats")
+    assert stats(ProjectLocaleStats, locale=locale_a)["total"] == 14
+    assert stats(ProjectStats, project=project_a)["total"] == 24
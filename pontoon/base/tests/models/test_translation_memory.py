@@ -0,0 +1,96 @@
+from importlib import import_module
+
+import pytest
+
+from django.db import connection
+
+from pontoon.base.models import TranslationMemoryEntry, UniqueTranslationMemoryEntry
+from pontoon.base.models.translation_memory import text_hash
+from pontoon.test.factories import TranslationMemoryFactory
+
+
+def test_minimum_levenshtein_ratio_candidates_sql(settings):
+    settings.TRANSLATION_MEMORY_CANDIDATES = 50
+    qs = TranslationMemoryEntry.objects.minimum_levenshtein_ratio("Hello world")
+    sql, params = qs.query.sql_with_params()
+    assert 'ORDER BY (U0."source" <-> %s) ASC LIMIT 50' in sql
+
+    settings.TRANSLATION_MEMORY_CANDIDATES = 0
+    qs = TranslationMemoryEntry.objects.minimum_levenshtein_ratio("Hello world")
+    sql, params = qs.query.sql_with_params()
+    assert "<->" not in sql
+
+
+@pytest.mark.django_db
+def test_minimum_levenshtein_ratio_candidates(locale_a):
+    for source in ["Hello world", "Hello worlds", "Hello, world!", "Goodbye"]:
+        TranslationMemoryFactory.create(source=source, locale=locale_a)
+
+    entries = TranslationMemoryEntry.objects.filter(locale=locale_a)
+    all_matches = entries.minimum_levenshtein_ratio("Hello world", candidates=0)
+    assert {tm.source for tm in all_matches} == {
+        "Hello world",
+        "Hello worlds",
+        "Hello, world!",
+    }
+
+    # Only the nearest entries by trigram distance are scored
+    nearest = entries.minimum_levenshtein_ratio("Hello world", candidates=2)
+    assert {tm.source for tm in nearest} == {"Hello world", "Hello worlds"}
+
+
+def unique_entries(locale):
+    return set(
+        UniqueTranslationMemoryEntry.objects.filter(locale=locale).values_list(
+            "source", "target", "count"
+        )
+    )
+
+
+@pytest.mark.django_db
+def test_unique_entries(locale_a, locale_b):
+    TranslationMemoryEntry.objects.bulk_create(
+        TranslationMemoryEntry(source=source, target=target, locale=locale_a)
+        for source, target in [("A", "a"), ("A", "a"), ("A", "b"), ("B", "b")]
+    )
+    assert unique_entries(locale_a) == {("A", "a", 2), ("A", "b", 1), ("B", "b", 1)}
+
+    tm = TranslationMemoryFactory.create(source="A", target="a", locale=locale_a)
+    assert unique_entries(locale_a) == {("A", "a", 3), ("A", "b", 1), ("B", "b", 1)}
+    tm.refresh_from_db()
+    assert tm.source_hash == text_hash("A")
+
+    # Only changes to the locale, source or target are counted
+    TranslationMemoryEntry.objects.filter(locale=locale_a).update(project=None)
+    assert unique_entries(locale_a) == {("A", "a", 3), ("A", "b", 1), ("B", "b", 1)}
+
+    TranslationMemoryEntry.objects.filter(source="B").update(target="a")
+    assert unique_entries(locale_a) == {("A", "a", 3), ("A", "b", 1), ("B", "a", 1)}
+
+    TranslationMemoryEntry.objects.filter(target="b").update(locale=locale_b)
+    assert unique_entries(locale_a) == {("A", "a", 3), ("B", "a", 1)}
+    assert unique_entries(locale_b) == {("A", "b", 1)}
+
+    tm.delete()
+    assert unique_entries(locale_a) == {("A", "a", 2), ("B", "a", 1)}
+
+    TranslationMemoryEntry.objects.filter(source="A").delete()
+    assert unique_entries(locale_a) == {("B", "a", 1)}
+
+
+@pytest.mark.django_db
+def test_unique_entries_fill_hashes(locale_a):
+    fill = import_module("pontoon.base.migrations.0117_unique_translation_memory_fill")
+    TranslationMemoryEntry.objects.bulk_create(
+        TranslationMemoryEntry(source=source, target="a", locale=locale_a)
+        for source in ["A", "A", "B"]
+    )
+
+    # Entries without hashes, as before the migration, are not counted
+    TranslationMemoryEntry.objects.filter(source="A").update(
+        source_hash=None, target_hash=None
+    )
+    assert unique_entries(locale_a) == {("B", "a", 1)}
+
+    fill.fill_hashes(None, connection.schema_editor())
+    assert unique_entries(locale_a) == {("A", "a", 2), ("B", "a", 1)}
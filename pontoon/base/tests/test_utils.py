@@ -1,3 +1,6 @@
+from io import BytesIO
+from zipfile import ZipFile
+
 import pytest
 
 from django.contrib.auth import get_user_model
@@ -7,6 +10,7 @@ from django.urls.exceptions import NoReverseMatch
 
 from pontoon.base.utils import (
     aware_datetime,
+    build_zip_file,
     get_m2m_changes,
     get_search_phrases,
     is_email,
@@ -600,3 +604,15 @@ def test_get_search_phrases(search_query, expected_results):
 def test_is_email():
     assert is_email("jane@doe.com") is True
     assert is_email("john@doe") is False
+
+
+def test_build_zip_file():
+    files = [("a/b.ftl", "b = B\n"), ("c.po", "é" * 10_000)]
+    chunks = list(build_zip_file(iter(files)))
+    assert len(chunks) == len(files) + 1
+
+    with ZipFile(BytesIO(b"".join(chunks))) as zipfile:
+        assert zipfile.namelist() == ["a/b.ftl", "c.po"]
+        assert zipfile.read("a/b.ftl") == b"b = B\n"
+        assert zipfile.read("c.po").decode() == "é" * 10_000
+        assert zipfile.getinfo("c.po").compress_size < 1000
@@ -2,8 +2,11 @@ import functools
 import re
 import time
 
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timedelta, timezone
+from io import RawIOBase
 from xml.sax.saxutils import escape, quoteattr
+from zipfile import ZIP_DEFLATED, ZipFile
 
 from guardian.decorators import permission_required as guardian_permission_required
 
@@ -202,6 +205,38 @@ def build_translation_memory_file(creation_date, locale_code, entries):
     yield ("\n\t</body>\n</tmx>\n")
 
 
+class _ZipStream(RawIOBase):
+    """A write-only stream, holding what is written to it until popped."""
+
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self.chunks.append(bytes(b))
+        return len(b)
+
+    def pop(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def build_zip_file(files: Iterable[tuple[str, str]]) -> Iterator[bytes]:
+    """
+    Yield a zip archive of `(path, content)` files in chunks,
+    one compressed file at a time, for a `StreamingHttpResponse`.
+    """
+    stream = _ZipStream()
+    with ZipFile(stream, "w", ZIP_DEFLATED) as zipfile:
+        for path, content in files:
+            zipfile.writestr(path, content)
+            yield stream.pop()
+    yield stream.pop()
+
+
 def get_m2m_changes(current_qs, new_qs):
     """
     Get difference between states of a many to many relation.
@@ -40,6 +40,7 @@ from pontoon.base.models import (
     Locale,
     Project,
     ProjectLocale,
+    ProjectLocaleStats,
     Resource,
     TranslatedResource,
     Translation,
@@ -105,7 +106,11 @@ def locale_projects(request, locale):
 def locale_stats(request, locale):
     """Get locale stats used in All Resources part."""
     locale = get_object_or_404(Locale, code=locale)
-    stats = TranslatedResource.objects.filter(locale=locale).string_stats(request.user)
+    stats = (
+        ProjectLocaleStats.objects.filter(locale=locale)
+        .filter_projects(request.user)
+        .string_stats()
+    )
     stats["title"] = "all-resources"
     return JsonResponse([stats], safe=False)
 
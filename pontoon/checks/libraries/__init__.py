@@ -7,6 +7,7 @@ from pontoon.base.simple_preview import get_simple_preview
 
 from . import compare_locales, translate_toolkit
 from .custom import run_custom_checks
+from .source import get_source
 
 
 def as_gettext(pattern: Pattern) -> str:
@@ -75,7 +76,7 @@ def run_checks(
             case (
                 Resource.Format.ANDROID | Resource.Format.XCODE | Resource.Format.XLIFF
             ):
-                src_msg = mf2_parse_message(entity.string)
+                src_msg = get_source(entity).mf2_message()
                 tgt_msg = mf2_parse_message(string)
                 src0 = get_simple_preview(res_format, src_msg)
                 if isinstance(src_msg, SelectMessage) and isinstance(
@@ -94,7 +95,7 @@ def run_checks(
                     tt_patterns.append((src0, get_simple_preview(res_format, tgt_msg)))
 
             case Resource.Format.GETTEXT:
-                src_msg = mf2_parse_message(entity.string)
+                src_msg = get_source(entity).mf2_message()
                 tgt_msg = mf2_parse_message(string)
                 if isinstance(src_msg, SelectMessage):
                     src0 = as_gettext(src_msg.variants[(CatchallKey(),)])
@@ -113,7 +114,7 @@ def run_checks(
                     )
 
             case Resource.Format.WEBEXT:
-                src_msg = mf2_parse_message(entity.string)
+                src_msg = get_source(entity).mf2_message()
                 tgt_msg = mf2_parse_message(string)
                 src_str, _ = webext_serialize_message(src_msg)
                 tgt_str, _ = webext_serialize_message(tgt_msg)
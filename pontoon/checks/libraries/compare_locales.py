@@ -10,6 +10,8 @@ from compare_locales.paths import File
 
 from pontoon.base.models.entity import Entity
 
+from .source import get_source
+
 
 CommentEntity = namedtuple("Comment", ("all",))
 
@@ -103,11 +105,9 @@ def cast_to_compare_locales(format: str, entity: Entity, string: str):
         )
 
     elif format == "fluent":
-        parser = FluentParser()
-
-        parser.readUnicode(entity.string)
-        (refEntity,) = list(parser)
+        refEntity = get_source(entity).compare_locales_fluent_entity
 
+        parser = FluentParser()
         parser.readUnicode(string)
         trEntity = list(parser)[0] if list(parser) else None
 
@@ -19,6 +19,8 @@ from moz.l10n.model import (
 from pontoon.base.models import Entity, Resource
 from pontoon.base.simple_preview import get_simple_preview, preview_placeholder
 
+from .source import get_source
+
 
 parser = FluentParser()
 
@@ -71,18 +73,10 @@ def run_custom_checks(entity: Entity, string: str) -> dict[str, list[str]]:
                 patterns = ()
                 errors.append(f"Parse error: {e}")
 
-            orig_pct_count = 0
-            orig_ph_strings: set[str] = set()
+            source = get_source(entity)
+            orig_ph_strings, orig_pct_count = source.android_placeholders
             try:
-                orig_msg = mf2_parse_message(entity.string)
-                for pattern in get_patterns(orig_msg):
-                    pattern_pct_count = 0
-                    for el in pattern:
-                        if isinstance(el, str):
-                            pattern_pct_count += el.count("%")
-                        elif not (isinstance(el, Expression) and el.arg in ("%", "\n")):
-                            orig_ph_strings.add(preview_placeholder(el))
-                    orig_pct_count = max(orig_pct_count, pattern_pct_count)
+                orig_msg = source.mf2_message()
             except ValueError:
                 orig_msg = None
 
@@ -134,7 +128,7 @@ def run_custom_checks(entity: Entity, string: str) -> dict[str, list[str]]:
 
             if isinstance(msg, SelectMessage):
                 try:
-                    orig_msg = mf2_parse_message(entity.string)
+                    orig_msg = get_source(entity).mf2_message()
                 except ValueError:
                     orig_msg = None
                 if not isinstance(orig_msg, SelectMessage):
@@ -147,7 +141,7 @@ def run_custom_checks(entity: Entity, string: str) -> dict[str, list[str]]:
 
         case Resource.Format.FLUENT:
             translation_ast = parser.parse_entry(string)
-            entity_ast = parser.parse_entry(entity.string)
+            entity_ast = get_source(entity).fluent_entry
 
             # Parse error
             if isinstance(translation_ast, ast.Junk):
@@ -177,7 +171,7 @@ def run_custom_checks(entity: Entity, string: str) -> dict[str, list[str]]:
                 errors.append(f"Parse error: {e}")
             if isinstance(msg, PatternMessage):
                 try:
-                    orig_msg = mf2_parse_message(entity.string)
+                    orig_msg = get_source(entity).mf2_message()
                     _, placeholders = webext_serialize_message(orig_msg)
                 except ValueError:
                     placeholders = None
@@ -0,0 +1,95 @@
+from functools import cached_property, lru_cache
+
+from compare_locales.parser.fluent import FluentParser as CLFluentParser
+from fluent.syntax import FluentParser, ast
+from moz.l10n.formats.mf2 import mf2_parse_message
+from moz.l10n.model import Expression, Message, PatternMessage
+
+from pontoon.base.models import Entity
+from pontoon.base.simple_preview import preview_placeholder
+
+
+# Maximum number of entity sources kept parsed by `get_source()`
+SOURCE_CACHE_SIZE = 10_000
+
+parser = FluentParser()
+
+
+class ParsedSource:
+    """
+    Parsed forms of an entity's source string, as used by checks.
+
+    Each is parsed when first needed.
+    """
+
+    def __init__(self, string: str) -> None:
+        self.string = string
+
+    @cached_property
+    def _mf2(self) -> Message | ValueError:
+        try:
+            return mf2_parse_message(self.string)
+        except ValueError as error:
+            return error
+
+    def mf2_message(self) -> Message:
+        """The source as a MessageFormat 2 message, or raises ValueError."""
+        msg = self._mf2
+        if isinstance(msg, ValueError):
+            raise ValueError(*msg.args)
+        return msg
+
+    @cached_property
+    def android_placeholders(self) -> tuple[frozenset[str], int]:
+        """
+        The placeholders of an Android source, as previewed,
+        and the largest count of `%` characters in any of its variants.
+        """
+        ph_strings: set[str] = set()
+        pct_count = 0
+        if isinstance(self._mf2, Message):
+            msg = self._mf2
+            patterns = (
+                (msg.pattern,)
+                if isinstance(msg, PatternMessage)
+                else msg.variants.values()
+            )
+            for pattern in patterns:
+                pattern_pct_count = 0
+                for el in pattern:
+                    if isinstance(el, str):
+                        pattern_pct_count += el.count("%")
+                    elif not (isinstance(el, Expression) and el.arg in ("%", "\n")):
+                        ph_strings.add(preview_placeholder(el))
+                pct_count = max(pct_count, pattern_pct_count)
+        return frozenset(ph_strings), pct_count
+
+    @cached_property
+    def fluent_entry(self) -> ast.EntryType:
+        """The source as a Fluent entry."""
+        return parser.parse_entry(self.string)
+
+    @cached_property
+    def compare_locales_fluent_entity(self):
+        """The source as a compare-locales Fluent entity."""
+        cl_parser = CLFluentParser()
+        cl_parser.readUnicode(self.string)
+        (entity,) = list(cl_parser)
+        return entity
+
+
+@lru_cache(maxsize=SOURCE_CACHE_SIZE)
+def _get_source(pk: int | None, string: str, format: str) -> ParsedSource:
+    return ParsedSource(string)
+
+
+def get_source(entity: Entity) -> ParsedSource:
+    """
+    The parsed source of `entity`, shared by all checks of its translations.
+
+    Sources are cached by entity, string and resource format,
+    so that checking many translations of the same entity,
+    e.g. in `bulk_run_checks()` or during pretranslation,
+    only parses its source once.
+    """
+    return _get_source(entity.pk, entity.string, entity.resource.format)
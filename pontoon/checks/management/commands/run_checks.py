@@ -1,13 +1,17 @@
+from contextlib import ExitStack
+
 from celery import (
     group,
     signature,
 )
 
 from django.core.management.base import BaseCommand
+from django.db import transaction
 
 from pontoon.base.models import Translation
 from pontoon.checks import DB_FORMATS
 from pontoon.checks.tasks import check_translations
+from pontoon.checks.utils import bulk_run_checks, checks_executor
 
 
 class Command(BaseCommand):
@@ -38,6 +42,24 @@ class Command(BaseCommand):
             help="Include obsolete entities",
         )
 
+        parser.add_argument(
+            "--workers",
+            action="store",
+            dest="workers",
+            type=int,
+            default=None,
+            help="Run checks in this process with a pool of worker processes, "
+            "rather than in Celery tasks",
+        )
+
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            dest="force",
+            default=False,
+            help="Also check translations that are unchanged since their last check",
+        )
+
     def handle(self, *args, **options):
         filter_qs = {}
 
@@ -53,9 +75,34 @@ class Command(BaseCommand):
             entity__resource__format__in=DB_FORMATS, **filter_qs
         ).values_list("pk", flat=True)
 
-        # Split translations into even batches and send them to Celery workers
         batch_size = int(options["batch_size"])
+        workers = options["workers"]
+        if workers is not None:
+            # The worker processes are started once, and reused for all batches
+            with ExitStack() as stack:
+                executor = (
+                    stack.enter_context(checks_executor(workers))
+                    if workers > 1
+                    else None
+                )
+                for i in range(0, len(translations_pks), batch_size):
+                    with transaction.atomic():
+                        bulk_run_checks(
+                            Translation.objects.for_checks().filter(
+                                pk__in=translations_pks[i : i + batch_size]
+                            ),
+                            workers=workers,
+                            force=options["force"],
+                            executor=executor,
+                        )
+            return
+
+        # Split translations into even batches and send them to Celery workers
         group(
-            signature(check_translations, args=(translations_pks[i : i + batch_size],))
+            signature(
+                check_translations,
+                args=(translations_pks[i : i + batch_size],),
+                kwargs={"force": options["force"]},
+            )
             for i in range(0, len(translations_pks), batch_size)
         ).apply_async()
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.14 on 2026-10-18 03:35
+
+import django.db.models.deletion
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("base", "0116_unique_translation_memory"),
+        ("checks", "0001_squashed_0004_auto_20200206_0932"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CheckFingerprint",
+            fields=[
+                (
+                    "translation",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="check_fingerprint",
+                        serialize=False,
+                        to="base.translation",
+                    ),
+                ),
+                ("fingerprint", models.CharField(max_length=32)),
+            ],
+        ),
+    ]
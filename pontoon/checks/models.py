@@ -44,3 +44,18 @@ class Error(FailedCheck):
 
     class Meta(FailedCheck.Meta):
         unique_together = (("translation", "library", "message"),)
+
+
+class CheckFingerprint(models.Model):
+    """
+    Fingerprint of the inputs of the checks last run on a translation
+    by `bulk_run_checks()`, which skips translations whose inputs are unchanged.
+    """
+
+    translation = models.OneToOneField(
+        Translation,
+        models.CASCADE,
+        primary_key=True,
+        related_name="check_fingerprint",
+    )
+    fingerprint = models.CharField(max_length=32)
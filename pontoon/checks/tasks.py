@@ -12,15 +12,16 @@ log = logging.getLogger(__name__)
 
 
 @shared_task(bind=True)
-def check_translations(self, translations_pks):
+def check_translations(self, translations_pks, force=False):
     """
     Run checks on translations
     :arg list[int] translations_pks: list of primary keys for translations that should be processed
+    :arg bool force: also check translations that are unchanged since their last check
     """
     with transaction.atomic():
         translations = Translation.objects.for_checks().filter(pk__in=translations_pks)
 
-        warnings, errors = bulk_run_checks(translations)
+        warnings, errors = bulk_run_checks(translations, force=force)
 
         log.info(
             "Task: {}, Processed items: {}, Warnings: {}, Errors: {}".format(
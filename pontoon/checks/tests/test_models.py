@@ -2,6 +2,7 @@ import pytest
 
 from pontoon.base.models import Resource, Translation
 from pontoon.checks.models import (
+    CheckFingerprint,
     Error,
     FailedCheck,
     Warning,
@@ -146,6 +147,61 @@ def test_bulk_run_checks(
     assert p_error.translation == translation_pontoon_error
 
 
+@pytest.mark.django_db
+def test_bulk_run_checks_unchanged(
+    translation_compare_locales_warning,
+    translation_pontoon_error,
+):
+    """
+    Skip translations that are unchanged since they were last checked
+    """
+    translations = [translation_compare_locales_warning, translation_pontoon_error]
+    (cl_warning,), (p_error,) = bulk_run_checks(translations)
+    assert CheckFingerprint.objects.count() == 2
+
+    assert bulk_run_checks(translations) == ([], [])
+    assert list(Warning.objects.all()) == [cl_warning]
+    assert list(Error.objects.all()) == [p_error]
+
+    # Unchanged failed checks are kept as they are
+    warnings, errors = bulk_run_checks(translations, force=True)
+    assert [w.pk for w in warnings] == [cl_warning.pk]
+    assert [e.pk for e in errors] == [p_error.pk]
+
+
+@pytest.mark.django_db
+def test_bulk_run_checks_changed(
+    translation_compare_locales_warning,
+    translation_pontoon_error,
+):
+    """
+    Only check translations that have changed since they were last checked
+    """
+    translations = [translation_compare_locales_warning, translation_pontoon_error]
+    (cl_warning,), (p_error,) = bulk_run_checks(translations)
+
+    translation_compare_locales_warning.string = "raise warning \\x"
+    translation_pontoon_error.string = "fixed"
+    warnings, errors = bulk_run_checks(translations)
+
+    (cl_warning_new,) = warnings
+    assert cl_warning_new.pk != cl_warning.pk
+    assert cl_warning_new.message == "unknown escape sequence, \\x"
+    assert errors == []
+    assert list(Warning.objects.all()) == [cl_warning_new]
+    assert not Error.objects.exists()
+
+
+@pytest.mark.django_db
+def test_save_failed_checks_resets_fingerprint(translation_pontoon_error):
+    bulk_run_checks([translation_pontoon_error])
+    save_failed_checks(translation_pontoon_error, {})
+    assert not CheckFingerprint.objects.exists()
+
+    (p_error,) = bulk_run_checks([translation_pontoon_error])[1]
+    assert p_error.message == "Empty translations are not allowed"
+
+
 @pytest.mark.django_db
 def test_get_failed_checks_db_objects(translation_a):
     """
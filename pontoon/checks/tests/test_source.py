@@ -0,0 +1,37 @@
+from unittest.mock import patch
+
+import pytest
+
+from moz.l10n.formats.mf2 import mf2_parse_message
+
+from pontoon.base.models import Entity, Resource
+from pontoon.checks.libraries import run_checks
+from pontoon.checks.libraries.source import get_source
+
+
+def test_source_parsed_once():
+    resource = Resource(path="strings.xml", format=Resource.Format.ANDROID)
+    entity = Entity(pk=-1, resource=resource, string="Hello %1$s")
+
+    with patch(
+        "pontoon.checks.libraries.source.mf2_parse_message",
+        wraps=mf2_parse_message,
+    ) as parse:
+        for string in ["Bonjour %1$s", "Bonjour", "Hallo %1$s"]:
+            run_checks(entity, "fr", string, use_tt_checks=True)
+        assert parse.call_count == 1
+
+        # A changed source string is parsed again
+        entity.string = "Hello %1$s!"
+        run_checks(entity, "fr", "Bonjour", use_tt_checks=False)
+        assert parse.call_count == 2
+
+
+def test_source_parse_error():
+    resource = Resource(path="messages.po", format=Resource.Format.GETTEXT)
+    entity = Entity(pk=-2, resource=resource, string="Hello {")
+    source = get_source(entity)
+    assert source is get_source(entity)
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            source.mf2_message()
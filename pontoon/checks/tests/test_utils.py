@@ -0,0 +1,75 @@
+import pytest
+
+from pontoon.base.models import Entity, Locale, Resource, Translation
+from pontoon.checks import utils
+from pontoon.checks.utils import bulk_get_failed_checks, get_check_fingerprints
+
+
+@pytest.fixture
+def translations():
+    properties = Resource(pk=1, path="a.properties", format=Resource.Format.PROPERTIES)
+    fluent = Resource(pk=2, path="b.ftl", format=Resource.Format.FLUENT)
+    dtd = Resource(pk=3, path="c.dtd", format=Resource.Format.DTD)
+    dtd_entities = [
+        Entity(pk=3, resource=dtd, key=["x"], string="X &brandName;", comment=""),
+        Entity(pk=4, resource=dtd, key=["y"], string="Y", comment=""),
+    ]
+    dtd._prefetched_objects_cache = {"entities": dtd_entities}
+    entities = [
+        Entity(pk=1, resource=properties, key=["a"], string="A %S", comment=""),
+        Entity(pk=2, resource=fluent, key=["b"], string="b = B { $n }\n", comment=""),
+        *dtd_entities,
+    ]
+    locale = Locale(code="fr")
+    strings = [
+        ["A", "A %S", ""],
+        ["b = B\n", "b = B { $n }\n", "b = { "],
+        ["X &brandName;", "X &unknown;", ""],
+        ["Y", "Y &amp", "Y"],
+    ]
+    return [
+        Translation(entity=entity, locale=locale, string=string)
+        for _ in range(5)
+        for entity, entity_strings in zip(entities, strings)
+        for string in entity_strings
+    ]
+
+
+def test_bulk_get_failed_checks_pool(monkeypatch, translations):
+    serial = bulk_get_failed_checks(translations, workers=0)
+    assert len(serial) == len(translations)
+    assert any(serial)
+    assert not all(serial)
+
+    monkeypatch.setattr(utils, "CHECKS_CHUNK_SIZE", 7)
+    assert bulk_get_failed_checks(translations, workers=2) == serial
+
+    with utils.checks_executor(2) as executor:
+        assert bulk_get_failed_checks(translations, executor=executor) == serial
+        assert bulk_get_failed_checks(translations, executor=executor) == serial
+
+
+def test_get_check_fingerprints(monkeypatch, translations):
+    fingerprints = get_check_fingerprints(translations)
+    inputs = {(t.entity.pk, t.string) for t in translations}
+    assert len(set(fingerprints)) == len(inputs)
+    assert get_check_fingerprints(translations) == fingerprints
+
+    # A change to a DTD reference entity changes its resource's fingerprints
+    dtd_entity = translations[6].entity
+    dtd_entity.resource._prefetched_objects_cache["entities"][1].string = "Z"
+    changed = [
+        fp != prev
+        for fp, prev in zip(get_check_fingerprints(translations), fingerprints)
+    ]
+    assert changed == [
+        translation.entity.resource.format == Resource.Format.DTD
+        for translation in translations
+    ]
+
+    monkeypatch.setattr(utils, "CHECKS_VERSION", utils.CHECKS_VERSION + 1)
+    utils.checks_version.cache_clear()
+    try:
+        assert not set(get_check_fingerprints(translations)) & set(fingerprints)
+    finally:
+        utils.checks_version.cache_clear()
@@ -1,40 +1,295 @@
+import logging
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from hashlib import md5
+from importlib.metadata import version
+from multiprocessing import current_process, get_context
+from typing import TYPE_CHECKING
+
+import django
+
+from django.conf import settings
+
 from pontoon.checks import DB_LIBRARIES
 
 
-def bulk_run_checks(translations):
+if TYPE_CHECKING:
+    from pontoon.base.models import Entity
+
+
+log = logging.getLogger(__name__)
+
+# Number of translations checked by a process pool worker at a time
+CHECKS_CHUNK_SIZE = 500
+
+# Increment when Pontoon's own checks change,
+# so that all translations are checked again by `bulk_run_checks()`.
+CHECKS_VERSION = 1
+
+EntitySnapshot = tuple[int, list[str], str, str, tuple]
+"""
+The pk, key, string and comment of an entity,
+and the pk, path, format and reference entities of its resource.
+"""
+
+
+def snapshot_entity(entity: "Entity", resources: dict[int, tuple]) -> EntitySnapshot:
     """
-    Run checks on a list of translations
+    A picklable snapshot of `entity` with only the data used by checks.
 
-    *Important*
-    To avoid performance problems, translations have to prefetch entities and locales objects.
+    Resource snapshots are shared via `resources`, by primary key,
+    so that each is only pickled once per chunk.
+    """
+    from pontoon.base.models import Resource
+
+    resource = resources.get(entity.resource_id)
+    if resource is None:
+        src = entity.resource
+        # compare-locales DTD checks use the other entities as references
+        references = (
+            [(ent.key, ent.string, ent.comment) for ent in src.entities.all()]
+            if src.format == Resource.Format.DTD
+            else []
+        )
+        resource = (src.pk, src.path, src.format, references)
+        resources[entity.resource_id] = resource
+    return (entity.pk, entity.key, entity.string, entity.comment, resource)
+
+
+def run_checks_chunk(
+    items: list[tuple[EntitySnapshot, str, str]],
+) -> list[dict[str, list[str]]]:
     """
+    Run checks on a chunk of (entity snapshot, locale code, string) items,
+    without database access.
+    """
+    from pontoon.base.models import Entity, Resource
     from pontoon.checks.libraries import run_checks
-    from pontoon.checks.models import Error, Warning
 
-    warnings, errors = [], []
-    if not translations:
-        return
+    resources: dict[int, Resource] = {}
+    entities: dict[int, Entity] = {}
+    results = []
+    for snapshot, locale_code, string in items:
+        entity = entities.get(snapshot[0])
+        if entity is None:
+            pk, key, ent_string, comment, (res_pk, path, format, refs) = snapshot
+            resource = resources.get(res_pk)
+            if resource is None:
+                resource = Resource(pk=res_pk, path=path, format=format)
+                resource._prefetched_objects_cache = {
+                    "entities": [
+                        Entity(key=ref_key, string=ref_string, comment=ref_comment)
+                        for ref_key, ref_string, ref_comment in refs
+                    ]
+                }
+                resources[res_pk] = resource
+            entity = Entity(
+                pk=pk, key=key, string=ent_string, comment=comment, resource=resource
+            )
+            entities[pk] = entity
+        results.append(run_checks(entity, locale_code, string, use_tt_checks=False))
+    return results
 
-    for translation in translations:
-        warnings_, errors_ = get_failed_checks_db_objects(
-            translation,
+
+def checks_executor(workers: int) -> ProcessPoolExecutor:
+    """
+    A pool of `workers` spawned processes for `bulk_get_failed_checks()`,
+    with Django set up in each of them.
+    """
+    return ProcessPoolExecutor(
+        workers,
+        mp_context=get_context("spawn"),
+        initializer=django.setup,
+    )
+
+
+def bulk_get_failed_checks(translations, workers=None, executor=None):
+    """
+    Run checks on a list of translations, without saving the results.
+
+    If `workers` (by default, `settings.CHECKS_WORKERS`) is greater than 1,
+    the checks are run in chunks by a pool of spawned worker processes,
+    which are given picklable snapshots of the entities.
+    A process pool cannot be started from a daemonic process,
+    such as a worker of Celery's default prefork pool,
+    in which case the checks are run serially.
+
+    An `executor` from `checks_executor()` may be given instead of `workers`,
+    to reuse its pool rather than start one, e.g. when checking many batches.
+
+    :return: list of failed checks for each translation
+    """
+    from pontoon.checks.libraries import run_checks
+
+    if executor is None:
+        if workers is None:
+            workers = settings.CHECKS_WORKERS
+        if workers > 1 and current_process().daemon:
+            log.warning("Running checks serially in a daemonic process")
+            workers = 0
+    serial = executor is None and workers < 2
+    if serial or len(translations) <= CHECKS_CHUNK_SIZE:
+        return [
             run_checks(
                 translation.entity,
                 translation.locale.code,
                 translation.string,
                 use_tt_checks=False,
-            ),
+            )
+            for translation in translations
+        ]
+
+    resources: dict[int, tuple] = {}
+    items = [
+        (
+            snapshot_entity(translation.entity, resources),
+            translation.locale.code,
+            translation.string,
         )
+        for translation in translations
+    ]
+    chunks = [
+        items[i : i + CHECKS_CHUNK_SIZE]
+        for i in range(0, len(items), CHECKS_CHUNK_SIZE)
+    ]
+    if executor is not None:
+        return [
+            failed_checks
+            for chunk_checks in executor.map(run_checks_chunk, chunks)
+            for failed_checks in chunk_checks
+        ]
+    with checks_executor(min(workers, len(chunks))) as executor:
+        return [
+            failed_checks
+            for chunk_checks in executor.map(run_checks_chunk, chunks)
+            for failed_checks in chunk_checks
+        ]
+
+
+@cache
+def checks_version() -> str:
+    """The version of Pontoon's checks and of the check libraries."""
+    libraries = ("compare-locales", "fluent.syntax", "moz.l10n")
+    return " ".join([str(CHECKS_VERSION), *(version(lib) for lib in libraries)])
+
+
+def get_check_fingerprints(translations) -> list[str]:
+    """
+    Fingerprints of the inputs of the checks of each translation:
+    the check versions, the locale, the entity and its resource,
+    and the translation string.
+    """
+    resources: dict[int, tuple] = {}
+    resource_hashes: dict[int, str] = {}
+    fingerprints = []
+    for translation in translations:
+        _, key, string, comment, resource = snapshot_entity(
+            translation.entity, resources
+        )
+        res_hash = resource_hashes.get(resource[0])
+        if res_hash is None:
+            res_hash = md5(repr(resource).encode(), usedforsecurity=False).hexdigest()
+            resource_hashes[resource[0]] = res_hash
+        inputs = (
+            checks_version(),
+            res_hash,
+            key,
+            string,
+            comment,
+            translation.locale.code,
+            translation.string,
+        )
+        fingerprints.append(
+            md5(repr(inputs).encode(), usedforsecurity=False).hexdigest()
+        )
+    return fingerprints
+
+
+def update_failed_checks(model, translations, failed_checks):
+    """
+    Replace the stored failed checks of `translations` with `failed_checks`,
+    only deleting and creating the rows that have changed.
+
+    :arg model: Warning or Error
+    :return: the stored failed checks, in the order of `failed_checks`
+    """
+    stored = {
+        (check.translation_id, check.library, check.message): check
+        for check in model.objects.filter(translation__in=translations)
+    }
+    result, created = [], []
+    for check in failed_checks:
+        existing = stored.pop(
+            (check.translation_id, check.library, check.message), None
+        )
+        if existing is None:
+            created.append(check)
+            result.append(check)
+        else:
+            existing.translation = check.translation
+            result.append(existing)
+
+    if stored:
+        model.objects.filter(pk__in=[check.pk for check in stored.values()]).delete()
+    model.objects.bulk_create(created)
+    return result
+
+
+def bulk_run_checks(translations, workers=None, force=False, executor=None):
+    """
+    Run checks on a list of translations
+
+    Translations are skipped if their fingerprint matches the one stored
+    when they were last checked, unless `force` is set.
+    `workers` and `executor` are passed on to `bulk_get_failed_checks()`.
+
+    *Important*
+    To avoid performance problems, translations have to prefetch entities and locales objects.
+
+    :return: the failed checks of the checked translations, as (warnings, errors)
+    """
+    from pontoon.checks.models import CheckFingerprint, Error, Warning
+
+    warnings, errors = [], []
+    if not translations:
+        return
+
+    translations = list(translations)
+    fingerprints = dict(
+        zip((t.pk for t in translations), get_check_fingerprints(translations))
+    )
+    if not force:
+        stored = dict(
+            CheckFingerprint.objects.filter(translation__in=fingerprints).values_list(
+                "translation", "fingerprint"
+            )
+        )
+        translations = [
+            t for t in translations if stored.get(t.pk) != fingerprints[t.pk]
+        ]
+        if not translations:
+            return warnings, errors
+
+    for translation, failed_checks in zip(
+        translations, bulk_get_failed_checks(translations, workers, executor)
+    ):
+        warnings_, errors_ = get_failed_checks_db_objects(translation, failed_checks)
         warnings.extend(warnings_)
         errors.extend(errors_)
 
-    # Remove old warnings and errors
-    Warning.objects.filter(translation__pk__in=[t.pk for t in translations]).delete()
-    Error.objects.filter(translation__pk__in=[t.pk for t in translations]).delete()
+    warnings = update_failed_checks(Warning, translations, warnings)
+    errors = update_failed_checks(Error, translations, errors)
 
-    # Insert new warnings and errors
-    Warning.objects.bulk_create(warnings)
-    Error.objects.bulk_create(errors)
+    CheckFingerprint.objects.bulk_create(
+        [
+            CheckFingerprint(translation=t, fingerprint=fingerprints[t.pk])
+            for t in translations
+        ],
+        update_conflicts=True,
+        unique_fields=["translation"],
+        update_fields=["fingerprint"],
+    )
 
     return warnings, errors
 
@@ -80,11 +335,16 @@ def save_failed_checks(translation, failed_checks):
     :arg Translation translation: instance of translation
     :arg dict failed_checks: dictionary with failed checks
     """
+    from pontoon.checks.models import CheckFingerprint
+
     warnings, errors = get_failed_checks_db_objects(translation, failed_checks)
 
     translation.warnings.all().delete()
     translation.errors.all().delete()
 
+    # These may not match the checks of the last `bulk_run_checks()`
+    CheckFingerprint.objects.filter(translation=translation).delete()
+
     translation.warnings.bulk_create(warnings)
     translation.errors.bulk_create(errors)
 
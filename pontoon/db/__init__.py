@@ -1,4 +1,6 @@
-from django.db.models import Func
+from collections.abc import Iterable, Sequence
+
+from django.db.models import BooleanField, Expression, F, Func
 from django.db.models.lookups import (
     Field,
     IContains,
@@ -19,6 +21,44 @@ class LevenshteinDistance(Func):
         super().__init__(expr1, expr2, insertion_cost, deletion_cost, substitution_cost)
 
 
+class UnnestIn(Expression):
+    """
+    Filter for rows in which the tuple of `fields` matches any of `values`.
+
+    E.g. Translation.objects.filter(UnnestIn(("entity", "locale"), [(1, 2), (3, 4)]))
+
+    Rather than an OR of per-tuple conditions, this compares the fields with
+    the rows of `unnest()` over one array parameter per field, so the size of
+    the query does not depend on the number of values.
+    """
+
+    output_field = BooleanField()
+
+    def __init__(self, fields: Sequence[str], values: Iterable[Sequence]):
+        super().__init__()
+        self.fields = [F(field) for field in fields]
+        self.arrays = [list(column) for column in zip(*values)] or [[] for _ in fields]
+
+    def get_source_expressions(self):
+        return self.fields
+
+    def set_source_expressions(self, exprs):
+        self.fields = exprs
+
+    def as_sql(self, compiler, connection):
+        columns: list[str] = []
+        arrays: list[str] = []
+        params: list = []
+        for expr in self.fields:
+            sql, expr_params = compiler.compile(expr)
+            columns.append(sql)
+            arrays.append(f"%s::{expr.output_field.cast_db_type(connection)}[]")
+            params.extend(expr_params)
+        params.extend(self.arrays)
+        sql = f"({', '.join(columns)}) IN (SELECT * FROM unnest({', '.join(arrays)}))"
+        return sql, params
+
+
 class IContainsCollate(IContains):
     """
     Searching for translations may produce invalid results if you don't specify a correct
@@ -0,0 +1,49 @@
+import pytest
+
+from pontoon.base.models import Translation
+from pontoon.base.tests import TranslationFactory
+from pontoon.db import UnnestIn
+
+
+def test_unnest_in_sql():
+    """The size of the query does not depend on the number of values."""
+    values = [(i, i + 1) for i in range(1000)]
+    qs = Translation.objects.filter(UnnestIn(("entity", "locale"), values))
+    sql, params = qs.query.sql_with_params()
+    assert (
+        '("base_translation"."entity_id", "base_translation"."locale_id") IN '
+        "(SELECT * FROM unnest(%s::integer[], %s::integer[]))"
+    ) in sql
+    assert params == (list(range(1000)), list(range(1, 1001)))
+
+
+def test_unnest_in_sql_join():
+    qs = Translation.objects.filter(
+        UnnestIn(("entity__resource__path", "locale__code"), [("a.po", "fr")])
+    )
+    sql, params = qs.query.sql_with_params()
+    assert (
+        '("base_resource"."path", "base_locale"."code") IN '
+        "(SELECT * FROM unnest(%s::text[], %s::varchar(20)[]))"
+    ) in sql
+    assert params == (["a.po"], ["fr"])
+
+
+@pytest.mark.django_db
+def test_unnest_in_filter():
+    tx_a = TranslationFactory.create(string="A")
+    tx_b = TranslationFactory.create(string="B")
+    TranslationFactory.create(string="C")
+
+    pairs = [(tx_a.entity_id, tx_a.locale_id), (tx_b.entity_id, tx_b.locale_id)]
+    qs = Translation.objects.filter(UnnestIn(("entity", "locale"), pairs))
+    assert set(qs) == {tx_a, tx_b}
+
+    triples = [
+        (tx_a.entity_id, tx_a.locale_id, "A"),
+        (tx_b.entity_id, tx_b.locale_id, "not B"),
+    ]
+    qs = Translation.objects.filter(UnnestIn(("entity", "locale", "string"), triples))
+    assert list(qs) == [tx_a]
+
+    assert not Translation.objects.filter(UnnestIn(("entity", "locale"), [])).exists()
@@ -10,6 +10,7 @@ from pontoon.base.models import (
     Locale,
     Project,
     ProjectLocale,
+    ProjectLocaleStats,
     TranslatedResource,
 )
 from pontoon.base.services import get_locale_or_redirect, get_project_or_redirect
@@ -45,7 +46,11 @@ def localization(request, code, slug):
         {
             "locale": locale,
             "project": project,
-            "project_locale_stats": trans_res.string_stats(count_system_projects=True),
+            "project_locale_stats": ProjectLocaleStats.objects.filter(
+                locale=locale, project=project
+            )
+            .filter_projects(count_system_projects=True)
+            .string_stats(),
             "resource_count": trans_res.filter(resource__entities__obsolete=False)
             .distinct()
             .count(),
@@ -0,0 +1,92 @@
+from urllib.parse import parse_qs
+
+import pytest
+import requests_mock
+
+from django.core.cache import cache
+
+from pontoon.base.models import Locale
+from pontoon.machinery import utils
+from pontoon.machinery.utils import (
+    get_google_translate_batch,
+    get_translation_memory_batch,
+    get_translation_memory_data,
+)
+from pontoon.test.factories import TranslationMemoryFactory
+
+
+URL = "https://translation.googleapis.com/language/translate/v2"
+
+
+@pytest.fixture
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def request_texts(request):
+    # Single texts are sent in the query, multiple ones in the body
+    return parse_qs(request.text or request.query)["q"]
+
+
+def mock_translations(request, context):
+    texts = request_texts(request)
+    return {"data": {"translations": [{"translatedText": t.upper()} for t in texts]}}
+
+
+def test_google_translate_batch(clear_cache, google_translate_api_key, monkeypatch):
+    monkeypatch.setattr(utils, "GOOGLE_TRANSLATE_BATCH_SIZE", 2)
+    locale = Locale(code="fr", google_translate_code="fr")
+    texts = ["one", "two", "three"]
+
+    with requests_mock.mock() as m:
+        m.post(URL, json=mock_translations)
+        assert get_google_translate_batch(texts, locale) == {
+            "one": "ONE",
+            "two": "TWO",
+            "three": "THREE",
+        }
+        assert m.call_count == 2
+
+        # Cached translations are not requested again
+        assert get_google_translate_batch(["two", "four"], locale) == {
+            "two": "TWO",
+            "four": "FOUR",
+        }
+        assert m.call_count == 3
+        assert request_texts(m.last_request) == ["four"]
+
+
+def test_google_translate_batch_error(clear_cache, google_translate_api_key):
+    locale = Locale(code="fr", google_translate_code="fr")
+    with requests_mock.mock() as m:
+        m.post(URL, status_code=500)
+        assert get_google_translate_batch(["one", "two"], locale) == {}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("candidates", [0, 200])
+def test_translation_memory_batch(
+    django_assert_num_queries, locale_a, settings, candidates
+):
+    settings.TRANSLATION_MEMORY_CANDIDATES = candidates
+    entries = [
+        TranslationMemoryFactory.create(source=f"Source string {i}", locale=locale_a)
+        for i in range(10)
+    ]
+    strings = [(f"Source string {i}", entries[i].entity.pk) for i in range(10)]
+    strings += [("Source strings", None), ("no match", None)]
+
+    # The number of queries does not depend on the number of strings
+    with django_assert_num_queries(1):
+        assert get_translation_memory_batch(strings[-2:-1], locale_a)
+    with django_assert_num_queries(2):
+        assert get_translation_memory_batch(strings[:1], locale_a)
+    with django_assert_num_queries(2):
+        results = get_translation_memory_batch(strings, locale_a)
+
+    assert len(results) == len(strings)
+    assert results[-1] == []
+    for (text, pk), result in zip(strings, results):
+        assert result == get_translation_memory_data(text, locale_a, pk)
@@ -8,6 +8,7 @@ import requests
 import requests_mock
 
 from django.core.cache import cache
+from django.test import Client
 from django.urls import reverse
 
 from pontoon.base.models import (
@@ -322,7 +323,7 @@ def test_view_gpt_transform_cache(member, locale_a, openai_api_key):
 
 
 @pytest.mark.django_db
-def test_view_gpt_transform_context(member, locale_a, openai_api_key):
+def test_view_gpt_transform_context(member, locale_a, openai_api_key, term_matcher):
     url = reverse("pontoon.gpt_transform")
     cache.clear()
 
@@ -593,6 +594,74 @@ def test_view_tm_minimal_quality(client, locale_a, resource_a):
     assert json.loads(response.content) == []
 
 
+@pytest.mark.django_db
+def test_view_translation_memory_batch(client, locale_a, resource_a):
+    """
+    Batch lookups return the same results as single ones, in request order.
+    """
+    entities = [
+        EntityFactory(resource=resource_a, string=x, order=i)
+        for i, x in enumerate(["abaa", "abaa", "aaab", "aaab"])
+    ]
+    for entity in entities:
+        TranslationMemoryFactory.create(
+            entity=entity, source=entity.string, target="ccc", locale=locale_a
+        )
+    strings = [
+        {"text": "aaaa", "pk": entities[0].pk},
+        {"text": "no match"},
+        {"text": "aaab"},
+    ]
+    response = client.post(
+        reverse("pontoon.translation_memory_batch"),
+        {"locale": locale_a.code, "strings": strings},
+        content_type="application/json",
+    )
+    assert response.status_code == 200
+    result = json.loads(response.content)
+    assert result[0][0].pop("source") in ("abaa", "aaab")
+    assert result == [
+        [{"count": 3, "quality": "75", "target": "ccc"}],
+        [],
+        [{"count": 4, "quality": "100", "source": "aaab", "target": "ccc"}],
+    ]
+
+    single = client.get(
+        "/translation-memory/", {"text": "aaab", "locale": locale_a.code}
+    )
+    assert json.loads(single.content) == result[2]
+
+
+@pytest.mark.django_db
+def test_view_translation_memory_batch_bad_request(client, locale_a):
+    url = reverse("pontoon.translation_memory_batch")
+    for body in [
+        {"strings": [{"text": "aaa"}]},
+        {"locale": "missing", "strings": [{"text": "aaa"}]},
+        {"locale": locale_a.code, "strings": [{"pk": 1}]},
+        {"locale": locale_a.code, "strings": [{"text": "aaa", "pk": "x"}]},
+        {"locale": locale_a.code, "strings": ["aaa"]},
+    ]:
+        response = client.post(url, body, content_type="application/json")
+        assert response.status_code == 400
+
+    response = client.get(url, {"locale": locale_a.code})
+    assert response.status_code == 405
+
+
+@pytest.mark.django_db
+def test_view_translation_memory_batch_no_csrf(locale_a):
+    """The batch lookup is read-only, and available without a CSRF token."""
+    client = Client(enforce_csrf_checks=True)
+    response = client.post(
+        reverse("pontoon.translation_memory_batch"),
+        {"locale": locale_a.code, "strings": [{"text": "aaa"}]},
+        content_type="application/json",
+    )
+    assert response.status_code == 200
+    assert json.loads(response.content) == [[]]
+
+
 @pytest.mark.django_db
 def test_view_concordance_search(client, project_a, locale_a, resource_a):
     entities = [
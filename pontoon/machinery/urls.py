@@ -10,6 +10,11 @@ urlpatterns = [
         views.translation_memory,
         name="pontoon.translation_memory",
     ),
+    path(
+        "translation-memory/batch/",
+        views.translation_memory_batch,
+        name="pontoon.translation_memory_batch",
+    ),
     path(
         "concordance-search/",
         views.concordance_search,
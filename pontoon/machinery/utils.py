@@ -4,7 +4,9 @@ import logging
 import operator
 import os
 
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from decimal import Decimal
 from functools import reduce
 from html import unescape
 
@@ -21,10 +23,18 @@ from django.conf import settings
 from django.contrib.postgres.aggregates import ArrayAgg, JSONBAgg
 from django.core.cache import cache
 from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
 from django.db.models import Q
 from django.db.models.functions import JSONObject
 
-from pontoon.base.models import Locale, Project, ProjectLocale, TranslationMemoryEntry
+from pontoon.base.models import (
+    Locale,
+    Project,
+    ProjectLocale,
+    TranslationMemoryEntry,
+    UniqueTranslationMemoryEntry,
+)
+from pontoon.base.models.translation_memory import similar_length_range
 from pontoon.base.placeables import get_placeables
 from pontoon.base.utils import get_search_phrases
 
@@ -32,6 +42,13 @@ from pontoon.base.utils import get_search_phrases
 log = logging.getLogger(__name__)
 MAX_RESULTS = 5
 
+# Maximum number of strings in a single batched translation memory lookup
+TRANSLATION_MEMORY_BATCH_SIZE = 1000
+
+# Limits for a single batched machine translation request
+GOOGLE_TRANSLATE_BATCH_SIZE = 100
+GOOGLE_TRANSLATE_BATCH_LENGTH = 20_000
+
 
 def get_machinery_service_cache_key(service, *parts):
     digest = hashlib.md5(":".join(str(p) for p in parts).encode()).hexdigest()
@@ -62,6 +79,12 @@ def get_google_generic_translation(text, locale_code, format="text"):
     if cached is not None:
         return cached
 
+    translation = request_google_generic_translations([text], locale_code, format)[0]
+    set_machinery_service_cache_key(cache_key, translation)
+    return translation
+
+
+def request_google_generic_translations(texts, locale_code, format="text"):
     api_key = settings.GOOGLE_TRANSLATE_API_KEY
 
     if not api_key:
@@ -70,23 +93,28 @@ def get_google_generic_translation(text, locale_code, format="text"):
     url = "https://translation.googleapis.com/language/translate/v2"
 
     payload = {
-        "q": text,
+        "q": texts[0] if len(texts) == 1 else texts,
         "source": "en",
         "target": locale_code,
         "format": format,
         "key": api_key,
     }
 
-    r = requests.post(url, params=payload)
+    # Multiple texts are sent in the request body, to avoid URL length limits.
+    if len(texts) == 1:
+        r = requests.post(url, params=payload)
+    else:
+        r = requests.post(url, data=payload)
     r.raise_for_status()
     root = json.loads(r.content)
 
     if "data" not in root:
         raise ValueError(f"Google Translate error: {root}")
 
-    translation = root["data"]["translations"][0]["translatedText"]
-    set_machinery_service_cache_key(cache_key, translation)
-    return translation
+    translations = [tx["translatedText"] for tx in root["data"]["translations"]]
+    if len(translations) != len(texts):
+        raise ValueError(f"Google Translate error: {root}")
+    return translations
 
 
 def get_google_automl_translation(
@@ -103,6 +131,16 @@ def get_google_automl_translation(
     if cached is not None:
         return cached
 
+    translation = request_google_automl_translations(
+        [text], locale, format, preserve_placeables
+    )[0]
+    set_machinery_service_cache_key(cache_key, translation)
+    return translation
+
+
+def request_google_automl_translations(
+    texts, locale, format="text", preserve_placeables=False
+):
     try:
         client = translate.TranslationServiceClient()
     except DefaultCredentialsError as e:
@@ -123,7 +161,7 @@ def get_google_automl_translation(
     model_path = f"{parent}/models/{model_id}"
 
     request_params = {
-        "contents": [text],
+        "contents": texts,
         "target_language_code": locale.google_translate_code,
         "model": model_path,
         "source_language_code": "en",
@@ -132,7 +170,9 @@ def get_google_automl_translation(
     }
 
     if preserve_placeables:
-        use_placeables_glossary(text, client, project_id, location, request_params)
+        use_placeables_glossary(
+            "\n".join(texts), client, project_id, location, request_params
+        )
 
     # Get translations
     response = client.translate_text(request=request_params)
@@ -143,10 +183,89 @@ def get_google_automl_translation(
 
     if len(translations) == 0:
         raise ValueError("No translations found.")
+    if len(translations) != len(texts):
+        raise ValueError(
+            f"Expected {len(texts)} translations, got {len(translations)}."
+        )
 
-    translation = translations[0].translated_text
-    set_machinery_service_cache_key(cache_key, translation)
-    return translation
+    return [translation.translated_text for translation in translations]
+
+
+def get_google_translate_batch(texts, locale, preserve_placeables=False):
+    """
+    Get Google translations for all of `texts`, using cached values if available.
+
+    Uncached texts are sent in batches of up to `GOOGLE_TRANSLATE_BATCH_SIZE`,
+    with up to `settings.MACHINERY_BATCH_WORKERS` concurrent requests.
+
+    :returns: A dict of text -> translation.
+      Texts for which a request failed are not included.
+    """
+    if locale.google_automl_model:
+
+        def cache_key(text):
+            return get_machinery_service_cache_key(
+                "google_automl", text, locale.code, "text", preserve_placeables
+            )
+
+        def request(batch):
+            return request_google_automl_translations(
+                batch, locale, preserve_placeables=preserve_placeables
+            )
+    else:
+
+        def cache_key(text):
+            return get_machinery_service_cache_key(
+                "google_generic", text, locale.google_translate_code, "text"
+            )
+
+        def request(batch):
+            return request_google_generic_translations(
+                batch, locale.google_translate_code
+            )
+
+    keys = {cache_key(text): text for text in texts}
+    cached = cache.get_many(keys.keys())
+    translations = {keys[key]: value for key, value in cached.items()}
+
+    batches = []
+    batch = []
+    batch_length = 0
+    for key, text in keys.items():
+        if key in cached:
+            continue
+        if batch and (
+            len(batch) == GOOGLE_TRANSLATE_BATCH_SIZE
+            or batch_length + len(text) > GOOGLE_TRANSLATE_BATCH_LENGTH
+        ):
+            batches.append(batch)
+            batch = []
+            batch_length = 0
+        batch.append(text)
+        batch_length += len(text)
+    if batch:
+        batches.append(batch)
+
+    workers = max(1, min(settings.MACHINERY_BATCH_WORKERS, len(batches)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(request, batch): batch for batch in batches}
+        for future in as_completed(futures):
+            batch = futures[future]
+            try:
+                batch_translations = future.result()
+            except Exception as e:
+                log.error(
+                    f"Google Translate batch of {len(batch)} for {locale.code} failed: {e}"
+                )
+                continue
+            new_values = dict(zip(batch, batch_translations))
+            translations.update(new_values)
+            cache.set_many(
+                {cache_key(text): value for text, value in new_values.items()},
+                settings.MACHINERY_SERVICE_CACHE_TIMEOUT,
+            )
+
+    return translations
 
 
 def get_microsoft_translator_data(text, locale_code):
@@ -322,29 +441,158 @@ def get_concordance_search_data(user, text, locale):
     return sorted(search_results, key=sort_by_quality, reverse=True)
 
 
-def get_translation_memory_data(text, locale, pk=None):
-    entries = TranslationMemoryEntry.objects.filter(
-        locale=locale
-    ).minimum_levenshtein_ratio(text)
-
-    # Exclude existing entity
-    if pk:
-        entries = entries.exclude(entity__pk=pk)
-
-    entries = entries.values("source", "target", "quality")
+def merge_translation_memory_entries(entries):
+    """
+    Group unique entries with the same target and add up their counts,
+    returning the best `MAX_RESULTS` ones.
+    """
     entries_merged = defaultdict(lambda: {"count": 0, "quality": 0})
 
-    # Group entries with the same target and count them
     for entry in entries:
         if (
             entry["target"] not in entries_merged
             or entry["quality"] > entries_merged[entry["target"]]["quality"]
         ):
-            entries_merged[entry["target"]].update(entry)
-        entries_merged[entry["target"]]["count"] += 1
+            entries_merged[entry["target"]].update(
+                source=entry["source"], target=entry["target"], quality=entry["quality"]
+            )
+        entries_merged[entry["target"]]["count"] += entry["count"]
 
     return sorted(
         entries_merged.values(),
         key=lambda e: (e["quality"], e["count"]),
         reverse=True,
     )[:MAX_RESULTS]
+
+
+def exclude_entity_entries(entries, own_entries):
+    """
+    Subtract the counts of an entity's own translation memory entries
+    from the matching unique entries.
+
+    :arg entries: unique entries, with `source_hash`, `target_hash` and `count`
+    :arg Counter own_entries: counts of the entity's entries
+        by (source_hash, target_hash)
+    """
+    for entry in entries:
+        count = entry["count"] - own_entries[entry["source_hash"], entry["target_hash"]]
+        if count > 0:
+            yield {**entry, "count": count}
+
+
+def get_translation_memory_data(text, locale, pk=None):
+    entries = (
+        UniqueTranslationMemoryEntry.objects.filter(locale=locale)
+        .minimum_levenshtein_ratio(text)
+        .values("source", "target", "source_hash", "target_hash", "count", "quality")
+    )
+
+    # Exclude existing entity
+    if pk:
+        own_entries = Counter(
+            TranslationMemoryEntry.objects.filter(
+                locale=locale, entity__pk=pk
+            ).values_list("source_hash", "target_hash")
+        )
+        entries = exclude_entity_entries(entries, own_entries)
+
+    return merge_translation_memory_entries(entries)
+
+
+def get_translation_memory_batch(strings, locale, min_quality=0.7):
+    """
+    Get translation memory matches for each of `strings`,
+    a sequence of (text, entity pk) pairs, where the pk may be None.
+
+    The unique entries matching all strings are retrieved and scored
+    with a single query, using the same quality metric
+    as `get_translation_memory_data()`.
+    The trigram prefilter is applied per string after filtering by length,
+    so no fewer matches are found than with separate lookups.
+    The entities' own entries are excluded with one more query.
+
+    Returns a list of results for each string, in the same order.
+    """
+    strings = list(strings)
+    if not strings:
+        return []
+
+    texts = [text for text, _ in strings]
+    entity_pks = [int(pk) if pk else None for _, pk in strings]
+    ranges = [similar_length_range(text, min_quality) for text in texts]
+    candidates = settings.TRANSLATION_MEMORY_CANDIDATES
+    nearest = "ORDER BY tm.source <-> q.text LIMIT %s" if candidates else ""
+    params = [
+        texts,
+        [min_dist for min_dist, _ in ranges],
+        [max_dist for _, max_dist in ranges],
+        locale.pk,
+        *([candidates] if candidates else []),
+        min_quality * 100,
+    ]
+
+    # As in TranslationMemoryEntryQuerySet.postgres_levenshtein_ratio(),
+    # with the 255 character limit of levenshtein() applied as in
+    # TranslationMemoryEntryQuerySet.python_levenshtein_ratio().
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT idx, source, target, source_hash, target_hash, count, quality
+            FROM (
+                SELECT q.idx, tm.*, (
+                    (length(tm.source) + length(left(q.text, 255))
+                        - levenshtein(left(tm.source, 255), left(q.text, 255), 1, 2, 2)
+                    )::double precision
+                    / (length(tm.source) + length(left(q.text, 255)))
+                ) * 100 AS quality
+                FROM unnest(%s::text[], %s::integer[], %s::integer[])
+                    WITH ORDINALITY AS q(text, min_length, max_length, idx)
+                CROSS JOIN LATERAL (
+                    SELECT tm.source, tm.target, tm.source_hash, tm.target_hash, tm.count
+                    FROM base_uniquetranslationmemoryentry tm
+                    WHERE tm.locale_id = %s
+                        AND length(tm.source) BETWEEN q.min_length AND q.max_length
+                    {nearest}
+                ) tm
+            ) matches
+            WHERE quality > %s
+            """,
+            params,
+        )
+        rows = cursor.fetchall()
+
+    own_entries = defaultdict(Counter)
+    if any(entity_pks):
+        for (
+            entity_pk,
+            source_hash,
+            target_hash,
+        ) in TranslationMemoryEntry.objects.filter(
+            locale=locale, entity__pk__in={pk for pk in entity_pks if pk}
+        ).values_list("entity", "source_hash", "target_hash"):
+            own_entries[entity_pk][source_hash, target_hash] += 1
+
+    entries = [[] for _ in strings]
+    for idx, source, target, source_hash, target_hash, count, quality in rows:
+        text = texts[idx - 1]
+        if max(ranges[idx - 1]) > 255:
+            quality = round((1 - normalized_distance(text, source)) * 100)
+            if quality <= min_quality * 100:
+                continue
+        entries[idx - 1].append(
+            {
+                "source": source,
+                "target": target,
+                "source_hash": source_hash,
+                "target_hash": target_hash,
+                "count": count,
+                "quality": Decimal(quality),
+            }
+        )
+
+    return [
+        merge_translation_memory_entries(
+            exclude_entity_entries(matches, own_entries[pk]) if pk else matches
+        )
+        for pk, matches in zip(entity_pks, entries)
+    ]
@@ -15,13 +15,16 @@ from django.http import JsonResponse
 from django.template.loader import get_template
 from django.utils.datastructures import MultiValueDictKeyError
 from django.utils.html import strip_tags
+from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST
 
 from pontoon.base.models import Comment, Entity, Locale, Project, Translation
 from pontoon.machinery.utils import (
+    TRANSLATION_MEMORY_BATCH_SIZE,
     get_concordance_search_data,
     get_google_translate_data,
     get_microsoft_translator_data,
+    get_translation_memory_batch,
     get_translation_memory_data,
 )
 from pontoon.terminology.models import Term
@@ -64,6 +67,43 @@ def translation_memory(request):
     return JsonResponse(data, safe=False)
 
 
+@csrf_exempt
+@require_POST
+def translation_memory_batch(request):
+    """
+    Get translations from internal translations memory for many strings at once.
+
+    Expects a JSON body like `{"locale": "fr", "strings": [{"text": "Foo", "pk": 1}]}`,
+    where `pk` is optional. Returns a list of results for each string.
+
+    Like `translation_memory()`, this is a read-only lookup that requires
+    no authentication, and so no CSRF protection. POST is only used to fit
+    the strings in the request body.
+    """
+    try:
+        data = json.loads(request.body)
+        locale = Locale.objects.get(code=data["locale"])
+        strings = [(item["text"], item.get("pk", None)) for item in data["strings"]]
+
+        for text, pk in strings:
+            if not isinstance(text, str):
+                raise ValueError("Text must be a string")
+            if pk is not None:
+                int(pk)
+        if len(strings) > TRANSLATION_MEMORY_BATCH_SIZE:
+            raise ValueError(
+                f"Too many strings, the maximum is {TRANSLATION_MEMORY_BATCH_SIZE}"
+            )
+
+    except (Locale.DoesNotExist, KeyError, TypeError, ValueError) as e:
+        return JsonResponse(
+            {"status": False, "message": f"Bad Request: {e}"},
+            status=400,
+        )
+
+    return JsonResponse(get_translation_memory_batch(strings, locale), safe=False)
+
+
 def concordance_search(request):
     """Search for translations in the internal translations memory."""
     try:
@@ -205,7 +245,7 @@ def gpt_transform(request):
                     "part_of_speech": term.part_of_speech,
                     "translation": term.translation(locale),
                 }
-                for term in Term.objects.for_string(english_text)
+                for term in Term.objects.for_string(english_text, locale)
             ]
             terms = terms_list if terms_list else None
 
@@ -1,8 +1,12 @@
 import calendar
 import datetime
 import logging
+import smtplib
 
 from collections import defaultdict
+from collections.abc import Iterable
+from itertools import batched
+from time import sleep
 
 from celery import shared_task
 from dateutil.relativedelta import relativedelta
@@ -10,7 +14,7 @@ from notifications.models import Notification
 
 from django.conf import settings
 from django.contrib.auth.models import User
-from django.core.mail import EmailMultiAlternatives
+from django.core.mail import EmailMessage, EmailMultiAlternatives, get_connection
 from django.db.models import Count, F, Min, Prefetch, Q, Sum
 from django.template.loader import get_template
 from django.utils import timezone
@@ -31,6 +35,84 @@ class SafeDict(dict):
         return "{" + key + "}"
 
 
+def _is_transient_error(error: OSError) -> bool:
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    if isinstance(error, smtplib.SMTPException):
+        return isinstance(error, smtplib.SMTPServerDisconnected)
+    # Connection and socket errors
+    return True
+
+
+def _is_rejected_message(error: OSError) -> bool:
+    """
+    Whether the server permanently rejected the message itself,
+    rather than the connection, sender or authentication.
+    """
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return True
+    return isinstance(error, smtplib.SMTPDataError) and error.smtp_code >= 500
+
+
+def _send_message(connection, message: EmailMessage) -> int:
+    """
+    Send `message` over `connection`, reconnecting and retrying
+    up to `settings.EMAIL_SEND_RETRIES` times after a transient failure.
+
+    Messages rejected by the server are logged and not sent.
+    Other permanent failures, e.g. of authentication, are raised,
+    as they would fail every other message too.
+    """
+    for attempt in range(settings.EMAIL_SEND_RETRIES + 1):
+        try:
+            connection.open()
+            return connection.send_messages([message])
+        except OSError as error:  # Including smtplib.SMTPException
+            if _is_rejected_message(error):
+                log.error(f"Email to {message.to} rejected: {error}")
+                return 0
+            if not _is_transient_error(error) or attempt == settings.EMAIL_SEND_RETRIES:
+                raise
+            log.warning(f"Retrying email to {message.to} after error: {error}")
+            connection.close()
+            sleep(2**attempt)
+    return 0
+
+
+def send_mass_email(messages: Iterable[EmailMessage]) -> int:
+    """
+    Send `messages` over a shared connection.
+
+    Messages are taken from `messages` in batches of `settings.EMAIL_BATCH_SIZE`,
+    so that a generator may render them one batch at a time.
+    Each batch is sent with a single connection.
+
+    Returns the number of messages sent.
+    """
+    sent = 0
+    connection = get_connection()
+    for batch in batched(messages, settings.EMAIL_BATCH_SIZE):
+        with connection:
+            for message in batch:
+                sent += _send_message(connection, message)
+    return sent
+
+
+def _create_message(
+    subject: str, body_html: str, to: str, body_text: str | None = None
+) -> EmailMultiAlternatives:
+    if body_text is None:
+        body_text = html_to_plain_text_with_links(body_html)
+    msg = EmailMultiAlternatives(
+        subject=subject,
+        body=body_text,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[to],
+    )
+    msg.attach_alternative(body_html, "text/html")
+    return msg
+
+
 def _get_monthly_user_actions(users, months_ago):
     month_date = timezone.now() - relativedelta(months=months_ago)
 
@@ -239,29 +321,21 @@ def send_monthly_activity_summary():
     current_year = now.year
     report_year = current_year if current_month > 1 else current_year - 1
 
-    for user in users:
-        body_html = template.render(
-            {
-                "subject": subject,
-                "month": report_month,
-                "year": report_year,
-                "user": user,
-                "locales": user_locales.get(user, []),
-                "settings": settings,
-            }
-        )
-        body_text = html_to_plain_text_with_links(body_html)
-
-        msg = EmailMultiAlternatives(
-            subject=subject,
-            body=body_text,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=[user.contact_email],
-        )
-        msg.attach_alternative(body_html, "text/html")
-        msg.send()
+    def messages():
+        for user in users:
+            body_html = template.render(
+                {
+                    "subject": subject,
+                    "month": report_month,
+                    "year": report_year,
+                    "user": user,
+                    "locales": user_locales.get(user, []),
+                    "settings": settings,
+                }
+            )
+            yield _create_message(subject, body_html, user.contact_email)
 
-    recipient_count = len(users)
+    recipient_count = send_mass_email(messages())
 
     log.info(f"Monthly activity summary emails sent to {recipient_count} users.")
 
@@ -310,25 +384,17 @@ def send_notification_digest(frequency="Daily"):
     template = get_template("messaging/emails/notification_digest.html")
 
     # Process and send email for each user
-    for user, user_notifications in notifications_map.items():
-        body_html = template.render(
-            {
-                "notifications": user_notifications,
-                "subject": subject,
-            }
-        )
-        body_text = html_to_plain_text_with_links(body_html)
-
-        msg = EmailMultiAlternatives(
-            subject=subject,
-            body=body_text,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=[user.contact_email],
-        )
-        msg.attach_alternative(body_html, "text/html")
-        msg.send()
+    def messages():
+        for user, user_notifications in notifications_map.items():
+            body_html = template.render(
+                {
+                    "notifications": user_notifications,
+                    "subject": subject,
+                }
+            )
+            yield _create_message(subject, body_html, user.contact_email)
 
-    recipient_count = len(notifications_map.keys())
+    recipient_count = send_mass_email(messages())
 
     log.info(f"Notification email digests sent to {recipient_count} users.")
 
@@ -405,15 +471,10 @@ def send_onboarding_emails_2(users):
     )
     body_text = html_to_plain_text_with_links(body_html)
 
-    for user in users:
-        msg = EmailMultiAlternatives(
-            subject=subject,
-            body=body_text,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=[user.contact_email],
-        )
-        msg.attach_alternative(body_html, "text/html")
-        msg.send()
+    send_mass_email(
+        _create_message(subject, body_html, user.contact_email, body_text)
+        for user in users
+    )
 
     pks = users.values_list("pk", flat=True)
     UserProfile.objects.filter(user__in=pks).update(onboarding_email_status=2)
@@ -448,15 +509,10 @@ def send_onboarding_emails_3(users):
     )
     body_text = html_to_plain_text_with_links(body_html)
 
-    for user in users:
-        msg = EmailMultiAlternatives(
-            subject=subject,
-            body=body_text,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=[user.contact_email],
-        )
-        msg.attach_alternative(body_html, "text/html")
-        msg.send()
+    send_mass_email(
+        _create_message(subject, body_html, user.contact_email, body_text)
+        for user in users
+    )
 
     pks = users.values_list("pk", flat=True)
     UserProfile.objects.filter(user__in=pks).update(onboarding_email_status=3)
@@ -492,15 +548,10 @@ def send_inactive_contributor_emails(users):
     )
     body_text = html_to_plain_text_with_links(body_html)
 
-    for user in users:
-        msg = EmailMultiAlternatives(
-            subject=subject,
-            body=body_text,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=[user.contact_email],
-        )
-        msg.attach_alternative(body_html, "text/html")
-        msg.send()
+    send_mass_email(
+        _create_message(subject, body_html, user.contact_email, body_text)
+        for user in users
+    )
 
     pks = users.values_list("pk", flat=True)
     now = timezone.now()
@@ -519,38 +570,32 @@ def send_inactive_translator_emails(users, translator_map):
     subject = email_content.subject
     template = get_template("messaging/emails/transactional.html")
 
-    for user in users:
-        try:
-            locale = list(translator_map[user.pk])[0]
-        except IndexError:
-            log.error(f"User {user} is not a translator of any locale.")
-            continue
-
-        content = email_content.body.format_map(
-            SafeDict(
+    def messages():
+        for user in users:
+            try:
+                locale = list(translator_map[user.pk])[0]
+            except IndexError:
+                log.error(f"User {user} is not a translator of any locale.")
+                continue
+
+            content = email_content.body.format_map(
+                SafeDict(
+                    {
+                        "INACTIVE_TRANSLATOR_PERIOD": settings.INACTIVE_TRANSLATOR_PERIOD,
+                        "team_url": full_url("pontoon.teams.team", locale.code),
+                    }
+                )
+            )
+            body_html = template.render(
                 {
-                    "INACTIVE_TRANSLATOR_PERIOD": settings.INACTIVE_TRANSLATOR_PERIOD,
-                    "team_url": full_url("pontoon.teams.team", locale.code),
+                    "content": content,
+                    "settings": settings,
+                    "subject": subject,
                 }
             )
-        )
-        body_html = template.render(
-            {
-                "content": content,
-                "settings": settings,
-                "subject": subject,
-            }
-        )
-        body_text = html_to_plain_text_with_links(body_html)
+            yield _create_message(subject, body_html, user.contact_email)
 
-        msg = EmailMultiAlternatives(
-            subject=subject,
-            body=body_text,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=[user.contact_email],
-        )
-        msg.attach_alternative(body_html, "text/html")
-        msg.send()
+    send_mass_email(messages())
 
     pks = users.values_list("pk", flat=True)
     now = timezone.now()
@@ -569,40 +614,34 @@ def send_inactive_manager_emails(users, manager_map):
     subject = email_content.subject
     template = get_template("messaging/emails/transactional.html")
 
-    for user in users:
-        try:
-            locale = list(manager_map[user.pk])[0]
-        except IndexError:
-            log.error(f"User {user} is not a manager of any locale.")
-            continue
-        content = email_content.body.format_map(
-            SafeDict(
+    def messages():
+        for user in users:
+            try:
+                locale = list(manager_map[user.pk])[0]
+            except IndexError:
+                log.error(f"User {user} is not a manager of any locale.")
+                continue
+            content = email_content.body.format_map(
+                SafeDict(
+                    {
+                        "INACTIVE_MANAGER_PERIOD": settings.INACTIVE_MANAGER_PERIOD,
+                        "contributors_url": full_url(
+                            "pontoon.teams.contributors", locale.code
+                        ),
+                        "team_url": full_url("pontoon.teams.team", locale.code),
+                    }
+                )
+            )
+            body_html = template.render(
                 {
-                    "INACTIVE_MANAGER_PERIOD": settings.INACTIVE_MANAGER_PERIOD,
-                    "contributors_url": full_url(
-                        "pontoon.teams.contributors", locale.code
-                    ),
-                    "team_url": full_url("pontoon.teams.team", locale.code),
+                    "content": content,
+                    "settings": settings,
+                    "subject": subject,
                 }
             )
-        )
-        body_html = template.render(
-            {
-                "content": content,
-                "settings": settings,
-                "subject": subject,
-            }
-        )
-        body_text = html_to_plain_text_with_links(body_html)
+            yield _create_message(subject, body_html, user.contact_email)
 
-        msg = EmailMultiAlternatives(
-            subject=subject,
-            body=body_text,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=[user.contact_email],
-        )
-        msg.attach_alternative(body_html, "text/html")
-        msg.send()
+    send_mass_email(messages())
 
     pks = users.values_list("pk", flat=True)
     now = timezone.now()
@@ -646,25 +685,19 @@ def send_manual_emails(self, users, subject, body, is_transactional):
     """
     template = get_template("messaging/emails/manual.html")
 
-    for user in users:
-        body_html = template.render(
-            {
-                "subject": subject,
-                "content": body,
-                "is_transactional": is_transactional,
-                "settings": settings,
-                "user": user,
-            }
-        )
-        body_text = html_to_plain_text_with_links(body_html)
+    def messages():
+        for user in users:
+            body_html = template.render(
+                {
+                    "subject": subject,
+                    "content": body,
+                    "is_transactional": is_transactional,
+                    "settings": settings,
+                    "user": user,
+                }
+            )
+            yield _create_message(subject, body_html, user.contact_email)
 
-        msg = EmailMultiAlternatives(
-            subject=subject,
-            body=body_text,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=[user.contact_email],
-        )
-        msg.attach_alternative(body_html, "text/html")
-        msg.send()
+    sent = send_mass_email(messages())
 
-    log.info(f"Emails sent to {len(users)} users.")
+    log.info(f"Emails sent to {sent} users.")
@@ -1,3 +1,5 @@
+import smtplib
+
 from collections import defaultdict
 from datetime import date, datetime, timezone
 from unittest.mock import patch
@@ -5,6 +7,7 @@ from unittest.mock import patch
 import pytest
 
 from django.core import mail
+from django.core.mail import EmailMessage
 from django.template import TemplateSyntaxError
 from django.test.client import RequestFactory
 from django.urls import NoReverseMatch
@@ -16,6 +19,7 @@ from pontoon.messaging.emails import (
     send_inactive_contributor_emails,
     send_inactive_manager_emails,
     send_inactive_translator_emails,
+    send_mass_email,
     send_onboarding_email_1,
     send_onboarding_emails_2,
     send_onboarding_emails_3,
@@ -192,3 +196,119 @@ def test_send_inactive_manager_emails(user_a, locale_a):
 
     assert len(mail.outbox) == 2
     assert mail.outbox[0].to == [user_a.contact_email]
+
+
+class MockConnection:
+    def __init__(self, errors=()):
+        self.errors = list(errors)
+        self.opened = 0
+        self.is_open = False
+        self.sent = []
+
+    def open(self):
+        if not self.is_open:
+            self.is_open = True
+            self.opened += 1
+
+    def close(self):
+        self.is_open = False
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def send_messages(self, messages):
+        error = self.errors.pop(0) if self.errors else None
+        if error:
+            raise error
+        self.sent.extend(messages)
+        return len(messages)
+
+
+def mock_messages(count):
+    return [
+        EmailMessage(subject="s", body="b", to=[f"u{i}@x.com"]) for i in range(count)
+    ]
+
+
+@pytest.fixture
+def mock_sleep():
+    with patch("pontoon.messaging.emails.sleep") as sleep:
+        yield sleep
+
+
+def test_send_mass_email_batches(settings):
+    settings.EMAIL_BATCH_SIZE = 2
+    rendered = []
+
+    class RenderCheckConnection(MockConnection):
+        def open(self):
+            # Each batch is rendered before its connection is opened
+            if not self.is_open:
+                assert len(rendered) == min(self.opened * 2 + 2, 5)
+            super().open()
+
+    connection = RenderCheckConnection()
+
+    def messages():
+        for msg in mock_messages(5):
+            rendered.append(msg)
+            yield msg
+
+    with patch("pontoon.messaging.emails.get_connection", return_value=connection):
+        assert send_mass_email(messages()) == 5
+    assert len(connection.sent) == 5
+    assert connection.opened == 3
+
+
+def test_send_mass_email_retries(settings, mock_sleep):
+    settings.EMAIL_SEND_RETRIES = 2
+    connection = MockConnection(
+        errors=[
+            None,
+            smtplib.SMTPServerDisconnected("gone"),
+            smtplib.SMTPResponseException(421, "busy"),
+            None,
+            smtplib.SMTPRecipientsRefused({"u2@x.com": (550, "no such user")}),
+            smtplib.SMTPDataError(554, "spam"),
+        ]
+    )
+    messages = mock_messages(5)
+    with patch("pontoon.messaging.emails.get_connection", return_value=connection):
+        assert send_mass_email(messages) == 3
+    assert connection.sent == [messages[0], messages[1], messages[4]]
+    assert [call.args for call in mock_sleep.call_args_list] == [(1,), (2,)]
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        smtplib.SMTPAuthenticationError(535, "bad credentials"),
+        smtplib.SMTPNotSupportedError("no STARTTLS"),
+        smtplib.SMTPSenderRefused(550, "no such sender", "pontoon@x.com"),
+    ],
+)
+def test_send_mass_email_permanent_error(settings, mock_sleep, error):
+    settings.EMAIL_SEND_RETRIES = 2
+    connection = MockConnection(errors=[None, error])
+    with (
+        patch("pontoon.messaging.emails.get_connection", return_value=connection),
+        pytest.raises(type(error)),
+    ):
+        send_mass_email(mock_messages(3))
+    assert len(connection.sent) == 1
+    assert not mock_sleep.called
+
+
+def test_send_mass_email_retries_exhausted(settings, mock_sleep):
+    settings.EMAIL_SEND_RETRIES = 1
+    connection = MockConnection(errors=[ConnectionRefusedError()] * 2)
+    with (
+        patch("pontoon.messaging.emails.get_connection", return_value=connection),
+        pytest.raises(ConnectionRefusedError),
+    ):
+        send_mass_email(mock_messages(2))
+    assert connection.sent == []
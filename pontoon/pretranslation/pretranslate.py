@@ -21,16 +21,130 @@ from moz.l10n.model import (
     PatternMessage,
 )
 
-from pontoon.base.models import Entity, Locale, Resource, TranslationMemoryEntry
-from pontoon.machinery.utils import get_google_translate_data
+from pontoon.base.models import (
+    Entity,
+    Locale,
+    Resource,
+    UniqueTranslationMemoryEntry,
+)
+from pontoon.base.models.translation_memory import text_hash
+from pontoon.machinery.utils import (
+    get_google_translate_batch,
+    get_google_translate_data,
+)
 
 
 pt_placeholder = compile(r"{ *\$(\d+) *}")
 
 
+Service = Literal["gt", "tm"]
+
+
+class PretranslationLookup:
+    """
+    Looks up the translation of each segment as it's needed,
+    from internal translation memory and Google's machine translation.
+    """
+
+    def get(
+        self,
+        locale: Locale,
+        tm_source: str,
+        mt_source: str | None,
+        preserve_placeables: bool,
+    ) -> tuple[str, Service] | None:
+        """
+        Get a 100% match for `tm_source` from translation memory,
+        or else a machine translation of `mt_source`, if it's set.
+        """
+        tm_q100 = (
+            UniqueTranslationMemoryEntry.objects.filter(
+                locale=locale, source_hash=text_hash(tm_source), source=tm_source
+            )
+            .order_by("-count")
+            .values_list("target", flat=True)
+            .first()
+        )
+        if tm_q100 is not None:
+            return tm_q100, "tm"
+        if mt_source is not None and locale.google_translate_code:
+            gt_translation = get_google_translate_data(
+                text=mt_source,
+                locale=locale,
+                preserve_placeables=preserve_placeables,
+            )
+            return gt_translation, "gt"
+        return None
+
+
+class RecordingLookup(PretranslationLookup):
+    """
+    Records the segments that are looked up, without looking them up,
+    so that they may later be looked up in a batch.
+    """
+
+    def __init__(self) -> None:
+        self.segments: set[tuple[str, str | None]] = set()
+
+    def get(self, locale, tm_source, mt_source, preserve_placeables):
+        self.segments.add((tm_source, mt_source))
+        return mt_source or "", "gt"
+
+
+class BatchLookup(PretranslationLookup):
+    """
+    Looks up the segments recorded by a `RecordingLookup` for a locale,
+    with one translation memory query
+    and batched concurrent machine translation requests.
+    """
+
+    def __init__(
+        self,
+        locale: Locale,
+        segments: set[tuple[str, str | None]],
+        preserve_placeables: bool,
+    ) -> None:
+        self.tm: dict[str, str] = {}
+        if segments:
+            tm_sources = {tm_source for tm_source, _ in segments}
+            # Ordered so that the most common target of each source is set last
+            for source, target in (
+                UniqueTranslationMemoryEntry.objects.filter(
+                    locale=locale,
+                    source_hash__in={text_hash(source) for source in tm_sources},
+                )
+                .order_by("count")
+                .values_list("source", "target")
+            ):
+                if source in tm_sources:
+                    self.tm[source] = target
+        mt_sources = {
+            mt_source
+            for tm_source, mt_source in segments
+            if mt_source is not None and tm_source not in self.tm
+        }
+        self.mt = (
+            get_google_translate_batch(
+                list(mt_sources), locale, preserve_placeables=preserve_placeables
+            )
+            if mt_sources and locale.google_translate_code
+            else {}
+        )
+
+    def get(self, locale, tm_source, mt_source, preserve_placeables):
+        if tm_source in self.tm:
+            return self.tm[tm_source], "tm"
+        if mt_source is not None and mt_source in self.mt:
+            return self.mt[mt_source], "gt"
+        return None
+
+
 def get_pretranslation(
-    entity: Entity, locale: Locale, preserve_placeables: bool = False
-) -> tuple[str, Literal["gt", "tm"]]:
+    entity: Entity,
+    locale: Locale,
+    preserve_placeables: bool = False,
+    lookup: PretranslationLookup | None = None,
+) -> tuple[str, Service]:
     """
     Get pretranslations for the entity-locale pair using internal translation memory and
     Google's machine translation.
@@ -38,12 +152,15 @@ def get_pretranslation(
     For entities with multiple variants and/or Fluent attributes,
     sets the most frequent pretranslation author as the author of the entire pretranslation.
 
+    :arg lookup: How segment translations are looked up;
+      by default, each is looked up as it's needed.
+
     :returns: A tuple consisting of:
         - a pretranslation of the entity
         - a pretranslation service identifier, either "gt" or "tm"
     """
 
-    pt = Pretranslation(entity, locale, preserve_placeables)
+    pt = Pretranslation(entity, locale, preserve_placeables, lookup)
     if entity.resource.format == Resource.Format.FLUENT:
         entry = fluent_parse_entry(entity.string, with_linepos=False)
         if entry.value:
@@ -82,11 +199,18 @@ def get_pretranslation(
 class Pretranslation:
     format: Format | None
     locale: Locale
+    lookup: PretranslationLookup
     preserve_placeables: bool
-    services: list[Literal["gt", "tm"]]
+    services: list[Service]
     source: str
 
-    def __init__(self, entity: Entity, locale: Locale, preserve_placeables: bool):
+    def __init__(
+        self,
+        entity: Entity,
+        locale: Locale,
+        preserve_placeables: bool,
+        lookup: PretranslationLookup | None = None,
+    ):
         match entity.resource.format:
             case Resource.Format.FLUENT:
                 self.format = Format.fluent
@@ -102,6 +226,7 @@ class Pretranslation:
                 self.format = None
         self.source = entity.string
         self.locale = locale
+        self.lookup = lookup or PretranslationLookup()
         self.preserve_placeables = preserve_placeables
         self.services = []
 
@@ -163,20 +288,6 @@ class Pretranslation:
         )
         if not tm_source or tm_source.isspace():
             return pattern
-        tm_q100 = list(
-            TranslationMemoryEntry.objects.filter(
-                locale=self.locale, source=tm_source
-            ).values_list("target", flat=True)
-        )
-        if tm_q100:
-            tm_best = max(set(tm_q100), key=tm_q100.count)
-            self.services.append("tm")
-            if self.format == Format.fluent:
-                te = fluent_parse_entry(f"key = {tm_best}\n")
-                assert isinstance(te.value, PatternMessage)
-                return te.value.pattern
-            else:
-                return [tm_best]
 
         placeholders: list[Expression | Markup] = []
         gt_source = ""
@@ -192,32 +303,43 @@ class Pretranslation:
                 idx = len(placeholders)
                 placeholders.append(el)
                 gt_source += "{$" + str(idx) + "}"
-        if not has_text:
-            return pattern
 
-        if self.locale.google_translate_code:
-            # Try to fetch from Google Translate
-            gt_translation = get_google_translate_data(
-                text=gt_source,
-                locale=self.locale,
-                preserve_placeables=self.preserve_placeables,
+        # First try to get a 100% match from Translation Memory,
+        # then fall back to machine translation.
+        found = self.lookup.get(
+            self.locale,
+            tm_source,
+            gt_source if has_text else None,
+            self.preserve_placeables,
+        )
+        if found is None:
+            if not has_text:
+                return pattern
+            raise ValueError(
+                f"Pretranslation for `{self.source}` to `{self.locale.code}` not available"
             )
-            self.services.append("gt")
-            return [
-                el
-                if idx % 2 == 0
-                else (
-                    placeholders[int(el)]
-                    if int(el) < len(placeholders)
-                    else "{$" + el + "}"
-                )
-                for idx, el in enumerate(pt_placeholder.split(gt_translation))
-                if el != ""
-            ]
 
-        raise ValueError(
-            f"Pretranslation for `{self.source}` to `{self.locale.code}` not available"
-        )
+        translation, service = found
+        self.services.append(service)
+        if service == "tm":
+            if self.format == Format.fluent:
+                te = fluent_parse_entry(f"key = {translation}\n")
+                assert isinstance(te.value, PatternMessage)
+                return te.value.pattern
+            else:
+                return [translation]
+
+        return [
+            el
+            if idx % 2 == 0
+            else (
+                placeholders[int(el)]
+                if int(el) < len(placeholders)
+                else "{$" + el + "}"
+            )
+            for idx, el in enumerate(pt_placeholder.split(translation))
+            if el != ""
+        ]
 
 
 def set_accesskey(entry: Entry[Message], ak_name: str, ak_msg: Message):
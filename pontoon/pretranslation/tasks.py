@@ -13,6 +13,7 @@ from django.db.models.functions import Concat
 from pontoon.actionlog.models import ActionLog
 from pontoon.base.models import (
     Entity,
+    Locale,
     Project,
     TranslatedResource,
     Translation,
@@ -24,7 +25,7 @@ from pontoon.checks.utils import bulk_run_checks
 from pontoon.translations.utils import parse_db_string_to_json
 
 from . import AUTHORS
-from .pretranslate import get_pretranslation
+from .pretranslate import BatchLookup, RecordingLookup, Service, get_pretranslation
 
 
 log = logging.getLogger(__name__)
@@ -96,7 +97,7 @@ def pretranslate(project: Project, paths: set[str] | None):
         .distinct()
     )
 
-    translated_entities = list(translated_entities)
+    translated_entities = set(translated_entities)
 
     for locale in locales:
         log.info(f"Fetching pretranslations for locale {locale.code} started")
@@ -108,34 +109,30 @@ def pretranslate(project: Project, paths: set[str] | None):
         tr_filter = []
         index = -1
 
-        for entity in entities:
-            locale_entity = f"{locale.id}-{entity.id}"
-            locale_resource = f"{locale.id}-{entity.resource.id}"
-            if locale_entity in translated_entities or locale_resource not in tr_pairs:
-                continue
-
-            try:
-                pretranslation = get_pretranslation(entity, locale)
-            except ValueError as e:
-                log.info(f"Pretranslation error: {e}")
-                continue
-
-            failed_checks = run_checks(
-                entity,
-                locale.code,
-                pretranslation[0],
-                use_tt_checks=False,
-            )
-
-            if failed_checks:
-                try:
-                    pretranslation = get_pretranslation(
-                        entity, locale, preserve_placeables=True
-                    )
-                except ValueError as e:
-                    log.info(f"Pretranslation error: {e}")
-                    continue
+        pending = [
+            entity
+            for entity in entities
+            if f"{locale.id}-{entity.id}" not in translated_entities
+            and f"{locale.id}-{entity.resource.id}" in tr_pairs
+        ]
+        pretranslations = get_pretranslations(pending, locale)
 
+        # Retry with preserved placeables the pretranslations that fail checks
+        failed = [
+            entity
+            for entity, (string, _) in pretranslations.items()
+            if run_checks(entity, locale.code, string, use_tt_checks=False)
+        ]
+        if failed:
+            retried = get_pretranslations(failed, locale, preserve_placeables=True)
+            for entity in failed:
+                if entity in retried:
+                    pretranslations[entity] = retried[entity]
+                else:
+                    del pretranslations[entity]
+
+        for entity, pretranslation in pretranslations.items():
+            locale_resource = f"{locale.id}-{entity.resource.id}"
             string, author_key = pretranslation
             value, properties = parse_db_string_to_json(entity.resource.format, string)
 
@@ -218,6 +215,34 @@ def pretranslate(project: Project, paths: set[str] | None):
     log.info(f"Fetching pretranslations for project {project.name} done")
 
 
+def get_pretranslations(
+    entities: list[Entity], locale: Locale, preserve_placeables: bool = False
+) -> dict[Entity, tuple[str, Service]]:
+    """
+    Get pretranslations for all of `entities`,
+    looking up the translations of all of their segments in a batch.
+
+    Entities for which a pretranslation is not available are not included.
+    """
+    recorder = RecordingLookup()
+    for entity in entities:
+        try:
+            get_pretranslation(entity, locale, preserve_placeables, recorder)
+        except ValueError:
+            pass  # Reported below
+
+    lookup = BatchLookup(locale, recorder.segments, preserve_placeables)
+    pretranslations: dict[Entity, tuple[str, Service]] = {}
+    for entity in entities:
+        try:
+            pretranslations[entity] = get_pretranslation(
+                entity, locale, preserve_placeables, lookup
+            )
+        except ValueError as e:
+            log.info(f"Pretranslation error: {e}")
+    return pretranslations
+
+
 @shared_task(base=PontoonTask, name="pretranslate")
 def pretranslate_task(project_pk):
     project = Project.objects.get(pk=project_pk)
@@ -3,13 +3,14 @@ from unittest.mock import patch
 import pytest
 
 from pontoon.base.models import ChangedEntityLocale, Translation, User
-from pontoon.pretranslation.tasks import pretranslate_task
+from pontoon.pretranslation.tasks import get_pretranslations, pretranslate_task
 from pontoon.test.factories import (
     EntityFactory,
     ProjectLocaleFactory,
     ResourceFactory,
     TranslatedResourceFactory,
     TranslationFactory,
+    TranslationMemoryFactory,
 )
 
 
@@ -110,3 +111,32 @@ def test_which_strings_to_pretranslate(gt_mock, project_a, locale_a, resource_a)
     assert len(non_rejected.translation_set.filter(string="pretranslation")) == 0
     assert len(rejected_by_human.translation_set.filter(string="pretranslation")) == 1
     assert len(rejected_by_machine.translation_set.filter(string="pretranslation")) == 0
+
+
+@patch("pontoon.pretranslation.pretranslate.get_google_translate_batch")
+@pytest.mark.django_db
+def test_get_pretranslations_batch(
+    gt_mock, entity_a, entity_b, google_translate_locale, django_assert_num_queries
+):
+    entity_c = EntityFactory.create(resource=entity_a.resource, string="entity c")
+    TranslationMemoryFactory.create(
+        entity=entity_b,
+        source=entity_a.string,
+        target="tm_translation",
+        locale=google_translate_locale,
+    )
+    gt_mock.return_value = {"entity b": "gt_translation"}
+
+    # One TM query for all entities, and one batch of machine translations
+    with django_assert_num_queries(1):
+        pretranslations = get_pretranslations(
+            [entity_a, entity_b, entity_c], google_translate_locale
+        )
+    gt_mock.assert_called_once()
+    assert sorted(gt_mock.call_args.args[0]) == ["entity b", "entity c"]
+
+    # Machine translation failed for entity_c
+    assert pretranslations == {
+        entity_a: ("tm_translation", "tm"),
+        entity_b: ("gt_translation", "gt"),
+    }
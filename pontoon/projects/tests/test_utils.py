@@ -15,7 +15,14 @@ from unittest.mock import patch
 
 import pytest
 
-from pontoon.base.models import Resource, Translation
+from pontoon.actionlog.models import ActionLog
+from pontoon.base.models import (
+    ChangedEntityLocale,
+    Resource,
+    TranslatedResource,
+    Translation,
+    TranslationMemoryEntry,
+)
 from pontoon.projects.utils import (
     generate_translation_stats_csv,
     get_translation_key,
@@ -62,9 +69,14 @@ def build_csv(headers: list[str], rows: list[list]) -> str:
     return buf.getvalue()
 
 
+def read_streaming_content(response) -> str:
+    """Decode the body of a StreamingHttpResponse."""
+    return b"".join(response.streaming_content).decode("utf-8")
+
+
 def parse_csv_response(response) -> list[dict]:
-    """Decode an HttpResponse body as CSV and return a list of row dicts."""
-    return list(csv.DictReader(io.StringIO(response.content.decode("utf-8"))))
+    """Decode a StreamingHttpResponse body as CSV and return a list of row dicts."""
+    return list(csv.DictReader(io.StringIO(read_streaming_content(response))))
 
 
 # ─── get_translation_key ─────────────────────────────────────────────────────
@@ -134,6 +146,7 @@ class TestGenerateTranslationStatsCsv:
         response = generate_translation_stats_csv(project=project, user=user)
 
         assert response.status_code == 200
+        assert response.streaming
         assert response["Content-Type"] == "text/csv"
         assert (
             response["Content-Disposition"]
@@ -143,7 +156,7 @@ class TestGenerateTranslationStatsCsv:
     @pytest.mark.django_db
     def test_headers_include_all_locale_names(self, project, locale, user):
         response = generate_translation_stats_csv(project=project, user=user)
-        content = response.content.decode("utf-8")
+        content = read_streaming_content(response)
         reader = csv.reader(io.StringIO(content))
         headers = next(reader)
 
@@ -283,6 +296,28 @@ class TestGenerateTranslationStatsCsv:
         assert rows[0]["Geonosian"] == "Hola"
         assert rows[0]["Dothraki"] == "Bona"
 
+    @pytest.mark.django_db
+    def test_translations_pivoted_by_locale(self, project, locale, user):
+        """Each row has the approved translation of each project locale, if any."""
+        other = LocaleFactory(name="Huttese", code="hut")
+        resource = ResourceFactory(project=project, path="test.po", format="gettext")
+        hello = EntityFactory(resource=resource, string="Hello", key=["Hello"])
+        world = EntityFactory(resource=resource, string="World", key=["World"])
+        TranslationFactory(entity=hello, locale=locale, string="Hola", approved=True)
+        TranslationFactory(entity=hello, locale=locale, string="Holla", approved=False)
+        # Not a locale of the project
+        TranslationFactory(entity=world, locale=other, string="Mundo", approved=True)
+
+        rows = parse_csv_response(
+            generate_translation_stats_csv(project=project, user=user)
+        )
+
+        assert [(row["Translation Key"], row[locale.name]) for row in rows] == [
+            ("Hello", "Hola"),
+            ("World", ""),
+        ]
+        assert other.name not in rows[0]
+
 
 # ─── upload_translations ─────────────────────────────────────────────────────
 
@@ -475,6 +510,90 @@ class TestUploadTranslations:
         assert new.approved is True
         assert new.active is True
 
+    @pytest.mark.django_db
+    def test_translator_import_logs_actions_and_adds_tm_entries(
+        self, project, locale, resource, entity, translator
+    ):
+        old = TranslationFactory(
+            entity=entity, locale=locale, string="Old", approved=True, active=True
+        )
+        other = EntityFactory(resource=resource, string="World", key=["World"])
+
+        csv_file = make_csv_file(
+            self._csv(
+                locale.name,
+                [["test.po", "Hello", "Hello", "Hola"], ["test.po", "World", "World", "Mundo"]],
+            )
+        )
+        assert upload_translations(csv_file=csv_file, project=project, user=translator) is None
+
+        old.refresh_from_db()
+        assert old.rejected is True
+        assert old.approved is False
+
+        created = Translation.objects.filter(locale=locale, user=translator)
+        assert {(tr.entity, tr.string) for tr in created} == {(entity, "Hola"), (other, "Mundo")}
+        assert set(
+            ActionLog.objects.values_list("action_type", "translation__string")
+        ) == {
+            (ActionLog.ActionType.TRANSLATION_CREATED, "Hola"),
+            (ActionLog.ActionType.TRANSLATION_CREATED, "Mundo"),
+            (ActionLog.ActionType.TRANSLATION_REJECTED, "Old"),
+        }
+        assert set(
+            TranslationMemoryEntry.objects.values_list("source", "target")
+        ) == {("Hello", "Hola"), ("World", "Mundo")}
+
+    @pytest.mark.django_db
+    def test_import_marks_changes_and_latest_translations(
+        self, project, locale, resource, entity, user, translator
+    ):
+        other_resource = ResourceFactory(
+            project=project, path="other.po", format="gettext"
+        )
+        other = EntityFactory(resource=other_resource, string="World", key=["World"])
+
+        # Suggestions are not synced
+        csv_file = make_csv_file(
+            self._csv(locale.name, [["test.po", "Hello", "Hello", "Hola"]])
+        )
+        assert upload_translations(csv_file=csv_file, project=project, user=user) is None
+        assert not ChangedEntityLocale.objects.exists()
+
+        csv_file = make_csv_file(
+            self._csv(
+                locale.name,
+                [["test.po", "Hello", "Hello", "Hey"], ["other.po", "World", "World", "Mundo"]],
+            )
+        )
+        assert upload_translations(csv_file=csv_file, project=project, user=translator) is None
+        assert set(
+            ChangedEntityLocale.objects.values_list("entity", "locale")
+        ) == {(entity.pk, locale.pk), (other.pk, locale.pk)}
+
+        # Each translated resource has its own latest translation
+        assert set(
+            TranslatedResource.objects.filter(locale=locale).values_list(
+                "resource", "latest_translation__string"
+            )
+        ) == {(resource.pk, "Hey"), (other_resource.pk, "Mundo")}
+
+    @pytest.mark.django_db
+    def test_invalid_row_rejects_whole_file(
+        self, project, locale, resource, entity, translator
+    ):
+        """All rows are validated before any translations are created."""
+        csv_file = make_csv_file(
+            self._csv(
+                locale.name,
+                [["test.po", "Hello", "Hello", "Hola"], ["test.po", "Nope", "Nope", "No"]],
+            )
+        )
+        response = upload_translations(csv_file=csv_file, project=project, user=translator)
+
+        assert response.status_code == 400
+        assert not Translation.objects.filter(locale=locale).exists()
+
     # ── Format round-trips ───────────────────────────────────────────────────
 
     @pytest.mark.django_db
@@ -1,74 +1,66 @@
 import csv
 
 from io import StringIO
-from typing import Iterable
+from itertools import chain
+from typing import Iterable, Iterator
 
 from django.contrib.auth.models import User
 from django.db import connection, transaction
-from django.http import HttpResponse, JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 from django.utils import timezone
 
+from pontoon.actionlog.models import ActionLog
+from pontoon.base.models import (
+    ChangedEntityLocale,
+    Entity,
+    Locale,
+    Project,
+    TranslatedResource,
+    Translation,
+    TranslationMemoryEntry,
+)
+from pontoon.db import UnnestIn
+from pontoon.sync.core.stats import update_stats
+from pontoon.sync.core.translations_from_repo import (
+    add_failed_checks,
+    add_translation_memory_entries,
+)
 from pontoon.translations.utils import parse_db_string_to_json
 
-from pontoon.base.models import Project, Translation
 
+class Echo:
+    """A file-like object that returns what is written to it, for `csv.writer`."""
 
-def generate_translation_stats_csv(project: Project, user: User) -> HttpResponse:
-    """
-    Stream all non-obsolete entities and their approved translations for the
-    given project as a CSV file.
-
-    Column layout: Resource | Translation Key | Translation Source String | <locale> …
+    def write(self, value: str) -> str:
+        return value
 
-    Entity keys are stored as a PostgreSQL text array (ArrayField). They are
-    serialised to CSV as follows so that import can reconstruct them exactly:
-      - plain_json / webext: array elements joined with "."  (e.g. "section.key")
-      - all other formats:   array elements joined with \\x04 (ASCII Unit Separator),
-                             a character that does not appear in normal source strings
 
-    Only approved translations are exported; other states (unreviewed, rejected,
-    etc.) appear as an empty cell.
+def _translation_stats_rows(
+    project: Project, locale_ids: list[int]
+) -> Iterator[list[str]]:
     """
-    project_locales = project.project_locale.all()
-    pl_names = [pl.locale.name for pl in project_locales]
-    response = HttpResponse(content_type="text/csv")
-    response["Content-Disposition"] = (
-        f'attachment; filename="{project.slug}_translations_stats.csv"'
-    )
-
-    headers = [
-        "Resource",
-        "Translation Key",
-        "Translation Source String",
-    ] + pl_names
-    writer = csv.writer(response, quoting=csv.QUOTE_ALL)
-    writer.writerow(headers)
-
-    with connection.cursor() as cursor:
+    The CSV rows of `project` entities, fetched with a server-side cursor
+    so that only a chunk of them is held in memory at a time.
+    """
+    with connection.chunked_cursor() as cursor:
         cursor.execute(
             """
             SELECT
                 r.path AS resource_path,
                 e.key AS entity_key,
                 e.string AS entity_string,
-                json_agg(json_build_object(
-                    'locale_id', t.locale_id,
-                    'string', t.string,
-                    'approved', t.approved,
-                    'pretranslated', t.pretranslated,
-                    'rejected', t.rejected,
-                    'fuzzy', t.fuzzy
-                )) AS translations
+                array_remove(array_agg(t.locale_id), NULL) AS locale_ids,
+                array_remove(array_agg(t.string), NULL) AS strings
             FROM
                 base_resource r
             JOIN
                 base_entity e ON e.resource_id = r.id
             LEFT JOIN
-                base_translation t ON t.entity_id = e.id
+                base_translation t ON t.entity_id = e.id AND t.approved
             WHERE
                 r.project_id = %s AND e.obsolete = FALSE
             GROUP BY
-                r.path, e.key, e.string
+                r.path, e.id
             ORDER BY
                 r.path ASC,
                 e.key ASC
@@ -76,28 +68,54 @@ def generate_translation_stats_csv(project: Project, user: User) -> HttpResponse
             [project.id],
         )
 
-        rows = cursor.fetchall()
-
-    for row in rows:
-        (resource_path, entity_key, entity_string, translations) = row
-        if resource_path.endswith("json"):
-            entity_key = ".".join(entity_key)
-        else:
-            entity_key = "\x04".join(entity_key)
-
-        row_data = [resource_path, entity_key, entity_string]
-
-        for pl in project_locales:
-            translation = next(
-                (
-                    tr["string"]
-                    for tr in translations
-                    if tr["locale_id"] == pl.locale.id and tr["approved"]
-                ),
-                "",
-            )
-            row_data.append(translation)
-        writer.writerow(row_data)
+        for resource_path, entity_key, entity_string, tr_locales, tr_strings in cursor:
+            if resource_path.endswith("json"):
+                entity_key = ".".join(entity_key)
+            else:
+                entity_key = "\x04".join(entity_key)
+
+            translations = dict(zip(tr_locales, tr_strings))
+            yield [resource_path, entity_key, entity_string] + [
+                translations.get(locale_id, "") for locale_id in locale_ids
+            ]
+
+
+def generate_translation_stats_csv(
+    project: Project, user: User
+) -> StreamingHttpResponse:
+    """
+    Stream all non-obsolete entities and their approved translations for the
+    given project as a CSV file.
+
+    Column layout: Resource | Translation Key | Translation Source String | <locale> …
+
+    Entity keys are stored as a PostgreSQL text array (ArrayField). They are
+    serialised to CSV as follows so that import can reconstruct them exactly:
+      - plain_json / webext: array elements joined with "."  (e.g. "section.key")
+      - all other formats:   array elements joined with \\x04 (ASCII Unit Separator),
+                             a character that does not appear in normal source strings
+
+    Only approved translations are exported; other states (unreviewed, rejected,
+    etc.) appear as an empty cell.
+    """
+    project_locales = project.project_locale.select_related("locale")
+    locale_ids = [pl.locale_id for pl in project_locales]
+    pl_names = [pl.locale.name for pl in project_locales]
+
+    headers = [
+        "Resource",
+        "Translation Key",
+        "Translation Source String",
+    ] + pl_names
+    writer = csv.writer(Echo(), quoting=csv.QUOTE_ALL)
+    rows = chain([headers], _translation_stats_rows(project, locale_ids))
+
+    response = StreamingHttpResponse(
+        (writer.writerow(row) for row in rows), content_type="text/csv"
+    )
+    response["Content-Disposition"] = (
+        f'attachment; filename="{project.slug}_translations_stats.csv"'
+    )
     return response
 
 
@@ -108,14 +126,15 @@ def upload_translations(csv_file, project: Project, user: User):
     Returns a JsonResponse with an error message (status 400) on any validation
     failure, or None on success (the view then issues a redirect).
 
+    All rows are validated before any translations are created.
     Rows are skipped — not rejected — when a locale cell is blank or contains
     one of UNTRANSLATED_MARKS, or when the same translation string already
     exists for that entity/locale pair.
 
     Whether the created translation is approved depends on whether the uploading
     user has translator rights for the project locale (via can_translate). If
-    they do, the new translation becomes active/approved and any existing active
-    translation is deactivated in the same atomic block.
+    they do, the new translation becomes active/approved and the other
+    translations of the entity/locale pair are rejected in the same atomic block.
     """
     # Status strings that appear in locale cells of the exported CSV when there
     # is no approved translation (e.g. the cell held a review-status label from
@@ -144,14 +163,29 @@ def upload_translations(csv_file, project: Project, user: User):
             status=400,
         )
 
-    locales = project.locales.filter(
-        name__in=set(project_locale_names) & set(locale_names)
+    locales = list(
+        project.locales.filter(name__in=set(project_locale_names) & set(locale_names))
     )
     translations = [row for row in reader if any(cell for cell in row)]
+
+    # Preload the resources and entities of all rows, and validate them
+    # before any changes are made.
+    resources = {
+        res.path: res
+        for res in project.resources.filter(
+            path__in={tr["Resource"] for tr in translations}
+        )
+    }
+    entities = {
+        (entity.resource_id, tuple(entity.key)): entity
+        for entity in Entity.objects.filter(
+            resource__in=resources.values(), obsolete=False
+        ).select_related("resource")
+    }
+    # (entity, locale) -> translation string, keeping the last one of each
+    cells: dict[tuple[Entity, Locale], str] = {}
     for tr in translations:
-        if qs := project.resources.filter(path=tr["Resource"]):
-            resource = qs.first()
-        else:
+        if (resource := resources.get(tr["Resource"])) is None:
             return JsonResponse(
                 data={"error": f"Resource not found: {tr['Resource']}"},
                 status=400,
@@ -170,7 +204,7 @@ def upload_translations(csv_file, project: Project, user: User):
                 status=400,
             )
 
-        if not (qs := resource.entities.filter(key=key, obsolete=False)):
+        if (entity := entities.get((resource.id, tuple(key)))) is None:
             return JsonResponse(
                 data={
                     "error": f"Wrong data: translation key {key} does not exist in "
@@ -179,55 +213,152 @@ def upload_translations(csv_file, project: Project, user: User):
                 status=400,
             )
 
-        entity = qs.first()
-
         for locale in locales:
-            if tr[locale.name].strip() == "" or tr[locale.name] in UNTRANSLATED_MARKS:
-                continue
-            # if same translation exists for the entity, skip creating translation
             tr_string = tr[locale.name]
-            if entity.translation_set.filter(locale=locale, string=tr_string):
+            if tr_string.strip() == "" or tr_string in UNTRANSLATED_MARKS:
                 continue
+            cells[(entity, locale)] = tr_string
+
+    # If the same translation exists for the entity, skip creating it
+    existing = (
+        set(
+            Translation.objects.filter(
+                UnnestIn(
+                    ("entity", "locale", "string"),
+                    [
+                        (entity.id, locale.id, string)
+                        for (entity, locale), string in cells.items()
+                    ],
+                )
+            ).values_list("entity", "locale", "string")
+        )
+        if cells
+        else set()
+    )
+    cells = {
+        (entity, locale): string
+        for (entity, locale), string in cells.items()
+        if (entity.id, locale.id, string) not in existing
+    }
+    if cells:
+        with transaction.atomic():
+            import_translations(project, user, cells)
+
+
+def import_translations(
+    project: Project, user: User, cells: dict[tuple[Entity, Locale], str]
+) -> None:
+    """
+    Create the translations of an uploaded CSV file in bulk.
 
-            activate_new_translation = False
-            if user.can_translate(project=project, locale=locale):
-                activate_new_translation = True
-
-            # Create new translation for the entity
-            value, properties = parse_db_string_to_json(resource.format, tr_string)
-            new_trans = Translation(
-                string=tr_string,
-                value=value,
-                properties=properties,
-                user=user,
-                locale=locale,
-                entity=entity,
-                active=False,
-                approved=False,
-                date=timezone.now(),
-                rejected=False,
-                rejected_user=None,
-                rejected_date=None,
-                pretranslated=False,
-                fuzzy=False,
+    If the uploading user has translator rights for a locale, the new
+    translations are approved and the other translations of their entities
+    are rejected; otherwise they are added as suggestions.
+    Checks, translation memory entries and stats are then updated in batches.
+    """
+    now = timezone.now()
+    can_translate = {
+        locale.id: user.can_translate(project=project, locale=locale)
+        for locale in {locale for _, locale in cells}
+    }
+
+    new_translations: list[Translation] = []
+    actions: list[ActionLog] = []
+    # (entity_id, locale_id)
+    translations_to_reject: list[tuple[int, int]] = []
+    for (entity, locale), tr_string in cells.items():
+        value, properties = parse_db_string_to_json(entity.resource.format, tr_string)
+        tx = Translation(
+            string=tr_string,
+            value=value,
+            properties=properties,
+            user=user,
+            locale=locale,
+            entity=entity,
+            date=now,
+        )
+        if can_translate[locale.id]:
+            tx.active = True
+            tx.approved = True
+            tx.approved_user = user
+            tx.approved_date = now
+            translations_to_reject.append((entity.id, locale.id))
+        new_translations.append(tx)
+        actions.append(
+            ActionLog(
+                action_type=ActionLog.ActionType.TRANSLATION_CREATED,
+                created_at=now,
+                performed_by=user,
+                translation=tx,
             )
+        )
 
-            if activate_new_translation:
-                new_trans.active = True
-                new_trans.approved = True
-                new_trans.approved_user = user
-                new_trans.approved_date = timezone.now()
-                if current_translation := entity.translation_set.filter(
-                    locale=locale, active=True
-                ).first():
-                    with transaction.atomic():
-                        current_translation.active = False
-                        current_translation.save()
-                        new_trans.save()
-                else:
-                    new_trans.save()
-            else:
-                new_trans.save()
+    if translations_to_reject:
+        # Only one translation can be approved at a time for any Entity/Locale
+        rejected = list(
+            Translation.objects.filter(rejected=False).filter(
+                UnnestIn(("entity", "locale"), translations_to_reject)
+            )
+        )
+        actions.extend(
+            ActionLog(
+                action_type=ActionLog.ActionType.TRANSLATION_REJECTED,
+                created_at=now,
+                performed_by=user,
+                translation=tx,
+                is_implicit_action=True,
+            )
+            for tx in rejected
+        )
+        TranslationMemoryEntry.objects.filter(translation__in=rejected).delete()
+        Translation.objects.filter(pk__in=[tx.pk for tx in rejected]).update(
+            active=False,
+            approved=False,
+            approved_user=None,
+            approved_date=None,
+            rejected=True,
+            rejected_user=user,
+            rejected_date=now,
+            pretranslated=False,
+            fuzzy=False,
+        )
+
+    created = Translation.objects.bulk_create(new_translations)
+    ActionLog.objects.bulk_create(actions)
+
+    add_failed_checks(created)
+    add_translation_memory_entries(project, created)
+
+    translated_resources = {(tx.entity.resource_id, tx.locale_id) for tx in created}
+    TranslatedResource.objects.bulk_create(
+        [
+            TranslatedResource(resource_id=resource_id, locale_id=locale_id)
+            for resource_id, locale_id in translated_resources
+        ],
+        ignore_conflicts=True,
+    )
+    update_stats(project, translated_resources=translated_resources)
+
+    # As in Translation.mark_changed(), only approved translations are synced
+    if project.data_source != Project.DataSource.DATABASE:
+        ChangedEntityLocale.objects.bulk_create(
+            (
+                ChangedEntityLocale(entity=tx.entity, locale=tx.locale, when=now)
+                for tx in created
+                if tx.approved
+            ),
+            ignore_conflicts=True,
+        )
+
+    if project.slug == "terminology":
+        for tx in created:
+            tx.entity.reset_term_translation(tx.locale)
+
+    # All translations are created at the same time, so any one will do
+    # for each translated resource
+    latest = {(tx.entity.resource_id, tx.locale_id): tx for tx in created}
+    for tx in latest.values():
+        tx.update_latest_translation()
 
 
 def get_translation_key(key: str, format: str) -> list | None:
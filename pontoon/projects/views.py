@@ -13,7 +13,8 @@ from pontoon.base.aggregated_stats import get_top_instances
 from pontoon.base.models import (
     Locale,
     Project,
-    TranslatedResource,
+    ProjectLocaleStats,
+    ProjectStats,
     Translation,
 )
 from pontoon.base.services import get_project_or_redirect
@@ -46,7 +47,9 @@ def projects(request):
         "projects/projects.html",
         {
             "projects": projects,
-            "all_projects_stats": TranslatedResource.objects.string_stats(request.user),
+            "all_projects_stats": ProjectStats.objects.filter_projects(
+                request.user
+            ).string_stats(),
             "project_stats": project_stats,
             "top_instances": get_top_instances(projects, project_stats),
         },
@@ -62,20 +65,22 @@ def project(request, slug):
         return project
 
     project_locales = project.project_locale
-    project_tr = TranslatedResource.objects.filter(resource__project=project)
+    project_stats = ProjectLocaleStats.objects.filter(project=project)
 
     # Only include filtered teams if provided
     teams = request.GET.get("teams", "").split(",")
     filtered_locales = Locale.objects.filter(code__in=teams)
     if filtered_locales.exists():
         project_locales = project_locales.filter(locale__in=filtered_locales)
-        project_tr = project_tr.filter(locale__in=filtered_locales)
+        project_stats = project_stats.filter(locale__in=filtered_locales)
 
     return render(
         request,
         "projects/project.html",
         {
-            "project_stats": project_tr.string_stats(count_system_projects=True),
+            "project_stats": project_stats.filter_projects(
+                count_system_projects=True
+            ).string_stats(),
             "count": project_locales.count(),
             "project": project,
             "tags_count": (
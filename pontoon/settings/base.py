@@ -212,6 +212,10 @@ EMAIL_USE_SSL = os.environ.get("EMAIL_USE_SSL", "False") != "False"
 EMAIL_HOST_PASSWORD = os.environ.get(
     "EMAIL_HOST_PASSWORD", os.environ.get("SENDGRID_PASSWORD", "")
 )
+# Bulk emails are sent with one connection per EMAIL_BATCH_SIZE messages,
+# and each message is retried up to EMAIL_SEND_RETRIES times on transient errors.
+EMAIL_BATCH_SIZE = int(os.environ.get("EMAIL_BATCH_SIZE", "100"))
+EMAIL_SEND_RETRIES = int(os.environ.get("EMAIL_SEND_RETRIES", "3"))
 EMAIL_CONSENT_ENABLED = os.environ.get("EMAIL_CONSENT_ENABLED", "False") != "False"
 EMAIL_CONSENT_TITLE = os.environ.get("EMAIL_CONSENT_TITLE", "")
 EMAIL_CONSENT_MAIN_TEXT = os.environ.get("EMAIL_CONSENT_MAIN_TEXT", "")
@@ -792,6 +796,20 @@ VIEW_CACHE_TIMEOUT = 60 * 60 * 24  # 1 day
 # Timeout for external Machinery service cache, in seconds.
 MACHINERY_SERVICE_CACHE_TIMEOUT = 60 * 60 * 24 * 7  # 1 week
 
+# Maximum number of concurrent requests to a machine translation service,
+# when translating a batch of strings, e.g. during pretranslation.
+MACHINERY_BATCH_WORKERS = int(os.environ.get("MACHINERY_BATCH_WORKERS", "4"))
+
+# Number of translation memory entries most similar to a string by trigram
+# distance, for which the exact Levenshtein ratio is calculated.
+# If 0, all entries of a similar length are scored.
+TRANSLATION_MEMORY_CANDIDATES = int(
+    os.environ.get("TRANSLATION_MEMORY_CANDIDATES", "200")
+)
+
+# Maximum size of uploaded translation memory (.TMX) files, in MB.
+TMX_UPLOAD_MAX_SIZE = int(os.environ.get("TMX_UPLOAD_MAX_SIZE", "200"))
+
 # Site ID is used by Django's Sites framework.
 SITE_ID = 1
 
@@ -1078,8 +1096,37 @@ except ValueError:
 
 SYNC_LOG_RETENTION = 90  # days
 
+# Number of workers used for writing translated files to the repository during
+# sync, one file per locale at a time. Files are written serially by default.
+SYNC_WRITE_WORKERS = int(os.environ.get("SYNC_WRITE_WORKERS", "0"))
+
+# The kind of pool used if SYNC_WRITE_WORKERS is greater than one: "thread" or
+# "process". A process pool may not be started from a daemonic process, such as
+# a worker of Celery's default prefork pool.
+SYNC_WRITE_POOL = os.environ.get("SYNC_WRITE_POOL", "thread")
+
 MANUAL_SYNC = os.environ.get("MANUAL_SYNC", "True") != "False"
 
+# Project syncs started by the sync scheduler (the schedule_syncs command or
+# Celery beat task) are spread out over time: a project is due for sync when it
+# has not been synced in SYNC_INTERVAL minutes, and at most SYNC_MAX_CONCURRENT
+# syncs are run at a time. Each sync holds one DB connection.
+SYNC_INTERVAL = int(os.environ.get("SYNC_INTERVAL", "60"))
+SYNC_MAX_CONCURRENT = int(os.environ.get("SYNC_MAX_CONCURRENT", "4"))
+
+# Maximum number of syncs pulling from remote repositories at the same time,
+# or 0 for no limit.
+SYNC_MAX_CONCURRENT_FETCHES = int(os.environ.get("SYNC_MAX_CONCURRENT_FETCHES", "2"))
+
+# Number of worker processes used for running quality checks on large batches of
+# translations. Checks are run serially by default, and always in daemonic
+# processes, such as workers of Celery's default prefork pool.
+CHECKS_WORKERS = int(os.environ.get("CHECKS_WORKERS", "0"))
+
+# Translation downloads are serialized from the local repository checkouts,
+# which are only pulled if they have not been in this many seconds.
+DOWNLOAD_PULL_INTERVAL = int(os.environ.get("DOWNLOAD_PULL_INTERVAL", "300"))
+
 # Celery
 
 # Execute celery tasks locally instead of in a worker unless the
@@ -1102,6 +1149,11 @@ CELERY_TASK_SERIALIZER = "pickle"
 CELERY_RESULT_SERIALIZER = "pickle"
 CELERY_ACCEPT_CONTENT = ["pickle"]
 
+# Periodic tasks, if running `celery beat`
+CELERYBEAT_SCHEDULE = {
+    "schedule-syncs": {"task": "schedule_syncs", "schedule": 60.0},
+}
+
 SOCIALACCOUNT_ADAPTER = "pontoon.base.adapter.PontoonSocialAdapter"
 SOCIALACCOUNT_ONLY = True
 
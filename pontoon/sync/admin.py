@@ -1,11 +1,32 @@
 from django.contrib import admin
+from django.template.defaultfilters import linebreaksbr
 
 from pontoon.sync.models import Sync
+from pontoon.sync.templatetags.helpers import (
+    format_sync_stage_details,
+    format_sync_stages,
+)
 
 
 class SyncAdmin(admin.ModelAdmin):
     search_fields = ("project__slug",)
-    list_display = ("project", "status", "start_time", "end_time", "error")
+    list_display = (
+        "project",
+        "status",
+        "start_time",
+        "end_time",
+        "error",
+        "slowest_stages",
+    )
+    readonly_fields = ("stage_details",)
+
+    @admin.display(description="Slowest stages")
+    def slowest_stages(self, obj: Sync) -> str:
+        return format_sync_stages(obj.stages)
+
+    @admin.display(description="Stage metrics")
+    def stage_details(self, obj: Sync) -> str:
+        return linebreaksbr(format_sync_stage_details(obj.stages))
 
 
 admin.site.register(Sync, SyncAdmin)
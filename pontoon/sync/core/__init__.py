@@ -2,16 +2,19 @@ import logging
 
 from notifications.signals import notify
 
+from django.conf import settings
 from django.utils import timezone
 
 from pontoon.base.models import ChangedEntityLocale, Locale, Project, User
 from pontoon.pretranslation.tasks import pretranslate
 from pontoon.sync.core.checkout import checkout_repos
 from pontoon.sync.core.entities import sync_resources_from_repo
+from pontoon.sync.core.metrics import SyncMetrics
 from pontoon.sync.core.paths import find_paths
 from pontoon.sync.core.stats import update_stats
 from pontoon.sync.core.translations_from_repo import sync_translations_from_repo
 from pontoon.sync.core.translations_to_repo import sync_translations_to_repo
+from pontoon.sync.scheduler import budget_slot
 
 
 log = logging.getLogger(__name__)
@@ -23,18 +26,37 @@ def sync_project(
     pull: bool = True,
     commit: bool = True,
     force: bool = False,
+    metrics: SyncMetrics | None = None,
+    fetch_slot: str | None = None,
 ) -> tuple[bool, bool]:
-    """`(db_changed, repo_changed)`"""
+    """
+    `(db_changed, repo_changed)`
+
+    If set, per-stage `metrics` are collected during the sync.
+    If set, the `fetch_slot` already taken by the scheduler is used
+    for pulling the repositories, and released once that is done.
+    """
     # Mark "now" at the start of sync to avoid messing with
     # translations submitted during sync.
     now = timezone.now()
 
     log_prefix = f"[{project.slug}]"
     log.info(f"{log_prefix} Sync start")
+    if metrics is None:
+        metrics = SyncMetrics(project.slug)
 
     try:
-        checkouts = checkout_repos(project, force=force, pull=pull)
-        paths = find_paths(project, checkouts)
+        with (
+            metrics.stage("checkout"),
+            budget_slot(
+                "fetch",
+                settings.SYNC_MAX_CONCURRENT_FETCHES if pull else 0,
+                key=fetch_slot,
+            ),
+        ):
+            checkouts = checkout_repos(project, force=force, pull=pull)
+        with metrics.stage("find_paths"):
+            paths = find_paths(project, checkouts)
     except Exception as e:
         log.error(f"{log_prefix} {e}")
         raise e
@@ -47,9 +69,10 @@ def sync_project(
         lc.code: lc for lc in project.locales.order_by("code")
     }
     paths.locales = list(locale_map.keys())
-    added_entities_count, changed_paths, removed_paths = sync_resources_from_repo(
-        project, locale_map, checkouts.source, paths, now
-    )
+    with metrics.stage("sync_resources_from_repo"):
+        added_entities_count, changed_paths, removed_paths = sync_resources_from_repo(
+            project, locale_map, checkouts.source, paths, now
+        )
 
     db_changes = ChangedEntityLocale.objects.filter(
         entity__resource__project=project, when__lte=now
@@ -60,11 +83,14 @@ def sync_project(
         # is the source of truth, and re-importing the files (e.g. during a
         # forced sync) would revert newer translations.
         log.info(f"{log_prefix} Skipping translations from read-only repo")
-        del_trans_count, updated_trans_count = 0, 0
+        del_trans_count, updated_trans_count, changed_trs = 0, 0, set()
     else:
-        del_trans_count, updated_trans_count = sync_translations_from_repo(
-            project, locale_map, checkouts, paths, db_changes, now
-        )
+        with metrics.stage("sync_translations_from_repo"):
+            del_trans_count, updated_trans_count, changed_trs = (
+                sync_translations_from_repo(
+                    project, locale_map, checkouts, paths, db_changes, now
+                )
+            )
     db_changed = bool(
         added_entities_count
         or changed_paths
@@ -78,17 +104,18 @@ def sync_project(
         log.info(f"{log_prefix} Skipping commit to read-only repo")
         repo_changed = False
     else:
-        repo_changed = sync_translations_to_repo(
-            project,
-            commit,
-            locale_map,
-            checkouts,
-            paths,
-            db_changes,
-            changed_paths,
-            removed_paths,
-            now,
-        )
+        with metrics.stage("sync_translations_to_repo"):
+            repo_changed = sync_translations_to_repo(
+                project,
+                commit,
+                locale_map,
+                checkouts,
+                paths,
+                db_changes,
+                changed_paths,
+                removed_paths,
+                now,
+            )
     if commit:
         db_changes.delete()
 
@@ -96,12 +123,25 @@ def sync_project(
     if checkouts.target != checkouts.source:
         checkouts.target.repo.last_synced_revision = checkouts.target.commit
     if db_changed:
-        update_stats(project)
+        with metrics.stage("update_stats"):
+            changed_res_ids = (
+                set(
+                    project.resources.filter(
+                        path__in=changed_paths | removed_paths
+                    ).values_list("pk", flat=True)
+                )
+                if changed_paths or removed_paths
+                else set()
+            )
+            update_stats(
+                project, resources=changed_res_ids, translated_resources=changed_trs
+            )
     log.info(f"{log_prefix} Sync done")
 
     if project.pretranslation_enabled and changed_paths:
         # Pretranslate changed and added resources for all locales
-        pretranslate(project, changed_paths)
+        with metrics.stage("pretranslate"):
+            pretranslate(project, changed_paths)
 
     return db_changed, repo_changed
 
@@ -26,6 +26,8 @@ class Checkout:
     """Relative paths from the checkout base"""
     renamed: list[tuple[str, str]]
     """Relative paths (old, new) from the checkout base"""
+    incremental: bool
+    """If set, `changed` and `removed` are based on a diff from `prev_commit`"""
 
     def __init__(
         self,
@@ -60,12 +62,14 @@ class Checkout:
             if not shallow and isinstance(self.prev_commit, str)
             else None
         )
+        self.incremental = False
         if shallow:
             self.changed = []
             self.removed = []
             self.renamed = []
         elif delta is not None and not force:
             self.changed, self.removed, self.renamed = delta
+            self.incremental = True
         else:
             # Initially and on error & when forced, consider all files changed
             log.warning(f"[{slug}] Considering all files as changed")
@@ -79,6 +83,18 @@ class Checkout:
             self.removed = delta[1] if delta else []
             self.renamed = []
 
+    def read_prev(self, rel_path: str) -> bytes | None:
+        """
+        The contents of the file at `rel_path` as of `prev_commit`,
+        or None if not available or if the checkout is not incremental.
+        """
+        if not self.incremental or self.prev_commit is None:
+            return None
+        versioncontrol = get_repo(self.repo.type)
+        return versioncontrol.file_content(
+            self.path, self.prev_commit, rel_path.replace("\\", "/")
+        )
+
 
 class Checkouts(NamedTuple):
     source: Checkout
@@ -12,7 +12,6 @@ from moz.l10n.paths import L10nConfigPaths, L10nDiscoverPaths
 from moz.l10n.resource import parse_resource
 
 from django.db import transaction
-from django.db.models import Q
 
 from pontoon.base.models import (
     Entity,
@@ -22,6 +21,8 @@ from pontoon.base.models import (
     Section,
     TranslatedResource,
 )
+from pontoon.db import UnnestIn
+from pontoon.sync.core import metrics
 from pontoon.sync.core.checkout import Checkout
 from pontoon.sync.formats import as_entity
 
@@ -55,6 +56,7 @@ def sync_resources_from_repo(
                     gettext_skip_obsolete=True,
                     xliff_source_entries=True,
                 )
+                metrics.count("files_parsed")
                 assert res.format
                 try:
                     Resource.Format(res.format.name)
@@ -393,10 +395,9 @@ def update_translated_resources(
                 f"[{project.slug}:{res_path}] Added for translation in: {', '.join(locale_codes)}"
             )
     if prev_tr_keys:
-        del_tr_q = Q()
-        for resource_id, locale_id in prev_tr_keys:
-            del_tr_q |= Q(resource_id=resource_id, locale_id=locale_id)
-        _, del_dict = TranslatedResource.objects.filter(del_tr_q).delete()
+        _, del_dict = TranslatedResource.objects.filter(
+            UnnestIn(("resource", "locale"), prev_tr_keys)
+        ).delete()
         del_count = del_dict.get("base.translatedresource", 0)
         str_tr = "translated resource" if del_count == 1 else "translated resources"
         log.info(f"[{project.slug}] Removed {del_count} {str_tr}")
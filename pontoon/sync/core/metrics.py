@@ -0,0 +1,109 @@
+import logging
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+
+from django.db import connection
+
+
+log = logging.getLogger(__name__)
+
+StageMetrics = dict[str, int | float]
+"""
+- `time`: wall time in seconds, excluding nested stages
+- `queries`: count of database queries
+- `query_time`: database query time in seconds
+- `rows`: count of rows inserted, updated or deleted
+- `files_parsed`, `files_written`: counts of repository files
+"""
+
+_current: ContextVar["_Stage | None"] = ContextVar("sync_stage", default=None)
+
+
+class _Stage:
+    def __init__(self, sync: "SyncMetrics", metrics: StageMetrics) -> None:
+        self.sync = sync
+        self.metrics = metrics
+        self.nested_time = 0.0
+
+    def execute_wrapper(self, execute, sql, params, many, context):
+        if _current.get() is not self:
+            # Counted by a nested stage
+            return execute(sql, params, many, context)
+        start = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.metrics["queries"] += 1
+            self.metrics["query_time"] += perf_counter() - start
+            if sql.lstrip()[:6].upper() in {"INSERT", "UPDATE", "DELETE"}:
+                rowcount = getattr(context["cursor"], "rowcount", -1)
+                if rowcount > 0:
+                    self.metrics["rows"] += rowcount
+
+
+class SyncMetrics:
+    """
+    Per-stage metrics for a project sync,
+    collected using `with metrics.stage(name):` blocks.
+
+    Stages may be nested; each metric is only counted for the innermost stage.
+    """
+
+    def __init__(self, slug: str = "") -> None:
+        self.log_prefix = f"[{slug}]"
+        self.stages: dict[str, StageMetrics] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageMetrics]:
+        metrics = self.stages.setdefault(
+            name,
+            {
+                "time": 0.0,
+                "queries": 0,
+                "query_time": 0.0,
+                "rows": 0,
+                "files_parsed": 0,
+                "files_written": 0,
+            },
+        )
+        parent = _current.get()
+        stage = _Stage(self, metrics)
+        token = _current.set(stage)
+        start = perf_counter()
+        try:
+            with connection.execute_wrapper(stage.execute_wrapper):
+                yield metrics
+        finally:
+            elapsed = perf_counter() - start
+            _current.reset(token)
+            metrics["time"] += elapsed - stage.nested_time
+            if parent is not None:
+                parent.nested_time += elapsed
+            for key in ("time", "query_time"):
+                metrics[key] = round(metrics[key], 3)
+            log.info(
+                f"{self.log_prefix} Sync stage {name}: "
+                + " ".join(f"{key}={value}" for key, value in metrics.items()),
+                extra={"sync_stage": name, "sync_metrics": dict(metrics)},
+            )
+
+
+def count(key: str, n: int = 1) -> None:
+    """Add `n` to the `key` metric of the current sync stage, if any."""
+    stage = _current.get()
+    if stage is not None:
+        stage.metrics[key] += n
+
+
+@contextmanager
+def nested_stage(name: str) -> Iterator[None]:
+    """Collect metrics for a nested stage of the current sync stage, if any."""
+    stage = _current.get()
+    if stage is None:
+        yield
+    else:
+        with stage.sync.stage(name):
+            yield
@@ -1,5 +1,6 @@
 import logging
 
+from collections.abc import Collection
 from textwrap import dedent
 
 from django.db import connection
@@ -10,30 +11,52 @@ from pontoon.base.models import Project
 log = logging.getLogger(__name__)
 
 
-def update_stats(project: Project) -> None:
-    """Uses raw SQL queries for performance."""
+def update_stats(
+    project: Project,
+    *,
+    resources: Collection[int] | None = None,
+    translated_resources: Collection[tuple[int, int]] | None = None,
+) -> None:
+    """
+    Uses raw SQL queries for performance.
+
+    If either of `resources` (resource ids) or `translated_resources`
+    (resource id, locale id) pairs is given, only the stats of those
+    are re-aggregated, together with all translated resources of `resources`
+    and any translated resource with an out-of-date total.
+    Otherwise, the stats of all of the project's resources are updated.
+    """
+
+    full = resources is None and translated_resources is None
+    res_ids = list(resources or ())
+    tr_res_ids = [res_id for res_id, _ in translated_resources or ()]
+    tr_locale_ids = [locale_id for _, locale_id in translated_resources or ()]
 
     with connection.cursor() as cursor:
         # Resources, counted from entities
-        cursor.execute(
-            dedent(
-                """
-                UPDATE base_resource res
-                SET total_strings = agg.total
-                FROM (
-                    SELECT ent.resource_id AS "resource_id", COUNT(*) AS "total"
-                    FROM "base_entity" ent
-                    LEFT OUTER JOIN "base_resource" res ON (ent.resource_id = res.id)
-                    WHERE NOT ent.obsolete AND res.project_id = %s
-                    GROUP BY ent.resource_id
-                ) AS agg
-                WHERE res.id = agg.resource_id AND res.project_id = %s
-                """
-            ),
-            [project.id, project.id],
-        )
+        if full or res_ids:
+            res_filter = "" if full else " AND res.id = ANY(%s)"
+            res_params = [] if full else [res_ids]
+            cursor.execute(
+                dedent(
+                    f"""
+                    UPDATE base_resource res
+                    SET total_strings = agg.total
+                    FROM (
+                        SELECT ent.resource_id AS "resource_id", COUNT(*) AS "total"
+                        FROM "base_entity" ent
+                        LEFT OUTER JOIN "base_resource" res ON (ent.resource_id = res.id)
+                        WHERE NOT ent.obsolete AND res.project_id = %s{res_filter}
+                        GROUP BY ent.resource_id
+                    ) AS agg
+                    WHERE res.id = agg.resource_id AND res.project_id = %s
+                    """
+                ),
+                [project.id, *res_params, project.id],
+            )
 
-        # Translated resources, copied from resources
+        # Translated resources, copied from resources.
+        # Newly added translated resources are caught here by their stale total.
         cursor.execute(
             dedent(
                 """
@@ -41,45 +64,63 @@ def update_stats(project: Project) -> None:
                 SET total_strings = res.total_strings
                 FROM "base_resource" res
                 WHERE tr.resource_id = res.id AND res.project_id = %s
+                    AND tr.total_strings <> res.total_strings
+                RETURNING tr.resource_id, tr.locale_id
                 """
             ),
             [project.id],
         )
+        if not full:
+            for res_id, locale_id in cursor.fetchall():
+                tr_res_ids.append(res_id)
+                tr_locale_ids.append(locale_id)
 
         # Other translated resource string counts, counted directly from translations
-        cursor.execute(
-            dedent(
-                """
-                UPDATE base_translatedresource tr
-                SET
-                    approved_strings = agg.approved,
-                    pretranslated_strings = agg.pretranslated,
-                    strings_with_errors = agg.errors,
-                    strings_with_warnings = agg.warnings,
-                    unreviewed_strings = agg.unreviewed
-                FROM (
-                    SELECT
-                        trans.locale_id AS "locale_id",
-                        ent.resource_id AS "resource_id",
-                        COUNT(DISTINCT trans.id) FILTER (WHERE trans.approved AND err.id IS NULL AND warn.id IS NULL) AS "approved",
-                        COUNT(DISTINCT trans.id) FILTER (WHERE trans.pretranslated AND err.id IS NULL AND warn.id IS NULL) AS "pretranslated",
-                        COUNT(DISTINCT trans.id) FILTER (WHERE (trans.approved OR trans.pretranslated OR trans.fuzzy) AND err.id IS NOT NULL) AS "errors",
-                        COUNT(DISTINCT trans.id) FILTER (WHERE (trans.approved OR trans.pretranslated OR trans.fuzzy) AND warn.id IS NOT NULL) AS "warnings",
-                        COUNT(DISTINCT trans.id) FILTER (WHERE NOT trans.approved AND NOT trans.pretranslated AND NOT trans.rejected AND NOT trans.fuzzy) AS "unreviewed"
-                    FROM "base_translation" trans
-                    LEFT OUTER JOIN "checks_error" err ON (trans.id = err.translation_id)
-                    LEFT OUTER JOIN "checks_warning" warn ON (trans.id = warn.translation_id)
-                    LEFT OUTER JOIN "base_entity" ent ON (trans.entity_id = ent.id)
-                    LEFT OUTER JOIN "base_resource" res ON (ent.resource_id = res.id)
-                    WHERE NOT ent.obsolete AND res.project_id = %s
-                    GROUP BY trans.locale_id, ent.resource_id
-                ) AS agg
-                WHERE agg.locale_id = tr.locale_id AND agg.resource_id = tr.resource_id
-                """
-            ),
-            [project.id],
-        )
-        tr_count = cursor.rowcount
+        if full:
+            trans_filter = ""
+            trans_params = []
+        else:
+            trans_filter = (
+                " AND (ent.resource_id = ANY(%s) OR (ent.resource_id, trans.locale_id)"
+                " IN (SELECT * FROM unnest(%s::integer[], %s::integer[])))"
+            )
+            trans_params = [res_ids, tr_res_ids, tr_locale_ids]
+        if full or res_ids or tr_res_ids:
+            cursor.execute(
+                dedent(
+                    f"""
+                    UPDATE base_translatedresource tr
+                    SET
+                        approved_strings = agg.approved,
+                        pretranslated_strings = agg.pretranslated,
+                        strings_with_errors = agg.errors,
+                        strings_with_warnings = agg.warnings,
+                        unreviewed_strings = agg.unreviewed
+                    FROM (
+                        SELECT
+                            trans.locale_id AS "locale_id",
+                            ent.resource_id AS "resource_id",
+                            COUNT(DISTINCT trans.id) FILTER (WHERE trans.approved AND err.id IS NULL AND warn.id IS NULL) AS "approved",
+                            COUNT(DISTINCT trans.id) FILTER (WHERE trans.pretranslated AND err.id IS NULL AND warn.id IS NULL) AS "pretranslated",
+                            COUNT(DISTINCT trans.id) FILTER (WHERE (trans.approved OR trans.pretranslated OR trans.fuzzy) AND err.id IS NOT NULL) AS "errors",
+                            COUNT(DISTINCT trans.id) FILTER (WHERE (trans.approved OR trans.pretranslated OR trans.fuzzy) AND warn.id IS NOT NULL) AS "warnings",
+                            COUNT(DISTINCT trans.id) FILTER (WHERE NOT trans.approved AND NOT trans.pretranslated AND NOT trans.rejected AND NOT trans.fuzzy) AS "unreviewed"
+                        FROM "base_translation" trans
+                        LEFT OUTER JOIN "checks_error" err ON (trans.id = err.translation_id)
+                        LEFT OUTER JOIN "checks_warning" warn ON (trans.id = warn.translation_id)
+                        LEFT OUTER JOIN "base_entity" ent ON (trans.entity_id = ent.id)
+                        LEFT OUTER JOIN "base_resource" res ON (ent.resource_id = res.id)
+                        WHERE NOT ent.obsolete AND res.project_id = %s{trans_filter}
+                        GROUP BY trans.locale_id, ent.resource_id
+                    ) AS agg
+                    WHERE agg.locale_id = tr.locale_id AND agg.resource_id = tr.resource_id
+                    """
+                ),
+                [project.id, *trans_params],
+            )
+            tr_count = cursor.rowcount
+        else:
+            tr_count = 0
 
     tr_str = (
         "1 translated resource" if tr_count == 1 else f"{tr_count} translated resources"
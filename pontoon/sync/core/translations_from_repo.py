@@ -4,6 +4,7 @@ from collections import defaultdict
 from collections.abc import Iterable, Sized
 from datetime import datetime
 from os.path import join, relpath, splitext
+from typing import Any
 
 from fluent.syntax import FluentParser
 from moz.l10n.formats import l10n_extensions
@@ -31,6 +32,8 @@ from pontoon.base.models import (
 )
 from pontoon.checks import DB_FORMATS
 from pontoon.checks.utils import bulk_run_checks
+from pontoon.db import UnnestIn
+from pontoon.sync.core import metrics
 from pontoon.sync.core.checkout import Checkout, Checkouts
 from pontoon.sync.core.paths import UploadPaths
 from pontoon.sync.formats import RepoTranslation, as_repo_translations
@@ -49,8 +52,12 @@ def sync_translations_from_repo(
     paths: L10nConfigPaths | L10nDiscoverPaths,
     db_changes: QuerySet[ChangedEntityLocale, ChangedEntityLocale],
     now: datetime,
-) -> tuple[int, int]:
-    """(removed_resource_count, updated_translation_count)"""
+) -> tuple[int, int, set[tuple[int, int]]]:
+    """
+    `(removed_resource_count, updated_translation_count, changed_translated_resources)`
+
+    The changed translated resources are `(resource.id, locale.id)` pairs.
+    """
     co = checkouts.target
     source_paths: set[str] = set(paths.ref_paths) if checkouts.source == co else set()
     del_count = delete_removed_gettext_resources(project, co, paths, source_paths)
@@ -65,23 +72,36 @@ def sync_translations_from_repo(
         str_files = "file" if n == 1 else "files"
         log.info(f"[{project.slug}] Reading changes from {n} target {str_files}")
     updates = find_db_updates(
-        project, locale_map, changed_target_paths, paths, db_changes
+        project, locale_map, changed_target_paths, paths, db_changes, co
     )
     update_count = 0 if updates is None else len(updates)
-    if updates:
-        write_db_updates(project, updates, None, now)
-    return del_count, update_count
+    changed_trs = write_db_updates(project, updates, None, now) if updates else set()
+    return del_count, update_count, changed_trs
 
 
 def write_db_updates(
     project: Project, updates: Updates, user: User | None, now: datetime
-) -> None:
+) -> set[tuple[int, int]]:
+    """Returns the `(resource.id, locale.id)` pairs of the updated translations."""
+    # update_db_translations() removes the approved suggestions from `updates`
+    updated_keys = set(updates)
     updated_translations, new_translations = update_db_translations(
         project, updates, user, now
     )
     add_failed_checks(new_translations)
     add_translation_memory_entries(project, new_translations + updated_translations)
 
+    resource_ids = dict(
+        Entity.objects.filter(
+            UnnestIn(("pk",), {(entity_id,) for entity_id, _ in updated_keys})
+        ).values_list("pk", "resource_id")
+    )
+    return {
+        (resource_ids[entity_id], locale_id)
+        for entity_id, locale_id in updated_keys
+        if entity_id in resource_ids
+    }
+
 
 def delete_removed_gettext_resources(
     project: Project,
@@ -89,9 +109,8 @@ def delete_removed_gettext_resources(
     paths: L10nConfigPaths | L10nDiscoverPaths,
     source_paths: set[str],
 ) -> int:
-    rm_t = Q()
-    rm_tr = Q()
-    count = 0
+    # (db_path, locale.code)
+    removed: list[tuple[str, str]] = []
     removed_target_paths = (
         path
         for path in (join(target.path, co_path) for co_path in target.removed)
@@ -106,18 +125,17 @@ def delete_removed_gettext_resources(
                 db_path = relpath(ref_path, paths.ref_root)
                 if not project.configuration_file and db_path.endswith(".pot"):
                     db_path = db_path[:-1]
-                rm_t |= Q(entity__resource__path=db_path, locale__code=locale_code)
-                rm_tr |= Q(resource__path=db_path, locale__code=locale_code)
-                count += 1
-    if rm_t and rm_tr:
+                removed.append((db_path, locale_code))
+    count = len(removed)
+    if removed:
         str_del_resources = "deleted resource" if count == 1 else "deleted resources"
         log.info(f"[{project.slug}] Removing {count} {str_del_resources}")
         with transaction.atomic():
             Translation.objects.filter(entity__resource__project=project).filter(
-                rm_t
+                UnnestIn(("entity__resource__path", "locale__code"), removed)
             ).delete()
             TranslatedResource.objects.filter(resource__project=project).filter(
-                rm_tr
+                UnnestIn(("resource__path", "locale__code"), removed)
             ).delete()
     return count
 
@@ -128,6 +146,7 @@ def find_db_updates(
     changed_target_paths: Iterable[str],
     paths: L10nConfigPaths | L10nDiscoverPaths | UploadPaths,
     db_changes: Iterable[ChangedEntityLocale],
+    checkout: Checkout | None = None,
 ) -> Updates | None:
     """
     `(entity.id, locale.id) -> RepoTranslation`
@@ -136,11 +155,17 @@ def find_db_updates(
     - Exact matches with previous approved or pretranslated translations
     - Entity/Locale combos for which Pontoon has changes since the last sync
     - Translations for which no matching entity is found
+
+    If the previous revision of a changed file is available from `checkout`,
+    only the entries that differ between the revisions are compared
+    with the database.
     """
     log.debug(f"[{project.slug}] Scanning for translation updates...")
     resource_paths: set[str] = set()
-    # db_path -> {locale.id}
+    # db_path -> {locale.id}, for resources compared in full
     translated_resources: dict[str, set[int]] = defaultdict(set)
+    # (db_path, locale.id) -> {tx.key}, for resources compared by changed entries
+    changed_keys: dict[tuple[str, int], set[L10nId]] = {}
     # (db_path, tx.key, locale.id) -> RepoTranslation|None
     translations: dict[tuple[str, L10nId, int], RepoTranslation | None] = {}
     for target_path in changed_target_paths:
@@ -151,30 +176,55 @@ def find_db_updates(
             if lc in locale_map:
                 locale = locale_map[lc]
                 db_path = relpath(ref_path, paths.ref_root)
+                parse_options = {
+                    "gettext_plurals": locale.cldr_plurals_list(),
+                    "gettext_skip_obsolete": True,
+                }
                 try:
-                    l10n_res = parse_resource(
-                        target_path,
-                        gettext_plurals=locale.cldr_plurals_list(),
-                        gettext_skip_obsolete=True,
-                    )
+                    l10n_res = parse_resource(target_path, **parse_options)
+                    metrics.count("files_parsed")
                     if not project.configuration_file and db_path.endswith(".pot"):
                         db_path = db_path[:-1]
-                    resource_paths.add(db_path)
-                    translated_resources[db_path].add(locale.pk)
-                    translations.update(
-                        ((db_path, rt.key, locale.pk), rt)
-                        for rt in as_repo_translations(l10n_res)
-                    )
+                    repo_translations = {
+                        rt.key: rt for rt in as_repo_translations(l10n_res)
+                    }
                 except Exception as error:
                     scope = f"[{project.slug}:{db_path}, {locale.code}]"
                     log.warning(f"{scope} Skipping resource with parse error: {error}")
+                    continue
+                resource_paths.add(db_path)
+                prev_translations = (
+                    get_prev_translations(checkout, target_path, parse_options)
+                    if checkout is not None
+                    else None
+                )
+                if prev_translations is None:
+                    translated_resources[db_path].add(locale.pk)
+                    translations.update(
+                        ((db_path, key, locale.pk), rt)
+                        for key, rt in repo_translations.items()
+                    )
+                else:
+                    keys = {
+                        key
+                        for key, rt in repo_translations.items()
+                        if prev_translations.get(key, None) != (rt.string, rt.fuzzy)
+                    }
+                    keys.update(prev_translations.keys() - repo_translations.keys())
+                    if keys:
+                        changed_keys[(db_path, locale.pk)] = keys
+                        translations.update(
+                            ((db_path, key, locale.pk), repo_translations[key])
+                            for key in keys
+                            if key in repo_translations
+                        )
         elif splitext(target_path)[1] in l10n_extensions and not isinstance(
             paths, UploadPaths
         ):
             log.debug(
                 f"[{project.slug}:{relpath(target_path, paths.base)}] Not an L10n target path"
             )
-    if not translations:
+    if not translations and not changed_keys:
         return None
 
     resources: dict[str, Resource] = {
@@ -183,14 +233,46 @@ def find_db_updates(
         .filter(project=project, path__in=resource_paths)
         .iterator()
     }
+    # (db_path, tx.key) -> entity.id, loaded for resources as needed
+    entities: dict[tuple[str, L10nId], int] = {}
+    entities_loaded: set[str] = set()
+
+    def load_entities(db_paths: set[str]) -> None:
+        db_paths = {path for path in db_paths if path in resources} - entities_loaded
+        if db_paths:
+            entities.update(
+                ((e["resource__path"], tuple(e["key"])), e["id"])
+                for e in Entity.objects.filter(
+                    resource__in=[resources[path] for path in db_paths],
+                    obsolete=False,
+                )
+                .values("id", "key", "resource__path")
+                .iterator()
+            )
+            entities_loaded.update(db_paths)
 
     # Exclude translations for which DB & repo already match
-    # TODO: Should be able to use repo diff to identify changed entities and refactor this.
     trans_q = Q()
-    for db_path, locale_ids in translated_resources.items():
-        res = resources.get(db_path, None)
-        if res is not None:
-            trans_q |= Q(entity__resource=res, locale_id__in=locale_ids)
+    full_resources = [
+        (resources[db_path].pk, locale_id)
+        for db_path, locale_ids in translated_resources.items()
+        if db_path in resources
+        for locale_id in locale_ids
+    ]
+    if full_resources:
+        trans_q |= Q(UnnestIn(("entity__resource", "locale"), full_resources))
+    load_entities({db_path for db_path, _ in changed_keys})
+    changed_entities = [
+        (resources[db_path].pk, locale_id, entities[(db_path, key)])
+        for (db_path, locale_id), keys in changed_keys.items()
+        if db_path in resources
+        for key in keys
+        if (db_path, key) in entities
+    ]
+    if changed_entities:
+        trans_q |= Q(
+            UnnestIn(("entity__resource", "locale", "entity"), changed_entities)
+        )
     if trans_q:
         log.debug(f"[{project.slug}] Filtering matches from translations...")
         trans_query = (
@@ -249,15 +331,7 @@ def find_db_updates(
         return None
 
     log.debug(f"[{project.slug}] Compiling updates...")
-    trans_res = {
-        resources[db_path] for db_path, _, _ in translations if db_path in resources
-    }
-    entities: dict[tuple[str, L10nId], int] = {
-        (e["resource__path"], tuple(e["key"])): e["id"]
-        for e in Entity.objects.filter(resource__in=trans_res, obsolete=False)
-        .values("id", "key", "resource__path")
-        .iterator()
-    }
+    load_entities({db_path for db_path, _, _ in translations})
     updates: Updates = {}
     for (db_path, ent_key, locale_id), rt in translations.items():
         entity_id = entities.get((db_path, ent_key), None)
@@ -267,6 +341,25 @@ def find_db_updates(
     return updates
 
 
+def get_prev_translations(
+    checkout: Checkout, target_path: str, parse_options: dict[str, Any]
+) -> dict[L10nId, tuple[str, bool]] | None:
+    """
+    `tx.key -> (string, fuzzy)` for the translations in `target_path`
+    as of the previous sync, or None if those are not available.
+    """
+    prev_source = checkout.read_prev(relpath(target_path, checkout.path))
+    if prev_source is None:
+        return None
+    try:
+        prev_res = parse_resource(target_path, prev_source, **parse_options)
+        metrics.count("files_parsed")
+    except Exception as error:
+        log.debug(f"[{target_path}] Parse error in previous revision: {error}")
+        return None
+    return {rt.key: (rt.string, rt.fuzzy) for rt in as_repo_translations(prev_res)}
+
+
 def translations_equal(
     project: Project, db_path: str, format: str, a: object, b: object
 ) -> bool:
@@ -297,30 +390,32 @@ def update_db_translations(
     log.debug(f"{scope} Syncing translations from repo...")
 
     log_user = user or User.objects.get(username="pontoon-sync")
-    translations_to_reject = Q()
+    # (entity_id, locale_id)
+    translations_to_reject: list[tuple[int, int]] = []
     actions: list[ActionLog] = []
 
     # Approve matching suggestions
-    matching_suggestions_q = Q()
+    # (entity_id, locale_id, string)
+    matching_suggestions: list[tuple[int, int, str]] = []
     repo_rm_count = 0
     for (entity_id, locale_id), rt in repo_translations.items():
         if rt is None:
             # The translation has been removed from the repo
-            translations_to_reject |= Q(entity_id=entity_id, locale_id=locale_id)
+            translations_to_reject.append((entity_id, locale_id))
             repo_rm_count += 1
         else:
-            matching_suggestions_q |= Q(
-                entity_id=entity_id, locale_id=locale_id, string=rt.string
-            )
+            matching_suggestions.append((entity_id, locale_id, rt.string))
     # (entity_id, locale_id) => translation
     suggestions: dict[tuple[int, int], Translation] = (
         {
             (tx.entity_id, tx.locale_id): tx
-            for tx in Translation.objects.filter(matching_suggestions_q)
+            for tx in Translation.objects.filter(
+                UnnestIn(("entity", "locale", "string"), matching_suggestions)
+            )
             .filter(approved=False, pretranslated=False)
             .iterator()
         }
-        if matching_suggestions_q
+        if matching_suggestions
         else {}
     )
     update_fields: set[str] = set()
@@ -362,7 +457,7 @@ def update_db_translations(
                 )
             )
             approve_count += 1
-        translations_to_reject |= Q(entity=tx.entity, locale=tx.locale) & ~Q(id=tx.id)
+        translations_to_reject.append((tx.entity_id, tx.locale_id))
         update_fields.update(tx.get_dirty_fields())
     for entity_id, locale_id in suggestions:
         try:
@@ -404,11 +499,15 @@ def update_db_translations(
                         translation=tx,
                     )
                 )
-                translations_to_reject |= Q(entity_id=entity_id, locale_id=locale_id)
+                translations_to_reject.append((entity_id, locale_id))
 
     if translations_to_reject:
-        rejected = Translation.objects.filter(rejected=False).filter(
-            translations_to_reject
+        # Approved suggestions are not rejected,
+        # but other translations of the same entity & locale are.
+        rejected = (
+            Translation.objects.filter(rejected=False)
+            .filter(UnnestIn(("entity", "locale"), translations_to_reject))
+            .exclude(id__in=[tx.id for tx in suggestions.values()])
         )
         actions.extend(
             ActionLog(
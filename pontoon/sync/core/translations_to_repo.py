@@ -1,9 +1,16 @@
 import logging
+import pickle
 
 from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from os import makedirs, remove
+from functools import lru_cache
+from multiprocessing import get_context
+from os import makedirs, remove, stat
 from os.path import commonpath, dirname, isfile, join, normpath
+from typing import NamedTuple
 
 from moz.l10n.formats import Format
 from moz.l10n.message import parse_message
@@ -20,12 +27,15 @@ from moz.l10n.model import (
 from moz.l10n.paths import L10nConfigPaths, L10nDiscoverPaths
 from moz.l10n.resource import parse_resource, serialize_resource
 
+import django
+
 from django.conf import settings
 from django.db.models import Q
 from django.db.models.query import QuerySet
 
 from pontoon.base.models import Locale, Project, Translation, User
 from pontoon.base.models.changed_entity_locale import ChangedEntityLocale
+from pontoon.sync.core import metrics
 from pontoon.sync.core.checkout import Checkouts
 from pontoon.sync.repositories import CommitToRepositoryException, get_repo
 
@@ -57,6 +67,39 @@ ios_locale_map = {
     "zgh": "tzm",
 }
 
+TranslationIndex = dict[tuple[str, ...], Translation]
+"""Active translations of one resource into one locale, by entity key."""
+
+
+@lru_cache(maxsize=64)
+def _pickled_template(path: str, mtime_ns: int, size: int) -> bytes:
+    return pickle.dumps(parse_resource(path), pickle.HIGHEST_PROTOCOL)
+
+
+def parse_template(path: str) -> Resource:
+    """
+    Parse the reference resource at `path`.
+
+    Parsed resources are cached by path, modification time and size,
+    and each call returns a new copy that may be modified freely.
+    Unpickling the cached copy is much cheaper than parsing the file again,
+    especially for Fluent resources.
+    """
+    st = stat(path)
+    return pickle.loads(_pickled_template(path, st.st_mtime_ns, st.st_size))
+
+
+def index_translations(translations: Iterable[Translation]) -> TranslationIndex:
+    """
+    Index `translations` by their entity key.
+
+    If more than one translation has the same key, the first one is used.
+    """
+    index: TranslationIndex = {}
+    for tx in translations:
+        index.setdefault(tuple(tx.entity.key), tx)
+    return index
+
 
 def sync_translations_to_repo(
     project: Project,
@@ -110,12 +153,13 @@ def sync_translations_to_repo(
 
     co = checkouts.target
     repo = get_repo(co.repo.type)
-    try:
-        repo.commit(co.path, commit_msg, commit_author, co.repo.branch, co.url)
-        co.commit = repo.revision(co.path)
-    except CommitToRepositoryException as error:
-        log.warning(f"[{project.slug}] {co.repo.type} commit failed: {error}")
-        raise error
+    with metrics.nested_stage("commit"):
+        try:
+            repo.commit(co.path, commit_msg, commit_author, co.repo.branch, co.url)
+            co.commit = repo.revision(co.path)
+        except CommitToRepositoryException as error:
+            log.warning(f"[{project.slug}] {co.repo.type} commit failed: {error}")
+            raise error
 
     return True
 
@@ -140,6 +184,7 @@ def delete_removed_resources(
                 try:
                     remove(target_path)
                     count += 1
+                    metrics.count("files_written")
                 except FileNotFoundError:
                     pass
         else:
@@ -177,8 +222,8 @@ def update_changed_resources(
         str_resources = "resource" if n == 1 else "resources"
         log.info(f"[{project.slug}] Updating {n} changed {str_resources}")
 
-    updated_locales: set[Locale] = set()
-    translators: dict[User, set[str]] = defaultdict(set)
+    # db_path -> (target, ref_path, {Locale})
+    resource_targets: dict[str, tuple[str, str, set[Locale]]] = {}
     for path, locales_ in changed_resources.items():
         log_scope = f"[{project.slug}:{path}]"
         target, locale_codes = paths.target(path)
@@ -207,54 +252,139 @@ def update_changed_resources(
             log.info(f"{log_scope} Updating locales: {lc_str}")
         else:
             log.info(f"{log_scope} Updating all locales")
+        resource_targets[path] = (target, ref_path, locales)
 
-        translations = (
-            Translation.objects.filter(
-                entity__obsolete=False,
-                entity__resource__project_id=project.pk,
-                entity__resource__path=path,
-                locale__in=[locale.pk for locale in locales],
-                active=True,
-            )
-            .filter(
-                Q(approved=True)
-                | Q(pretranslated=True, warnings__isnull=True)
-                | Q(fuzzy=True)
-            )
-            .exclude(approved_date__gt=now)  # includes approved_date = None
-            .select_related("entity")
-        )
+    translations = get_resource_translations(project, resource_targets, now)
+    updates: list[LocaleUpdate] = []
+    for path, (target, ref_path, locales) in resource_targets.items():
         for locale in locales:
-            lc_scope = f"[{project.slug}:{path}, {locale.code}]"
-            lc_translations = [tx for tx in translations if tx.locale_id == locale.pk]
+            lc_translations = translations.get((path, locale.pk), {})
             target_path = paths.format_target_path(target, locale.code)
             if not lc_translations and not isfile(target_path):
                 continue
-            try:
-                lc_plurals = locale.cldr_plurals_list()
-                res = parse_resource(ref_path)
-                set_translations(locale, lc_translations, res)
-                makedirs(dirname(target_path), exist_ok=True)
-                with open(target_path, "w", encoding="utf-8") as file:
-                    for line in serialize_resource(res, gettext_plurals=lc_plurals):
-                        file.write(line)
-                updated_locales.add(locale)
-                for tx in lc_translations:
-                    if tx.approved and tx.entity in changed_entities and tx.user:
-                        translators[tx.user].add(locale.code)
-                count += 1
-            except Exception as error:
+            updates.append(
+                LocaleUpdate(path, locale, lc_translations, ref_path, target_path)
+            )
+
+    updated_locales: set[Locale] = set()
+    translators: dict[User, set[str]] = defaultdict(set)
+    with translation_writer() as map_:
+        for update, error in zip(updates, map_(write_translations, updates)):
+            if error is not None:
+                lc_scope = f"[{project.slug}:{update.path}, {update.locale.code}]"
                 log.error(f"{lc_scope} Update failed: {error}")
                 continue
+            updated_locales.add(update.locale)
+            for tx in update.translations.values():
+                if tx.approved and tx.entity in changed_entities and tx.user:
+                    translators[tx.user].add(update.locale.code)
+            count += 1
+            metrics.count("files_written")
     return count, updated_locales, translators
 
 
+def get_resource_translations(
+    project: Project,
+    resource_targets: dict[str, tuple[str, str, set[Locale]]],
+    now: datetime,
+) -> dict[tuple[str, int], TranslationIndex]:
+    """
+    Get the translations to write for each of the `resource_targets`,
+    indexed by `(path, locale_id)` and entity key.
+
+    All translations are streamed from one query,
+    which includes all locales for all the paths;
+    the rows for paths and locales that are not being updated are dropped.
+    """
+    if not resource_targets:
+        return {}
+    locale_pks = {
+        path: {locale.pk for locale in locales}
+        for path, (_, _, locales) in resource_targets.items()
+    }
+    resource_paths: dict[int, str] = dict(
+        project.resources.filter(path__in=list(locale_pks)).values_list("pk", "path")
+    )
+    translations: dict[tuple[str, int], TranslationIndex] = defaultdict(dict)
+    for tx in (
+        Translation.objects.filter(
+            entity__obsolete=False,
+            entity__resource_id__in=list(resource_paths),
+            locale__in=set().union(*locale_pks.values()),
+            active=True,
+        )
+        .filter(
+            Q(approved=True)
+            | Q(pretranslated=True, warnings__isnull=True)
+            | Q(fuzzy=True)
+        )
+        .exclude(approved_date__gt=now)  # includes approved_date = None
+        .select_related("entity")
+        .iterator()
+    ):
+        path = resource_paths[tx.entity.resource_id]
+        if tx.locale_id in locale_pks[path]:
+            translations[path, tx.locale_id].setdefault(tuple(tx.entity.key), tx)
+    return translations
+
+
+class LocaleUpdate(NamedTuple):
+    path: str
+    locale: Locale
+    translations: TranslationIndex
+    ref_path: str
+    target_path: str
+
+
+@contextmanager
+def translation_writer() -> Iterator[Callable[..., Iterator[str | None]]]:
+    """
+    Provides a `map()` function for running `write_translations()`.
+
+    Depending on the SYNC_WRITE_WORKERS and SYNC_WRITE_POOL settings,
+    this runs the writes serially, in a thread pool, or in a process pool.
+    Process pool workers are spawned rather than forked,
+    so that they do not share the parent's database connections.
+    """
+    workers = settings.SYNC_WRITE_WORKERS
+    if workers < 2:
+        yield map
+    elif settings.SYNC_WRITE_POOL == "process":
+        with ProcessPoolExecutor(
+            workers, mp_context=get_context("spawn"), initializer=django.setup
+        ) as executor:
+            yield executor.map
+    else:
+        with ThreadPoolExecutor(workers) as executor:
+            yield executor.map
+
+
+def write_translations(update: LocaleUpdate) -> str | None:
+    """
+    Write the translations of one resource into one locale to its target path.
+
+    Does not access the database.
+    On failure, returns the error message rather than raising it.
+    """
+    try:
+        lc_plurals = update.locale.cldr_plurals_list()
+        res = parse_template(update.ref_path)
+        set_translations(update.locale, update.translations, res)
+        makedirs(dirname(update.target_path), exist_ok=True)
+        with open(update.target_path, "w", encoding="utf-8") as file:
+            for line in serialize_resource(res, gettext_plurals=lc_plurals):
+                file.write(line)
+    except Exception as error:
+        return str(error)
+    return None
+
+
 def set_translations(
-    locale: Locale, translations: list[Translation], res: Resource
+    locale: Locale, translations: TranslationIndex, res: Resource
 ) -> None:
     if res.format == Format.fluent:
         trans_res = parse_resource(
-            Format.fluent, "".join(tx.string for tx in translations)
+            Format.fluent, "".join(tx.string for tx in translations.values())
         )
         trans_entries: dict[Id, Entry | None] = {
             entry.id: entry
@@ -329,13 +459,12 @@ def set_translations(
 
 
 def set_translation(
-    translations: list[Translation],
+    translations: TranslationIndex,
     format: Format | None,
     section: Section,
     entry: Entry,
 ) -> bool:
-    key = list(section.id + entry.id)
-    tx = next((tx for tx in translations if tx.entity.key == key), None)
+    tx = translations.get(section.id + entry.id, None)
     if tx is None:
         if format == Format.gettext:
             if isinstance(entry.value, SelectMessage):
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from pontoon.sync.scheduler import schedule_syncs
+
+
+class Command(BaseCommand):
+    help = """
+        Start syncs for the projects that are due for one,
+        ordered by staleness and the duration of their recent syncs,
+        within the budget of settings.SYNC_MAX_CONCURRENT concurrent syncs.
+
+        Intended to be run frequently, e.g. once a minute.
+        """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            dest="dry_run",
+            default=False,
+            help="List the projects that would be synced, without syncing them",
+        )
+
+    def handle(self, *args, **options):
+        projects = schedule_syncs(dry_run=options["dry_run"])
+        verb = "Would schedule" if options["dry_run"] else "Scheduled"
+        for project in projects:
+            self.stdout.write(f"{verb} sync for project {project.name}.")
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.14 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("sync", "0005_remove_old_sync_log"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sync",
+            name="stages",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -19,14 +19,16 @@ class Sync(models.Model):
     start_time = models.DateTimeField(default=timezone.now)
     end_time = models.DateTimeField(default=None, blank=True, null=True)
     error = models.TextField(default="")
+    stages = models.JSONField(default=dict, blank=True)
+    """Per-stage metrics, see `pontoon.sync.core.metrics`"""
 
     def done(self, status: Status = Status.DONE) -> None:
         self.status = status
         self.end_time = timezone.now()
-        self.save(update_fields=["status", "end_time"])
+        self.save(update_fields=["status", "end_time", "stages"])
 
     def fail(self, error: str) -> None:
         self.status = Sync.Status.FAIL
         self.error = error
         self.end_time = timezone.now()
-        self.save(update_fields=["status", "error", "end_time"])
+        self.save(update_fields=["status", "error", "end_time", "stages"])
@@ -144,3 +144,14 @@ def changed_files(
             log.warning(f"Git: Failed to parse diff line: {line}")
             return None
     return changed, removed, renamed
+
+
+def file_content(path: str, revision: str, file_path: str) -> bytes | None:
+    """
+    The contents of `file_path` at `revision`, or None if not available.
+
+    `file_path` is relative to the repository root at `path`.
+    """
+    cmd = ["git", "show", f"{revision}:{file_path}"]
+    code, output, _ = execute(cmd, path)
+    return output if code == 0 else None
@@ -71,3 +71,16 @@ def changed_files(
             elif line.startswith("R"):
                 removed.append(line.split(None, 2)[1])
     return changed, removed, []
+
+
+def file_content(path: str, revision: str, file_path: str) -> bytes | None:
+    """
+    The contents of `file_path` at `revision`, or None if not available.
+
+    `file_path` is relative to the repository root at `path`.
+    """
+    # Ignore trailing + in revision number. It marks local changes.
+    rev = revision.rstrip("+")
+    cmd = ["hg", "cat", f"--rev={rev}", file_path]
+    code, output, _ = execute(cmd, path)
+    return output if code == 0 else None
@@ -0,0 +1,192 @@
+"""
+Scheduling of project syncs within a concurrency budget.
+
+Rather than starting a sync for every project at once,
+`schedule_syncs()` is run frequently (e.g. every minute),
+and each time starts syncs only for the projects that are due,
+as long as fewer than `settings.SYNC_MAX_CONCURRENT` syncs are running.
+A slot of the `settings.SYNC_MAX_CONCURRENT_FETCHES` budget is also taken
+for each started sync, and released once its repositories are fetched,
+so that a sync never waits for a fetch slot while holding a sync slot.
+
+Running syncs are tracked with cache keys acting as semaphore slots,
+which are released when the sync task completes,
+or expire after `settings.SYNC_TASK_TIMEOUT`.
+"""
+
+import logging
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from time import monotonic, sleep
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Avg, DurationField, F, Max, Q
+from django.utils import timezone
+
+from pontoon.base.models import Project
+from pontoon.sync.models import Sync
+
+
+log = logging.getLogger(__name__)
+
+
+class SyncCandidate(NamedTuple):
+    project: Project
+    last_sync: datetime | None
+    cost: timedelta
+    """Average duration of the project's recent syncs"""
+
+
+def slot_keys(name: str, size: int) -> list[str]:
+    return [f"sync_slot_{name}_{idx}" for idx in range(size)]
+
+
+def acquire_slot(name: str, size: int, value: object = True) -> str | None:
+    """
+    Claim one of `size` slots named by `name`, holding `value`.
+    Returns the slot's cache key, or None if all slots are taken.
+    """
+    for key in slot_keys(name, size):
+        if cache.add(key, value, timeout=settings.SYNC_TASK_TIMEOUT):
+            return key
+    return None
+
+
+def release_slot(key: str) -> None:
+    cache.delete(key)
+
+
+@contextmanager
+def budget_slot(
+    name: str,
+    size: int,
+    *,
+    key: str | None = None,
+    poll: float = 1.0,
+    wait: float | None = None,
+) -> Iterator[None]:
+    """
+    Wait for a free slot of the `name` budget, holding it for the duration.
+
+    If a slot `key` of the budget is already held, it is used without waiting.
+    If `size` is 0, the budget is unlimited.
+    If no slot is available within `wait` seconds
+    (by default, `settings.SYNC_TASK_TIMEOUT`),
+    continue without one rather than failing the sync.
+    """
+    if key is None:
+        if size < 1:
+            yield
+            return
+        if wait is None:
+            wait = settings.SYNC_TASK_TIMEOUT
+        deadline = monotonic() + wait
+        key = acquire_slot(name, size)
+        while key is None and monotonic() < deadline:
+            sleep(poll)
+            key = acquire_slot(name, size)
+        if key is None:
+            log.warning(f"Timed out waiting for a {name} slot")
+    try:
+        yield
+    finally:
+        if key is not None:
+            release_slot(key)
+
+
+def get_sync_candidates(now: datetime) -> list[SyncCandidate]:
+    """
+    Syncable projects that have not been synced in `settings.SYNC_INTERVAL`,
+    ordered by staleness, with never-synced projects first.
+    Projects that are equally stale are ordered by increasing cost,
+    so that large projects do not hold back the small ones.
+    """
+    interval = timedelta(minutes=settings.SYNC_INTERVAL)
+    projects = Project.objects.syncable()
+    history = {
+        row["project"]: row
+        for row in Sync.objects.filter(project__in=projects)
+        .values("project")
+        .annotate(
+            last_sync=Max("start_time"),
+            cost=Avg(
+                F("end_time") - F("start_time"),
+                filter=Q(start_time__gte=now - timedelta(days=7)),
+                output_field=DurationField(),
+            ),
+        )
+    }
+    candidates: list[SyncCandidate] = []
+    for project in projects:
+        row = history.get(project.pk, {})
+        last_sync = row.get("last_sync")
+        if last_sync is not None and now - last_sync < interval:
+            continue
+        cost = row.get("cost") or timedelta(0)
+        candidates.append(SyncCandidate(project, last_sync, cost))
+
+    # Staleness is rounded to whole intervals, to allow for ordering by cost.
+    def sort_key(c: SyncCandidate) -> tuple[float, timedelta]:
+        if c.last_sync is None:
+            return (float("-inf"), c.cost)
+        return (-((now - c.last_sync) // interval), c.cost)
+
+    return sorted(candidates, key=sort_key)
+
+
+def schedule_syncs(*, dry_run: bool = False) -> list[Project]:
+    """
+    Start syncs for due projects, within the free slots of the sync budget.
+
+    Returns the projects for which a sync was started,
+    or with `dry_run` would have been started.
+    """
+    # Avoid circular import
+    from pontoon.sync.tasks import sync_project_task
+
+    candidates = get_sync_candidates(timezone.now())
+    size = settings.SYNC_MAX_CONCURRENT
+    fetch_size = settings.SYNC_MAX_CONCURRENT_FETCHES
+    queued = set(cache.get_many(slot_keys("sync", size)).values())
+    free_fetches = fetch_size - len(cache.get_many(slot_keys("fetch", fetch_size)))
+    started: list[Project] = []
+    for candidate in candidates:
+        project = candidate.project
+        if project.pk in queued or cache.get(f"sync_{project.pk}"):
+            # Previous sync still queued or running
+            continue
+        if dry_run:
+            if len(started) + len(queued) >= size or (
+                fetch_size and len(started) >= free_fetches
+            ):
+                break
+            started.append(project)
+            continue
+        # The fetch slot is taken first, as it is held for a shorter time.
+        fetch_slot = acquire_slot("fetch", fetch_size) if fetch_size else None
+        if fetch_size and fetch_slot is None:
+            break
+        slot = acquire_slot("sync", size, project.pk)
+        if slot is None:
+            if fetch_slot is not None:
+                release_slot(fetch_slot)
+            break
+        log.info(f"[{project.slug}] Scheduling sync")
+        try:
+            sync_project_task.delay(project.pk, slot=slot, fetch_slot=fetch_slot)
+        except Exception:
+            release_slot(slot)
+            if fetch_slot is not None:
+                release_slot(fetch_slot)
+            raise
+        started.append(project)
+
+    log.info(
+        f"Scheduled {len(started)} of {len(candidates)} due project syncs"
+        + (" (dry run)" if dry_run else "")
+    )
+    return started
@@ -8,7 +8,9 @@ from django.core.cache import cache
 from pontoon.base.models import Project
 from pontoon.base.tasks import PontoonTask
 from pontoon.sync.core import sync_project
+from pontoon.sync.core.metrics import SyncMetrics
 from pontoon.sync.models import Sync
+from pontoon.sync.scheduler import release_slot, schedule_syncs
 
 
 log = logging.getLogger(__name__)
@@ -20,11 +22,31 @@ def sync_project_task(
     pull: bool = True,
     commit: bool = True,
     force: bool = False,
+    slot: str | None = None,
+    fetch_slot: str | None = None,
+):
+    """
+    If set, the `slot` of the sync budget taken by the scheduler is released
+    when the task completes.
+    If set, the `fetch_slot` taken by the scheduler is released
+    once the repositories are fetched, or if the sync does not start.
+    """
+    try:
+        _sync_project(project_pk, pull, commit, force, fetch_slot)
+    finally:
+        if slot is not None:
+            release_slot(slot)
+
+
+def _sync_project(
+    project_pk: int, pull: bool, commit: bool, force: bool, fetch_slot: str | None
 ):
     try:
         project = Project.objects.get(pk=project_pk)
     except Project.DoesNotExist:
         log.error(f"[id={project_pk}] Sync aborted: Project not found.")
+        if fetch_slot is not None:
+            release_slot(fetch_slot)
         raise
 
     if not force:
@@ -42,12 +64,21 @@ def sync_project_task(
     lock_name = f"sync_{project_pk}"
     if not cache.add(lock_name, True, timeout=settings.SYNC_TASK_TIMEOUT):
         sync.done(Sync.Status.PREV_BUSY)
+        if fetch_slot is not None:
+            release_slot(fetch_slot)
         raise RuntimeError(
             f"[{project.slug}] Sync aborted: Previous sync still running."
         )
+    metrics = SyncMetrics(project.slug)
+    sync.stages = metrics.stages
     try:
         db_changed, repo_changed = sync_project(
-            project, pull=pull, commit=commit, force=force
+            project,
+            pull=pull,
+            commit=commit,
+            force=force,
+            metrics=metrics,
+            fetch_slot=fetch_slot,
         )
         if not db_changed and not repo_changed:
             status = Sync.Status.NO_CHANGES
@@ -66,3 +97,8 @@ def sync_project_task(
     finally:
         # release the lock
         cache.delete(lock_name)
+
+
+@shared_task(base=PontoonTask, name="schedule_syncs")
+def schedule_syncs_task():
+    schedule_syncs()
@@ -26,6 +26,25 @@ def format_sync_duration(
         return f"{td.microseconds // 1000 + seconds * 1000} ms"
 
 
+@library.global_function
+def format_sync_stages(stages: dict[str, dict[str, int | float]], top: int = 3) -> str:
+    """The `top` stages by wall time, e.g. `checkout 1.2 s (5 queries)`"""
+    slowest = sorted(stages.items(), key=lambda item: item[1]["time"], reverse=True)
+    return ", ".join(
+        f"{name} {metrics['time']:.1f} s ({metrics['queries']} queries)"
+        for name, metrics in slowest[:top]
+    )
+
+
+@library.global_function
+def format_sync_stage_details(stages: dict[str, dict[str, int | float]]) -> str:
+    """One line per stage, listing all of its metrics."""
+    return "\n".join(
+        f"{name}: " + ", ".join(f"{key}={value}" for key, value in metrics.items())
+        for name, metrics in stages.items()
+    )
+
+
 @library.global_function
 def format_sync_status_class(status: Sync.Status | None) -> str:
     match status:
@@ -37,6 +37,9 @@ class MockVersionControl:
         self._calls.append(("changed_files", args))
         return self._changes
 
+    def file_content(self, *args):
+        return None
+
 
 class CheckoutsTests(TestCase):
     def test_no_changes_with_prev_commit(self):
@@ -58,6 +61,7 @@ class CheckoutsTests(TestCase):
             assert co.path == "/foo/bar"
             assert co.prev_commit == "def456"
             assert co.commit == "abc123"
+            assert co.incremental
             assert not co.changed
             assert not co.removed
             assert mock_vcs._calls == [
@@ -102,6 +106,7 @@ class CheckoutsTests(TestCase):
                 co = Checkout("SLUG", mock_repo)
                 assert co.path == root
                 assert co.prev_commit is None
+                assert not co.incremental
                 assert not co.removed
                 assert sorted(co.changed) == [
                     "en-US/bar.ftl",
@@ -142,6 +142,19 @@ def test_kitchen_sink():
                 file.read()
                 == "key-0 = New translation de 0\n# New entry comment\nkey-2 = New translation de 2\n"
             )
+        stages = Sync.objects.get(project=project).stages
+        assert set(stages) == {
+            "checkout",
+            "find_paths",
+            "sync_resources_from_repo",
+            "sync_translations_from_repo",
+            "sync_translations_to_repo",
+            "commit",
+            "update_stats",
+        }
+        assert stages["sync_resources_from_repo"]["files_parsed"] == 1
+        assert stages["sync_translations_to_repo"]["files_written"] == 2
+        assert stages["update_stats"]["queries"] > 0
         with open(join(repo_tgt.checkout_path, "fr-Test", "c.ftl")) as file:
             assert (
                 file.read()
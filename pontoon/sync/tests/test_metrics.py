@@ -0,0 +1,51 @@
+import logging
+
+from pontoon.sync.core import metrics
+from pontoon.sync.core.metrics import SyncMetrics
+from pontoon.sync.templatetags.helpers import format_sync_stages
+
+
+def test_sync_metrics_nested(caplog):
+    sync_metrics = SyncMetrics("test-project")
+    with caplog.at_level(logging.INFO, logger="pontoon.sync.core.metrics"):
+        with sync_metrics.stage("outer"):
+            metrics.count("files_parsed", 2)
+            with metrics.nested_stage("inner"):
+                metrics.count("files_written")
+            metrics.count("files_written", 3)
+
+    assert list(sync_metrics.stages) == ["outer", "inner"]
+    outer, inner = sync_metrics.stages["outer"], sync_metrics.stages["inner"]
+    assert (outer["files_parsed"], outer["files_written"]) == (2, 3)
+    assert (inner["files_parsed"], inner["files_written"]) == (0, 1)
+    assert [rec.sync_stage for rec in caplog.records] == ["inner", "outer"]
+    assert (
+        caplog.records[1]
+        .getMessage()
+        .startswith("[test-project] Sync stage outer: time=")
+    )
+
+
+def test_sync_metrics_no_stage():
+    # Outside of a sync stage, these do nothing
+    metrics.count("files_parsed")
+    with metrics.nested_stage("commit"):
+        pass
+
+
+def test_format_sync_stages():
+    def stage(time: float, queries: int):
+        return {"time": time, "queries": queries}
+
+    stages = {
+        "checkout": stage(1.25, 2),
+        "find_paths": stage(0.01, 0),
+        "sync_translations_to_repo": stage(30.0, 400),
+        "update_stats": stage(2.0, 3),
+    }
+    assert format_sync_stages(stages) == (
+        "sync_translations_to_repo 30.0 s (400 queries), "
+        "update_stats 2.0 s (3 queries), "
+        "checkout 1.2 s (2 queries)"
+    )
+    assert format_sync_stages({}) == ""
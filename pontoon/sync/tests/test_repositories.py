@@ -101,3 +101,25 @@ class HgChangedFilesTest(VCSChangedFilesTests, TestCase):
         R removed_file2.properties
         """
     ).encode()
+
+
+class VCSFileContentTests(TestCase):
+    @patch("subprocess.Popen")
+    def test_git_file_content(self, mock_popen):
+        attrs = {"communicate.return_value": (b"content", None), "returncode": 0}
+        mock_popen.return_value = Mock(**attrs)
+        assert get_repo("git").file_content("/path", "abc", "fr/a.ftl") == b"content"
+        assert mock_popen.call_args[0][0] == ["git", "show", "abc:fr/a.ftl"]
+
+    @patch("subprocess.Popen")
+    def test_hg_file_content(self, mock_popen):
+        attrs = {"communicate.return_value": (b"content", None), "returncode": 0}
+        mock_popen.return_value = Mock(**attrs)
+        assert get_repo("hg").file_content("/path", "abc+", "fr/a.ftl") == b"content"
+        assert mock_popen.call_args[0][0] == ["hg", "cat", "--rev=abc", "fr/a.ftl"]
+
+    @patch("subprocess.Popen")
+    def test_file_content_error(self, mock_popen):
+        attrs = {"communicate.return_value": (b"", b"error"), "returncode": 128}
+        mock_popen.return_value = Mock(**attrs)
+        assert get_repo("git").file_content("/path", "abc", "fr/a.ftl") is None
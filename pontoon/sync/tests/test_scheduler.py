@@ -0,0 +1,131 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from pontoon.base.tests import ProjectFactory
+from pontoon.sync.models import Sync
+from pontoon.sync.scheduler import (
+    acquire_slot,
+    budget_slot,
+    get_sync_candidates,
+    release_slot,
+    schedule_syncs,
+    slot_keys,
+)
+
+
+@pytest.fixture
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def test_acquire_slot(clear_cache):
+    a = acquire_slot("test", 2)
+    b = acquire_slot("test", 2)
+    assert a and b and a != b
+    assert acquire_slot("test", 2) is None
+    release_slot(a)
+    assert acquire_slot("test", 2) == a
+
+
+def test_budget_slot(clear_cache):
+    with budget_slot("test", 1):
+        assert acquire_slot("test", 1) is None
+        # Continues without a slot after the timeout
+        with budget_slot("test", 1, poll=0, wait=0):
+            pass
+    assert acquire_slot("test", 1) is not None
+
+    # No limit
+    with budget_slot("test", 0):
+        pass
+
+    # A slot that is already held is released on exit
+    key = acquire_slot("test", 1)
+    with budget_slot("test", 1, key=key, poll=0, wait=0):
+        assert acquire_slot("test", 1) is None
+    assert acquire_slot("test", 1) == key
+
+
+def create_sync(project, minutes_ago: int, duration: int):
+    start = timezone.now() - timedelta(minutes=minutes_ago)
+    Sync.objects.create(
+        project=project,
+        status=Sync.Status.DONE,
+        start_time=start,
+        end_time=start + timedelta(seconds=duration),
+    )
+
+
+@pytest.mark.django_db
+def test_get_sync_candidates(settings):
+    settings.SYNC_INTERVAL = 60
+    recent = ProjectFactory.create(slug="recent")
+    never = ProjectFactory.create(slug="never")
+    stale_cheap = ProjectFactory.create(slug="stale-cheap")
+    stale_costly = ProjectFactory.create(slug="stale-costly")
+    very_stale = ProjectFactory.create(slug="very-stale")
+    ProjectFactory.create(slug="disabled", sync_disabled=True)
+    create_sync(recent, 10, 10)
+    create_sync(stale_cheap, 70, 10)
+    create_sync(stale_costly, 80, 300)
+    create_sync(stale_costly, 200, 500)
+    create_sync(very_stale, 200, 600)
+
+    candidates = get_sync_candidates(timezone.now())
+    assert [c.project for c in candidates] == [
+        never,
+        very_stale,
+        stale_cheap,
+        stale_costly,
+    ]
+    assert candidates[3].cost == timedelta(seconds=400)
+
+
+@pytest.mark.django_db
+def test_schedule_syncs(clear_cache, settings):
+    settings.SYNC_MAX_CONCURRENT = 2
+    settings.SYNC_MAX_CONCURRENT_FETCHES = 0
+    projects = [ProjectFactory.create() for _ in range(3)]
+
+    with patch("pontoon.sync.tasks.sync_project_task") as mock_task:
+        assert len(schedule_syncs(dry_run=True)) == 2
+        assert not mock_task.delay.called
+
+        started = schedule_syncs()
+        assert len(started) == 2
+        assert mock_task.delay.call_count == 2
+
+        # All slots are taken by queued syncs
+        assert schedule_syncs() == []
+
+        # A released slot is filled by the remaining project
+        release_slot(mock_task.delay.call_args_list[0].kwargs["slot"])
+        assert schedule_syncs() == [
+            next(project for project in projects if project not in started)
+        ]
+
+
+@pytest.mark.django_db
+def test_schedule_syncs_fetch_slots(clear_cache, settings):
+    settings.SYNC_MAX_CONCURRENT = 3
+    settings.SYNC_MAX_CONCURRENT_FETCHES = 1
+    ProjectFactory.create_batch(2)
+
+    with patch("pontoon.sync.tasks.sync_project_task") as mock_task:
+        assert len(schedule_syncs(dry_run=True)) == 1
+        assert len(schedule_syncs()) == 1
+
+        # The sync slot is not taken while no fetch slot is free
+        assert schedule_syncs() == []
+        assert len(cache.get_many(slot_keys("sync", 3))) == 1
+
+        # A fetch slot is released once the repos are fetched
+        release_slot(mock_task.delay.call_args.kwargs["fetch_slot"])
+        assert len(schedule_syncs()) == 1
@@ -0,0 +1,66 @@
+import pytest
+
+from pontoon.base.models import TranslatedResource
+from pontoon.base.tests import (
+    EntityFactory,
+    LocaleFactory,
+    ProjectFactory,
+    ResourceFactory,
+    TranslatedResourceFactory,
+    TranslationFactory,
+)
+from pontoon.sync.core.stats import update_stats
+
+
+@pytest.mark.django_db
+def test_update_stats_scoped():
+    locale_a = LocaleFactory.create(code="fr-Test")
+    locale_b = LocaleFactory.create(code="de-Test")
+    project = ProjectFactory.create(
+        name="test-stats", locales=[locale_a, locale_b], visibility="public"
+    )
+    res = {}
+    for id in ["a", "b", "c"]:
+        res[id] = ResourceFactory.create(
+            project=project, path=f"{id}.ftl", total_strings=0
+        )
+        entities = [EntityFactory.create(resource=res[id]) for _ in range(2)]
+        for locale in [locale_a, locale_b]:
+            TranslatedResourceFactory.create(locale=locale, resource=res[id])
+            for entity in entities:
+                TranslationFactory.create(entity=entity, locale=locale, approved=True)
+
+    def stats():
+        return {
+            (t.resource.path, t.locale.code): (t.total_strings, t.approved_strings)
+            for t in TranslatedResource.objects.filter(resource__project=project)
+        }
+
+    update_stats(project, resources=[res["a"].pk])
+    assert stats() == {
+        ("a.ftl", "fr-Test"): (2, 2),
+        ("a.ftl", "de-Test"): (2, 2),
+        ("b.ftl", "fr-Test"): (0, 0),
+        ("b.ftl", "de-Test"): (0, 0),
+        ("c.ftl", "fr-Test"): (0, 0),
+        ("c.ftl", "de-Test"): (0, 0),
+    }
+
+    # Only the given translated resource is recounted
+    # when its resource's total is unchanged.
+    res["b"].total_strings = 2
+    res["b"].save()
+    TranslatedResource.objects.filter(resource=res["b"]).update(total_strings=2)
+    update_stats(project, translated_resources=[(res["b"].pk, locale_b.pk)])
+    assert stats()["b.ftl", "fr-Test"] == (2, 0)
+    assert stats()["b.ftl", "de-Test"] == (2, 2)
+
+    # A translated resource with a stale total is always recounted.
+    res["c"].total_strings = 2
+    res["c"].save()
+    update_stats(project, resources=[], translated_resources=[])
+    assert stats()["c.ftl", "fr-Test"] == (2, 2)
+    assert stats()["c.ftl", "de-Test"] == (2, 2)
+
+    update_stats(project)
+    assert set(stats().values()) == {(2, 2)}
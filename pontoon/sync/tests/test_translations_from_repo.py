@@ -112,10 +112,13 @@ def test_update_ftl_translations():
         paths = find_paths(project, checkouts)
 
         # Test sync
-        removed_resources, updated_translations = sync_translations_from_repo(
-            project, locale_map, checkouts, paths, cast(Any, []), now
+        removed_resources, updated_translations, changed_trs = (
+            sync_translations_from_repo(
+                project, locale_map, checkouts, paths, cast(Any, []), now
+            )
         )
         assert (removed_resources, updated_translations) == (0, 3)
+        assert changed_trs == {(res["c"].pk, locale.pk)}
         translations = Translation.objects.filter(
             entity__resource=res["c"], locale=locale
         )
@@ -155,6 +158,147 @@ def test_update_ftl_translations():
         }
 
 
+@pytest.mark.django_db
+def test_update_ftl_translations_incremental():
+    with TemporaryDirectory() as root:
+        # Database setup
+        settings.MEDIA_ROOT = root
+        locale = LocaleFactory.create(code="fr-Test")
+        locale_map = {locale.code: locale}
+        repo = RepositoryFactory(url="http://example.com/repo")
+        project = ProjectFactory.create(
+            name="test-update-incr",
+            locales=[locale],
+            repositories=[repo],
+            visibility="public",
+        )
+        res = ResourceFactory.create(
+            project=project, path="a.ftl", format="fluent", total_strings=3
+        )
+        TranslatedResourceFactory.create(locale=locale, resource=res, total_strings=3)
+        for i in [0, 1, 2]:
+            key = f"key-{i}"
+            entity = EntityFactory.create(
+                resource=res, string=f"{key} = Message {i}\n", key=[key]
+            )
+            TranslationFactory.create(
+                entity=entity,
+                locale=locale,
+                string=f"{key} = Pontoon translation {i}\n",
+                active=True,
+                approved=True,
+            )
+
+        # Filesystem setup
+        prev_ftl = dedent(
+            """
+            key-0 = Translation 0
+            key-1 = Translation 1
+            key-2 = Translation 2
+            """
+        )
+        a_ftl = dedent(
+            """
+            key-0 = Translation 0
+            key-1 = New translation 1
+            """
+        )
+        makedirs(repo.checkout_path)
+        build_file_tree(
+            repo.checkout_path,
+            {"en-US": {"a.ftl": ""}, "fr-Test": {"a.ftl": a_ftl}},
+        )
+
+        # Paths setup
+        mock_checkout = Mock(
+            Checkout,
+            path=repo.checkout_path,
+            changed=[join("fr-Test", "a.ftl")],
+            removed=[],
+        )
+        mock_checkout.read_prev.return_value = prev_ftl.encode()
+        checkouts = Checkouts(mock_checkout, mock_checkout)
+        paths = find_paths(project, checkouts)
+
+        # Test sync: key-0 is unchanged in the repo, so it's not compared
+        removed_resources, updated_translations, _ = sync_translations_from_repo(
+            project, locale_map, checkouts, paths, cast(Any, []), now
+        )
+        assert (removed_resources, updated_translations) == (0, 2)
+        mock_checkout.read_prev.assert_called_once_with(join("fr-Test", "a.ftl"))
+        translations = Translation.objects.filter(entity__resource=res, locale=locale)
+        assert {
+            (trans.string, trans.approved, trans.rejected) for trans in translations
+        } == {
+            ("key-0 = Pontoon translation 0\n", True, False),
+            ("key-1 = Pontoon translation 1\n", False, True),
+            ("key-1 = New translation 1\n", True, False),
+            ("key-2 = Pontoon translation 2\n", False, True),
+        }
+
+
+@pytest.mark.django_db
+def test_approve_matching_suggestion_stats():
+    with TemporaryDirectory() as root:
+        # Database setup
+        settings.MEDIA_ROOT = root
+        locale = LocaleFactory.create(code="fr-Test")
+        locale_map = {locale.code: locale}
+        repo = RepositoryFactory(url="http://example.com/repo")
+        project = ProjectFactory.create(
+            name="test-approve-suggestion",
+            locales=[locale],
+            repositories=[repo],
+            visibility="public",
+        )
+        res = ResourceFactory.create(
+            project=project, path="a.ftl", format="fluent", total_strings=1
+        )
+        TranslatedResourceFactory.create(
+            locale=locale, resource=res, total_strings=1, unreviewed_strings=1
+        )
+        entity = EntityFactory.create(
+            resource=res, string="key-0 = Message 0\n", key=["key-0"]
+        )
+        suggestion = TranslationFactory.create(
+            entity=entity, locale=locale, string="key-0 = Translation 0\n"
+        )
+
+        # Filesystem setup
+        makedirs(repo.checkout_path)
+        build_file_tree(
+            repo.checkout_path,
+            {
+                "en-US": {"a.ftl": ""},
+                "fr-Test": {"a.ftl": "key-0 = Translation 0\n"},
+            },
+        )
+
+        # Paths setup
+        mock_checkout = Mock(
+            Checkout,
+            path=repo.checkout_path,
+            changed=[join("fr-Test", "a.ftl")],
+            removed=[],
+        )
+        mock_checkout.read_prev.return_value = None
+        checkouts = Checkouts(mock_checkout, mock_checkout)
+        paths = find_paths(project, checkouts)
+
+        # Test sync: the suggestion is approved, and its stats are updated
+        _, updated_translations, changed_trs = sync_translations_from_repo(
+            project, locale_map, checkouts, paths, cast(Any, []), now
+        )
+        assert updated_translations == 1
+        assert changed_trs == {(res.id, locale.id)}
+        suggestion.refresh_from_db()
+        assert suggestion.approved
+
+        update_stats(project, translated_resources=changed_trs)
+        tr = TranslatedResource.objects.get(resource=res, locale=locale)
+        assert (tr.approved_strings, tr.unreviewed_strings) == (1, 0)
+
+
 @pytest.mark.django_db
 def test_android_translation_changes():
     with TemporaryDirectory() as root:
@@ -243,7 +387,7 @@ def test_android_translation_changes():
         paths = find_paths(project, checkouts)
 
         # Test sync
-        removed_resources, updated_translations = sync_translations_from_repo(
+        removed_resources, updated_translations, _ = sync_translations_from_repo(
             project, locale_map, checkouts, paths, cast(Any, []), now
         )
         assert (removed_resources, updated_translations) == (0, 2)
@@ -336,7 +480,7 @@ def test_ini_translations():
         paths = find_paths(project, checkouts)
 
         # Test sync
-        removed_resources, updated_translations = sync_translations_from_repo(
+        removed_resources, updated_translations, _ = sync_translations_from_repo(
             project, locale_map, checkouts, paths, cast(Any, []), now
         )
         assert (removed_resources, updated_translations) == (0, 0)
@@ -401,7 +545,7 @@ def test_remove_po_target_resource():
         paths = find_paths(project, checkouts)
 
         # Test sync
-        removed_resources, updated_translations = sync_translations_from_repo(
+        removed_resources, updated_translations, _ = sync_translations_from_repo(
             project, locale_map, checkouts, paths, cast(Any, []), now
         )
         assert (removed_resources, updated_translations) == (1, 0)
@@ -10,7 +10,7 @@ import pytest
 from django.conf import settings
 from django.utils import timezone
 
-from pontoon.base.models import ChangedEntityLocale
+from pontoon.base.models import ChangedEntityLocale, Entity, Locale, Translation
 from pontoon.base.tests import (
     EntityFactory,
     LocaleFactory,
@@ -22,7 +22,15 @@ from pontoon.base.tests import (
 )
 from pontoon.sync.core.checkout import Checkout, Checkouts
 from pontoon.sync.core.paths import find_paths
-from pontoon.sync.core.translations_to_repo import sync_translations_to_repo
+from pontoon.sync.core.translations_to_repo import (
+    LocaleUpdate,
+    get_resource_translations,
+    index_translations,
+    parse_template,
+    sync_translations_to_repo,
+    translation_writer,
+    write_translations,
+)
 from pontoon.sync.tests.utils import build_file_tree
 
 
@@ -369,3 +377,97 @@ def test_directory_creation_on_translation_update():
         assert exists(target_path), (
             "Expected translated file to be created in nested directories."
         )
+
+
+def test_index_translations():
+    entity_a = Entity(key=["a"])
+    entity_b = Entity(key=["section", "b"])
+    tx_a0 = Translation(entity=entity_a, string="A0")
+    tx_a1 = Translation(entity=entity_a, string="A1")
+    tx_b = Translation(entity=entity_b, string="B")
+    index = index_translations([tx_a0, tx_b, tx_a1])
+    assert index == {("a",): tx_a0, ("section", "b"): tx_b}
+
+
+def test_parse_template():
+    with TemporaryDirectory() as root:
+        path = join(root, "a.ftl")
+        with open(path, "w") as file:
+            file.write("key-0 = Message 0\n")
+        res_0 = parse_template(path)
+        res_1 = parse_template(path)
+        assert res_0 == res_1
+        assert res_0 is not res_1
+
+        # Returned copies are independent of each other
+        res_0.sections[0].entries.clear()
+        assert len(parse_template(path).sections[0].entries) == 1
+
+        # Changes to the file are picked up
+        with open(path, "w") as file:
+            file.write("key-0 = Message 0\nkey-1 = Message 1\n")
+        assert len(parse_template(path).sections[0].entries) == 2
+
+
+@pytest.mark.parametrize("workers,pool", [(0, "thread"), (2, "thread"), (2, "process")])
+def test_translation_writer(settings, workers, pool):
+    settings.SYNC_WRITE_WORKERS = workers
+    settings.SYNC_WRITE_POOL = pool
+    with TemporaryDirectory() as root:
+        ref_path = join(root, "en-US", "a.ftl")
+        build_file_tree(
+            root, {"en-US": {"a.ftl": "key-0 = Message 0\nkey-1 = Message 1\n"}}
+        )
+        entity = Entity(key=["key-0"])
+        updates = [
+            LocaleUpdate(
+                "a.ftl",
+                Locale(code=code),
+                index_translations(
+                    [Translation(entity=entity, string=f"key-0 = {code} 0\n")]
+                ),
+                ref_path,
+                join(root, code, "a.ftl"),
+            )
+            for code in ("de", "fr")
+        ]
+        updates.append(updates[0]._replace(ref_path=join(root, "missing.ftl")))
+        with translation_writer() as map_:
+            errors = list(map_(write_translations, updates))
+        assert errors[:2] == [None, None]
+        assert errors[2] is not None
+        for code in ("de", "fr"):
+            with open(join(root, code, "a.ftl")) as file:
+                assert file.read() == f"key-0 = {code} 0\n"
+
+
+@pytest.mark.django_db
+def test_get_resource_translations(django_assert_num_queries):
+    locale_a = LocaleFactory.create(code="fr-Test")
+    locale_b = LocaleFactory.create(code="de-Test")
+    project = ProjectFactory.create(name="test-get-trans", locales=[locale_a, locale_b])
+    for path in ("a.ftl", "b.ftl", "c.ftl"):
+        res = ResourceFactory.create(project=project, path=path, format="fluent")
+        entity = EntityFactory.create(resource=res, key=["key"], string="key = Msg\n")
+        for locale in (locale_a, locale_b):
+            TranslationFactory.create(
+                entity=entity,
+                locale=locale,
+                string=f"key = {path} {locale.code}\n",
+                active=True,
+                approved=True,
+            )
+
+    resource_targets = {
+        "a.ftl": ("", "", {locale_a, locale_b}),
+        "b.ftl": ("", "", {locale_b}),
+    }
+    with django_assert_num_queries(2):
+        translations = get_resource_translations(project, resource_targets, now)
+    assert set(translations) == {
+        ("a.ftl", locale_a.pk),
+        ("a.ftl", locale_b.pk),
+        ("b.ftl", locale_b.pk),
+    }
+    tx = translations["b.ftl", locale_b.pk][("key",)]
+    assert tx.string == "key = b.ftl de-Test\n"
@@ -8,6 +8,7 @@ import pytest
 
 from django.conf import settings
 
+from pontoon.base.models import Translation
 from pontoon.base.tests import (
     EntityFactory,
     LocaleFactory,
@@ -17,6 +18,7 @@ from pontoon.base.tests import (
     TranslatedResourceFactory,
     TranslationFactory,
 )
+from pontoon.sync.core import translations_to_repo
 from pontoon.sync.tests.test_checkouts import MockVersionControl
 from pontoon.sync.tests.utils import build_file_tree
 from pontoon.sync.utils import serialize_locale
@@ -185,3 +187,145 @@ def test_serialize_locale_rejects_path_traversal():
         # The escaping resource is skipped; its contents never leak.
         assert all("TOP-SECRET" not in content for content in files.values())
         assert all("secret.ftl" not in path for path in files)
+
+
+@pytest.mark.django_db
+def test_serialize_locale_cache():
+    vcs = MockVersionControl()
+    with (
+        TemporaryDirectory() as root,
+        patch("pontoon.sync.core.checkout.get_repo", return_value=vcs),
+    ):
+        settings.MEDIA_ROOT = root
+        locale = LocaleFactory.create(code="fr-Test")
+        repo = RepositoryFactory(url="http://example.com/repo")
+        project = ProjectFactory.create(
+            name="test-serialize-cache", locales=[locale], repositories=[repo]
+        )
+        res_ftl = ResourceFactory.create(project=project, path="a.ftl", format="fluent")
+        TranslatedResourceFactory.create(locale=locale, resource=res_ftl)
+        entity = EntityFactory.create(
+            resource=res_ftl, key=["key-0"], string="key-0 = Message 0\n"
+        )
+        translation = TranslationFactory.create(
+            entity=entity,
+            locale=locale,
+            string="key-0 = Traduction 0\n",
+            active=True,
+            approved=True,
+        )
+        makedirs(repo.checkout_path)
+        build_file_tree(
+            repo.checkout_path,
+            {"en-US": {"a.ftl": "key-0 = Message 0\n"}, "fr-Test": {"a.ftl": ""}},
+        )
+
+        def pulls():
+            return sum(1 for call, _ in vcs._calls if call == "update")
+
+        assert dict(serialize_locale(project, locale)) == {
+            "fr-Test/a.ftl": "key-0 = Traduction 0\n"
+        }
+        assert pulls() == 1
+
+        # Served from the cache, without pulling or parsing again
+        with patch("pontoon.sync.utils.parse_template") as parse_template:
+            assert dict(serialize_locale(project, locale)) == {
+                "fr-Test/a.ftl": "key-0 = Traduction 0\n"
+            }
+        assert not parse_template.called
+        assert pulls() == 1
+
+        # A changed translation is serialized again
+        Translation.objects.filter(pk=translation.pk).update(active=False)
+        TranslationFactory.create(
+            entity=entity,
+            locale=locale,
+            string="key-0 = Nouvelle traduction 0\n",
+            active=True,
+            approved=True,
+        )
+        assert dict(serialize_locale(project, locale)) == {
+            "fr-Test/a.ftl": "key-0 = Nouvelle traduction 0\n"
+        }
+        assert pulls() == 1
+
+        # Content too large for the cache is serialized again each time
+        Translation.objects.filter(entity=entity).update(active=False)
+        TranslationFactory.create(
+            entity=entity,
+            locale=locale,
+            string="key-0 = Traduction trop longue 0\n",
+            active=True,
+            approved=True,
+        )
+        with patch("pontoon.sync.utils.SERIALIZE_CACHE_MAX_SIZE", 10):
+            assert dict(serialize_locale(project, locale)) == {
+                "fr-Test/a.ftl": "key-0 = Traduction trop longue 0\n"
+            }
+        with patch(
+            "pontoon.sync.utils.parse_template",
+            wraps=translations_to_repo.parse_template,
+        ) as parse:
+            assert dict(serialize_locale(project, locale)) == {
+                "fr-Test/a.ftl": "key-0 = Traduction trop longue 0\n"
+            }
+        assert parse.called
+
+
+@pytest.mark.django_db
+def test_serialize_locale_many_resources():
+    with (
+        TemporaryDirectory() as root,
+        patch(
+            "pontoon.sync.core.checkout.get_repo",
+            return_value=MockVersionControl(),
+        ),
+    ):
+        settings.MEDIA_ROOT = root
+        locale = LocaleFactory.create(code="fr-Test")
+        repo = RepositoryFactory(url="http://example.com/repo")
+        project = ProjectFactory.create(
+            name="test-serialize-many", locales=[locale], repositories=[repo]
+        )
+        ref_files = {}
+        translations = {}
+        for name in ["a", "b", "c", "d"]:
+            resource = ResourceFactory.create(
+                project=project, path=f"{name}.ftl", format="fluent"
+            )
+            TranslatedResourceFactory.create(locale=locale, resource=resource)
+            ref_files[f"{name}.ftl"] = f"{name} = Message {name}\n"
+            entity = EntityFactory.create(
+                resource=resource, key=[name], string=f"{name} = Message {name}\n"
+            )
+            if name != "a":
+                translations[name] = TranslationFactory.create(
+                    entity=entity,
+                    locale=locale,
+                    string=f"{name} = Traduction {name}\n",
+                    active=True,
+                    approved=True,
+                )
+        makedirs(repo.checkout_path)
+        build_file_tree(
+            repo.checkout_path,
+            {"en-US": ref_files, "fr-Test": {name: "" for name in ref_files}},
+        )
+
+        assert list(serialize_locale(project, locale)) == [
+            ("fr-Test/a.ftl", ""),
+            ("fr-Test/b.ftl", "b = Traduction b\n"),
+            ("fr-Test/c.ftl", "c = Traduction c\n"),
+            ("fr-Test/d.ftl", "d = Traduction d\n"),
+        ]
+
+        # Only the changed resource is serialized again
+        translations["c"].approved = False
+        translations["c"].save()
+        assert list(serialize_locale(project, locale)) == [
+            ("fr-Test/a.ftl", ""),
+            ("fr-Test/b.ftl", "b = Traduction b\n"),
+            ("fr-Test/c.ftl", ""),
+            ("fr-Test/d.ftl", "d = Traduction d\n"),
+        ]
@@ -1,34 +1,71 @@
 import logging
 
-from collections import defaultdict
 from collections.abc import Iterator
+from hashlib import md5
+from itertools import groupby
 from os.path import basename, commonpath, exists, join, normpath, relpath
 from tempfile import TemporaryDirectory
+from typing import cast
 
-from moz.l10n.resource import parse_resource, serialize_resource
+from moz.l10n.resource import serialize_resource
 
+from django.conf import settings
+from django.core.cache import cache
 from django.core.files import File
-from django.db.models import Q
+from django.db.models import Count, Max, Q
+from django.db.models.functions import Greatest
+from django.db.models.manager import BaseManager
 from django.utils import timezone
 
 from pontoon.base.models import (
     ChangedEntityLocale,
     Locale,
     Project,
+    Repository,
     Resource,
     Translation,
     User,
 )
 from pontoon.messaging.notifications import send_badge_notification
-from pontoon.sync.core.checkout import checkout_repos
+from pontoon.sync.core.checkout import Checkouts, checkout_repos
 from pontoon.sync.core.paths import UploadPaths, find_paths
 from pontoon.sync.core.stats import update_stats
 from pontoon.sync.core.translations_from_repo import find_db_updates, write_db_updates
-from pontoon.sync.core.translations_to_repo import set_translations
+from pontoon.sync.core.translations_to_repo import (
+    index_translations,
+    parse_template,
+    set_translations,
+)
 
 
 log = logging.getLogger(__name__)
 
+# Number of translations fetched at a time when serializing downloads
+SERIALIZE_CHUNK_SIZE = 2000
+
+# Serialized resources larger than this many bytes are not cached,
+# as memcached rejects items over 1 MB by default
+SERIALIZE_CACHE_MAX_SIZE = 1000 * 1000
+
+
+def checkout_for_download(project: Project) -> Checkouts:
+    """
+    The repository checkouts of `project`, for serializing downloads.
+
+    The repositories are only pulled if they are missing,
+    or have not been pulled for a download in `settings.DOWNLOAD_PULL_INTERVAL`.
+    """
+    pull_key = f"download_pull_{project.pk}"
+    repos = cast(BaseManager[Repository], project.repositories).all()
+    pull = not all(exists(repo.checkout_path) for repo in repos)
+    if cache.add(pull_key, True, settings.DOWNLOAD_PULL_INTERVAL):
+        pull = True
+    try:
+        return checkout_repos(project, pull=pull, shallow=True)
+    except Exception:
+        cache.delete(pull_key)
+        raise
+
 
 def serialize_locale(
     project: Project, locale: Locale, resource_path: str | None = None
@@ -38,8 +75,11 @@ def serialize_locale(
 
     Yields `(path, content)` tuples, where `path` is relative to the target
     repository root, matching the layout produced by two-way sync.
+
+    Serialized resources are cached by their source commit
+    and the last change of their translations.
     """
-    checkouts = checkout_repos(project, shallow=True)
+    checkouts = checkout_for_download(project)
     paths = find_paths(project, checkouts)
     # Narrowing the paths to a single locale is intentional; per-path locale
     # restrictions from an L10nConfigPaths config are still honored via the
@@ -50,26 +90,70 @@ def serialize_locale(
     resource_qs = Resource.objects.filter(project=project)
     if resource_path is not None:
         resource_qs = resource_qs.filter(path=resource_path)
-    resources = list(resource_qs)
-
-    # Fetch all relevant translations in a single query and group them by
-    # resource, rather than querying once per resource (N+1).
-    translations_by_resource: dict[int, list[Translation]] = defaultdict(list)
-    for tx in (
-        Translation.objects.filter(
-            entity__obsolete=False,
-            entity__resource__in=resources,
-            locale=locale,
-            active=True,
-        )
-        .filter(
-            Q(approved=True)
-            | Q(pretranslated=True, warnings__isnull=True)
-            | Q(fuzzy=True)
+    resources = list(resource_qs.order_by("id"))
+
+    translations_qs = Translation.objects.filter(
+        entity__obsolete=False,
+        entity__resource__in=resources,
+        locale=locale,
+        active=True,
+    ).filter(
+        Q(approved=True) | Q(pretranslated=True, warnings__isnull=True) | Q(fuzzy=True)
+    )
+    changes = {
+        row["entity__resource"]: (row["last_change"], row["count"])
+        for row in translations_qs.values("entity__resource").annotate(
+            last_change=Max(
+                Greatest(
+                    "date",
+                    "approved_date",
+                    "unapproved_date",
+                    "rejected_date",
+                    "unrejected_date",
+                )
+            ),
+            count=Count("id", distinct=True),
         )
+    }
+    commits = (checkouts.source.commit, checkouts.target.commit)
+    cache_keys = {
+        resource.id: "download_"
+        + md5(
+            repr(
+                (resource.id, locale.code, commits, changes.get(resource.id))
+            ).encode(),
+            usedforsecurity=False,
+        ).hexdigest()
+        for resource in resources
+    }
+    # Fetch all relevant translations of uncached resources in a single query,
+    # rather than querying once per resource (N+1), but only hold those
+    # of one resource at a time, so that memory use is bounded by its size.
+    # Cached content is only read as it is yielded.
+    uncached = {res.id for res in resources if not cache.has_key(cache_keys[res.id])}
+    tx_groups = groupby(
+        translations_qs.filter(entity__resource__in=uncached)
         .select_related("entity")
-    ):
-        translations_by_resource[tx.entity.resource_id].append(tx)
+        .order_by("entity__resource", "pk")
+        .iterator(chunk_size=SERIALIZE_CHUNK_SIZE),
+        key=lambda tx: tx.entity.resource_id,
+    )
+    tx_group = next(tx_groups, None) if uncached else None
+
+    def resource_translations(resource_id: int) -> list[Translation]:
+        nonlocal tx_group
+        if resource_id not in uncached:
+            # Expired from the cache since it was checked
+            return list(
+                translations_qs.filter(entity__resource=resource_id).select_related(
+                    "entity"
+                )
+            )
+        while tx_group is not None and tx_group[0] < resource_id:
+            tx_group = next(tx_groups, None)
+        if tx_group is not None and tx_group[0] == resource_id:
+            return list(tx_group[1])
+        return []
 
     for resource in resources:
         target, locale_codes = paths.target(resource.path)
@@ -86,12 +170,17 @@ def serialize_locale(
         if not exists(ref_path):
             log.error(f"[{project.slug}:{resource.path}] Missing source file")
             continue
-        translations = translations_by_resource.get(resource.id, [])
-        res = parse_resource(ref_path)
-        set_translations(locale, translations, res)
-        content = "".join(
-            serialize_resource(res, gettext_plurals=locale.cldr_plurals_list())
-        )
+        cache_key = cache_keys[resource.id]
+        content = cache.get(cache_key)
+        if content is None:
+            translations = index_translations(resource_translations(resource.id))
+            res = parse_template(ref_path)
+            set_translations(locale, translations, res)
+            content = "".join(
+                serialize_resource(res, gettext_plurals=locale.cldr_plurals_list())
+            )
+            if len(content.encode()) <= SERIALIZE_CACHE_MAX_SIZE:
+                cache.set(cache_key, content, settings.VIEW_CACHE_TIMEOUT)
         target_path = paths.format_target_path(target, locale.code)
         rel_path = relpath(target_path, checkouts.target.path).replace("\\", "/")
         yield rel_path, content
@@ -115,8 +204,8 @@ def import_uploaded_file(
         now = timezone.now()
         translation_before_level = user.badges_translation_level
         review_before_level = user.badges_review_level
-        write_db_updates(project, updates, user, now)
-        update_stats(project)
+        changed_trs = write_db_updates(project, updates, user, now)
+        update_stats(project, translated_resources=changed_trs)
         ChangedEntityLocale.objects.bulk_create(
             (
                 ChangedEntityLocale(entity_id=entity_id, locale_id=locale_id, when=now)
@@ -39,7 +39,11 @@ $(function () {
 
     $.ajax({
       url: `/${locale}/ajax/translation-memory/`,
-      data: { page: currentPage + 1, search: search },
+      // For a new search, start from the first entry
+      data: {
+        after: currentPage === 0 ? '' : loader.data('after'),
+        search: search,
+      },
       success: function (data) {
         loader.each(function () {
           $(this).remove();
@@ -0,0 +1,87 @@
+import logging
+import xml.etree.ElementTree as ET
+
+from celery import shared_task
+from notifications.signals import notify
+
+from django.db import transaction
+
+from pontoon.actionlog.models import ActionLog
+from pontoon.actionlog.utils import log_action
+from pontoon.base.models import TranslationMemoryUpload
+from pontoon.base.tasks import PontoonTask
+from pontoon.teams.utils import import_tm_entries, parse_tmx
+
+
+log = logging.getLogger(__name__)
+
+
+@shared_task(base=PontoonTask, name="import_tmx")
+def import_tmx_task(upload_pk: int):
+    """
+    Import the translation memory entries of an uploaded TMX file,
+    stored as a TranslationMemoryUpload, and notify the user
+    who uploaded it of the result.
+
+    The upload is deleted once imported.
+    """
+    upload = TranslationMemoryUpload.objects.select_related("locale", "user").get(
+        pk=upload_pk
+    )
+    locale = upload.locale
+    user = upload.user
+    parsed = 0
+    skipped_on_parse = 0
+
+    def entries(file):
+        nonlocal parsed, skipped_on_parse
+        for entry in parse_tmx(file, locale.code):
+            if entry is None:
+                skipped_on_parse += 1
+            else:
+                parsed += 1
+                yield entry
+
+    try:
+        with upload.open() as file, transaction.atomic():
+            created_entries = import_tm_entries(locale, entries(file))
+            if parsed:
+                log_action(
+                    ActionLog.ActionType.TM_ENTRIES_UPLOADED,
+                    user,
+                    tm_entries=created_entries,
+                )
+    except ET.ParseError as e:
+        message = f"Invalid XML file: {e}"
+    except Exception as e:
+        log.error(
+            f"[{locale.code}] Importing TMX file {upload.name} failed: {e}",
+            exc_info=True,
+        )
+        message = "Importing TM entries failed."
+    else:
+        imported = len(created_entries)
+        duplicates = parsed - imported
+        if not parsed:
+            message = "No valid translation entries found."
+        elif imported == 0:
+            message = "No TM entries imported."
+        else:
+            message = f"Importing TM entries complete. Imported: {imported}."
+        if duplicates:
+            message += f" Skipped duplicates: {duplicates}."
+        log.info(
+            f"[{locale.code}] Imported TMX file {upload.name}: parsed {parsed}, "
+            f"skipped on parse {skipped_on_parse}, imported {imported}"
+        )
+    finally:
+        upload.delete()
+
+    notify.send(
+        sender=locale,
+        recipient=user,
+        verb="ignore",  # Triggers render of description only
+        description=message,
+        category="tm_upload",
+    )
+    return message
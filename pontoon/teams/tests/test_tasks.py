@@ -0,0 +1,66 @@
+from unittest.mock import patch
+
+import pytest
+
+from notifications.models import Notification
+
+from pontoon.actionlog.models import ActionLog
+from pontoon.base.models import TranslationMemoryEntry, TranslationMemoryUpload
+from pontoon.teams.tasks import import_tmx_task
+from pontoon.teams.tests.test_utils import TMX
+
+
+def create_upload(locale, user, content):
+    upload = TranslationMemoryUpload.objects.create(
+        locale=locale, user=user, name="test.tmx"
+    )
+    # Split into several chunks, to be read back as one file
+    upload.write(content[i : i + 100] for i in range(0, len(content), 100))
+    return upload
+
+
+@pytest.mark.django_db
+def test_import_tmx_task(locale_a, user_a):
+    TranslationMemoryEntry.objects.create(
+        source="Hello", target="Mbote", locale=locale_a
+    )
+    upload = create_upload(locale_a, user_a, TMX)
+
+    message = import_tmx_task(upload.pk)
+
+    assert (
+        message == "Importing TM entries complete. Imported: 1. Skipped duplicates: 1."
+    )
+    assert not TranslationMemoryUpload.objects.exists()
+    entry = TranslationMemoryEntry.objects.get(locale=locale_a, source="World")
+    action = ActionLog.objects.get(
+        action_type=ActionLog.ActionType.TM_ENTRIES_UPLOADED, performed_by=user_a
+    )
+    assert list(action.tm_entries.all()) == [entry]
+    notification = Notification.objects.get(recipient=user_a)
+    assert notification.description == message
+
+
+@pytest.mark.django_db
+def test_import_tmx_task_invalid(locale_a, user_a):
+    upload = create_upload(locale_a, user_a, TMX.replace(b"</body>", b""))
+
+    message = import_tmx_task(upload.pk)
+
+    assert message.startswith("Invalid XML file:")
+    assert not TranslationMemoryUpload.objects.exists()
+    assert not TranslationMemoryEntry.objects.filter(locale=locale_a).exists()
+    assert not ActionLog.objects.filter(performed_by=user_a).exists()
+
+
+@pytest.mark.django_db
+def test_import_tmx_task_error(locale_a, user_a):
+    upload = create_upload(locale_a, user_a, TMX)
+
+    with patch("pontoon.teams.tasks.import_tm_entries", side_effect=ValueError("Oops")):
+        message = import_tmx_task(upload.pk)
+
+    assert message == "Importing TM entries failed."
+    assert not TranslationMemoryUpload.objects.exists()
+    notification = Notification.objects.get(recipient=user_a)
+    assert notification.description == message
@@ -2,12 +2,19 @@
 Tests related to the utils provided in pontoon.teams.libraries
 """
 
+import xml.etree.ElementTree as ET
+
+from io import BytesIO
+from unittest.mock import patch
+
 import pytest
 
-from pontoon.base.models import PermissionChangelog
+from pontoon.base.models import PermissionChangelog, TranslationMemoryEntry
 from pontoon.teams.utils import (
+    import_tm_entries,
     log_group_members,
     log_user_groups,
+    parse_tmx,
 )
 from pontoon.test.factories import (
     GroupFactory,
@@ -178,3 +185,62 @@ def test_log_user_groups_mixed(
     assert_permissionchangelog(
         changelog_entry1, PermissionChangelog.ActionType.REMOVED, user_a, user_b, group0
     )
+
+
+TMX = b"""<?xml version="1.0" encoding="utf-8"?>
+<tmx version="1.4">
+  <header srclang="en-US" />
+  <body>
+    <tu>
+      <tuv xml:lang="en-US"><seg>Hello</seg></tuv>
+      <tuv xml:lang="kg"><seg>Mbote</seg></tuv>
+    </tu>
+    <tu srclang="de">
+      <tuv xml:lang="de"><seg>Hallo</seg></tuv>
+      <tuv xml:lang="kg"><seg>Mbote</seg></tuv>
+    </tu>
+    <tu>
+      <tuv lang="en-US"><seg> World </seg></tuv>
+      <tuv lang="kg"><seg>Ntoto</seg></tuv>
+    </tu>
+    <tu>
+      <tuv xml:lang="en-US"><seg>Empty</seg></tuv>
+      <tuv xml:lang="kg"><seg></seg></tuv>
+    </tu>
+  </body>
+</tmx>
+"""
+
+
+def test_parse_tmx():
+    assert list(parse_tmx(BytesIO(TMX), "kg")) == [
+        ("Hello", "Mbote"),
+        None,
+        ("World", "Ntoto"),
+        None,
+    ]
+
+
+def test_parse_tmx_invalid():
+    with pytest.raises(ET.ParseError):
+        list(parse_tmx(BytesIO(b"<tmx><body><tu></body></tmx>"), "kg"))
+
+
+@pytest.mark.django_db
+def test_import_tm_entries(locale_a, locale_b):
+    TranslationMemoryEntry.objects.create(source="a", target="A", locale=locale_a)
+    TranslationMemoryEntry.objects.create(source="b", target="B", locale=locale_b)
+
+    with patch("pontoon.teams.utils.TMX_IMPORT_CHUNK_SIZE", 2):
+        created = import_tm_entries(
+            locale_a, iter([("a", "A"), ("b", "B"), ("c", "C"), ("b", "B"), ("b", "C")])
+        )
+
+    entries = TranslationMemoryEntry.objects.filter(locale=locale_a)
+    assert len(created) == 3
+    assert set(entries.filter(pk__in=created).values_list("source", "target")) == {
+        ("b", "B"),
+        ("c", "C"),
+        ("b", "C"),
+    }
+    assert entries.count() == 4
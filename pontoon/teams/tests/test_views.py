@@ -2,9 +2,12 @@ from unittest.mock import patch
 
 import pytest
 
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.http import HttpResponse
 from django.shortcuts import render
 
+from pontoon.base.models import TranslationMemoryEntry, TranslationMemoryUpload
+from pontoon.teams.tests.test_utils import TMX
 from pontoon.test.factories import (
     EntityFactory,
     LocaleFactory,
@@ -265,3 +268,88 @@ def test_ajax_projects_request_more_projects_button_visibility(
 
     assert response.status_code == 200
     assert b"request-projects" in response.content
+
+
+@pytest.mark.django_db
+@patch("pontoon.teams.views.render", return_value=HttpResponse(""))
+def test_ajax_translation_memory_pagination(mock_render, client, admin, locale_a):
+    entity = EntityFactory.create()
+    TranslationMemoryEntry.objects.bulk_create(
+        [
+            TranslationMemoryEntry(source=f"s{i}", target=f"t{i}", locale=locale_a)
+            for i in range(150)
+        ]
+        + [
+            TranslationMemoryEntry(
+                source="s0", target="t0", locale=locale_a, entity=entity
+            )
+        ]
+    )
+    client.force_login(admin)
+    url = f"/{locale_a.code}/ajax/translation-memory/"
+
+    client.get(url, HTTP_X_REQUESTED_WITH="XMLHttpRequest")
+    context = mock_render.call_args[0][2]
+    first_page = context["tm_entries"]
+    assert len(first_page) == 100
+    assert context["has_next"]
+    assert mock_render.call_args[0][1] == "teams/includes/translation_memory.html"
+
+    client.get(
+        url,
+        {"after": context["next_after"]},
+        HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+    )
+    context = mock_render.call_args[0][2]
+    second_page = context["tm_entries"]
+    assert len(second_page) == 50
+    assert not context["has_next"]
+    assert (
+        mock_render.call_args[0][1] == "teams/widgets/translation_memory_entries.html"
+    )
+    assert {entry["source"] for entry in first_page + second_page} == {
+        f"s{i}" for i in range(150)
+    }
+    (grouped,) = [
+        entry for entry in first_page + second_page if entry["source"] == "s0"
+    ]
+    assert len(grouped["ids"]) == 2
+    assert grouped["entity_ids"] == str(entity.pk)
+
+    client.get(
+        url, {"after": "", "search": "S14"}, HTTP_X_REQUESTED_WITH="XMLHttpRequest"
+    )
+    context = mock_render.call_args[0][2]
+    assert {entry["source"] for entry in context["tm_entries"]} == {
+        "s14",
+        *(f"s{i}" for i in range(140, 150)),
+    }
+
+
+@pytest.mark.django_db
+@patch("pontoon.teams.views.import_tmx_task.delay")
+def test_ajax_translation_memory_upload(mock_delay, client, admin, locale_a):
+    client.force_login(admin)
+    url = f"/{locale_a.code}/ajax/translation-memory/upload/"
+
+    response = client.post(
+        url,
+        {"tmx_file": SimpleUploadedFile("test.txt", TMX)},
+        HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+    )
+    assert response.status_code == 400
+    assert not TranslationMemoryUpload.objects.exists()
+    assert not mock_delay.called
+
+    response = client.post(
+        url,
+        {"tmx_file": SimpleUploadedFile("test.tmx", TMX)},
+        HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+    )
+    assert response.status_code == 200
+    assert response.json()["status"] is True
+    upload = TranslationMemoryUpload.objects.get()
+    assert (upload.locale, upload.user, upload.name) == (locale_a, admin, "test.tmx")
+    with upload.open() as file:
+        assert file.read() == TMX
+    mock_delay.assert_called_once_with(upload.pk)
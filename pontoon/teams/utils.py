@@ -1,4 +1,38 @@
-from pontoon.base.models import PermissionChangelog
+import logging
+import re
+import xml.etree.ElementTree as ET
+
+from collections.abc import Iterable, Iterator
+from itertools import batched
+from typing import IO
+
+from django.db import connection
+
+from pontoon.base.models import Locale, PermissionChangelog
+
+
+log = logging.getLogger(__name__)
+
+# Number of parsed TMX entries inserted with each query
+TMX_IMPORT_CHUNK_SIZE = 1000
+
+TMX_SRCLANG_PATTERN = re.compile(r"^en(?:[-_](us))?$", re.IGNORECASE)
+TMX_NAMESPACES = {"xml": "http://www.w3.org/XML/1998/namespace"}
+
+# Entries already in the locale's translation memory, or repeated in the chunk,
+# are skipped using the unique entries maintained by the database.
+INSERT_TM_ENTRIES = """
+    INSERT INTO base_translationmemoryentry (source, target, locale_id)
+    SELECT DISTINCT ON (md5(new.source), md5(new.target)) new.source, new.target, %s
+    FROM unnest(%s::text[], %s::text[]) AS new (source, target)
+    WHERE NOT EXISTS (
+        SELECT 1 FROM base_uniquetranslationmemoryentry AS u
+        WHERE u.locale_id = %s
+            AND u.source_hash = md5(new.source)
+            AND u.target_hash = md5(new.target)
+    )
+    RETURNING id
+"""
 
 
 def log_user_groups(admin, user, changed_groups):
@@ -62,3 +96,73 @@ def log_group_members(manager, group, changed_groups):
         for user in remove_users
     ]
     PermissionChangelog.objects.bulk_create(log_entries)
+
+
+def _get_seg_text(tu, lang):
+    # Try to find <tuv> with the xml:lang attribute
+    seg = tu.find(f"./tuv[@xml:lang='{lang}']/seg", namespaces=TMX_NAMESPACES)
+
+    # If not found, try the lang attribute
+    if seg is None:
+        seg = tu.find(f"./tuv[@lang='{lang}']/seg")
+
+    return seg.text.strip() if seg is not None and seg.text else None
+
+
+def parse_tmx(file: IO[bytes], locale_code: str) -> Iterator[tuple[str, str] | None]:
+    """
+    Parse the translation units of a TMX file incrementally.
+
+    Yields a (source, target) tuple for each valid <tu>, or None for a skipped one.
+    Each <tu> is removed from the tree once parsed, so memory use does not
+    grow with the size of the file.
+
+    Raises ET.ParseError if the file is not valid XML.
+    """
+    header_srclang = ""
+    parents: list[ET.Element] = []
+    for event, elem in ET.iterparse(file, events=("start", "end")):
+        if event == "start":
+            if elem.tag == "header":
+                header_srclang = elem.attrib.get("srclang", "")
+            parents.append(elem)
+            continue
+
+        parents.pop()
+        if elem.tag != "tu":
+            continue
+
+        try:
+            srclang = elem.attrib.get("srclang", header_srclang)
+            if not TMX_SRCLANG_PATTERN.match(srclang):
+                log.info(f"Skipping <tu> with unsupported srclang: {srclang}")
+                yield None
+            else:
+                source = _get_seg_text(elem, srclang)
+                target = _get_seg_text(elem, locale_code)
+                if source and target:
+                    yield source, target
+                else:
+                    log.info("Skipping <tu> with missing or empty segment")
+                    yield None
+        finally:
+            if parents:
+                parents[-1].remove(elem)
+
+
+def import_tm_entries(locale: Locale, entries: Iterable[tuple[str, str]]) -> list[int]:
+    """
+    Add (source, target) entries to the translation memory of `locale`,
+    unless it already has them.
+
+    Returns the ids of the created TranslationMemoryEntry objects.
+    """
+    created: list[int] = []
+    with connection.cursor() as cursor:
+        for chunk in batched(entries, TMX_IMPORT_CHUNK_SIZE):
+            sources, targets = zip(*chunk)
+            cursor.execute(
+                INSERT_TM_ENTRIES, [locale.pk, list(sources), list(targets), locale.pk]
+            )
+            created.extend(row[0] for row in cursor.fetchall())
+    return created
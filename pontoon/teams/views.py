@@ -1,7 +1,5 @@
 import json
 import logging
-import re
-import xml.etree.ElementTree as ET
 
 from typing import cast
 
@@ -11,14 +9,11 @@ from guardian.decorators import permission_required_or_403
 
 from django.conf import settings
 from django.contrib.auth.decorators import login_required
-from django.contrib.postgres.aggregates import ArrayAgg, StringAgg
 from django.core.cache import cache
 from django.core.exceptions import ImproperlyConfigured
 from django.core.mail import EmailMessage
-from django.core.paginator import Paginator
 from django.db import transaction
-from django.db.models import Count, F, Prefetch, Q, TextField
-from django.db.models.functions import Cast
+from django.db.models import Count, F, Prefetch, Q
 from django.db.models.manager import BaseManager
 from django.http import (
     Http404,
@@ -39,18 +34,23 @@ from pontoon.base import forms
 from pontoon.base.aggregated_stats import get_top_instances
 from pontoon.base.models import (
     Locale,
+    LocaleStats,
     Project,
-    TranslatedResource,
+    ProjectLocaleStats,
     TranslationMemoryEntry,
+    TranslationMemoryUpload,
+    UniqueTranslationMemoryEntry,
     User,
 )
 from pontoon.base.models.project_locale import ProjectLocale
 from pontoon.base.models.translation import Translation
+from pontoon.base.models.translation_memory_upload import UPLOAD_CHUNK_SIZE
 from pontoon.base.services import get_locale_or_redirect
 from pontoon.base.utils import require_AJAX
 from pontoon.contributors.views import ContributorsMixin
 from pontoon.insights.utils import get_locale_insights
 from pontoon.teams.forms import LocaleRequestForm
+from pontoon.teams.tasks import import_tmx_task
 
 
 log = logging.getLogger(__name__)
@@ -75,7 +75,7 @@ def teams(request):
         "teams/teams.html",
         {
             "locales": locales,
-            "all_locales_stats": TranslatedResource.objects.string_stats(),
+            "all_locales_stats": LocaleStats.objects.string_stats(),
             "locale_stats": locale_stats,
             "form": form,
             "top_instances": get_top_instances(locales, locale_stats),
@@ -93,8 +93,10 @@ def team(request, locale):
     if not visible_count:
         raise Http404
 
-    locale_stats = TranslatedResource.objects.filter(locale=locale).string_stats(
-        request.user
+    locale_stats = (
+        ProjectLocaleStats.objects.filter(locale=locale)
+        .filter_projects(request.user)
+        .string_stats()
     )
 
     return render(
@@ -329,12 +331,19 @@ def ajax_permissions(request, locale):
 @permission_required_or_403("base.can_translate_locale", (Locale, "code", "locale"))
 @transaction.atomic
 def ajax_translation_memory(request, locale):
-    """Translation Memory tab."""
+    """
+    Translation Memory tab.
+
+    Entries are grouped by source and target, as maintained in
+    UniqueTranslationMemoryEntry, and paginated by the id of the last
+    entry already shown (the "after" parameter), so that loading
+    any page costs the same as loading the first one.
+    """
     locale = get_object_or_404(Locale, code=locale)
     search_query = request.GET.get("search", "").strip()
 
     try:
-        first_page_number = int(request.GET.get("page", 1))
+        after = int(request.GET.get("after") or 0)
         page_count = int(request.GET.get("pages", 1))
     except ValueError as e:
         return JsonResponse(
@@ -342,7 +351,9 @@ def ajax_translation_memory(request, locale):
             status=400,
         )
 
-    tm_entries = TranslationMemoryEntry.objects.filter(locale=locale)
+    tm_entries = UniqueTranslationMemoryEntry.objects.filter(
+        locale=locale, pk__gt=after
+    )
 
     # Apply search filter if a search query is provided
     if search_query:
@@ -350,34 +361,45 @@ def ajax_translation_memory(request, locale):
             Q(source__icontains=search_query) | Q(target__icontains=search_query)
         )
 
-    tm_entries = (
-        # Group by "source" and "target"
-        tm_entries.values("source", "target").annotate(
-            count=Count("id"),
-            ids=ArrayAgg("id"),
-            # Concatenate entity IDs
-            entity_ids=StringAgg(
-                Cast("entity_id", output_field=TextField()), delimiter=","
-            ),
-        )
-    )
-
     entries_per_page = 100
-    paginator = Paginator(tm_entries, entries_per_page)
-
-    combined_entries = []
+    limit = entries_per_page * max(page_count, 1)
+    combined_entries = list(
+        tm_entries.order_by("pk").values(
+            "pk", "source", "target", "source_hash", "target_hash"
+        )[: limit + 1]
+    )
+    has_next = len(combined_entries) > limit
+    combined_entries = combined_entries[:limit]
 
-    for page_number in range(first_page_number, first_page_number + page_count):
-        if page_number > paginator.num_pages:
-            break
-        page = paginator.get_page(page_number)
-        combined_entries.extend(page.object_list)
+    # Collect the ids of the grouped entries, and of their entities
+    entries_by_hash = {
+        (entry["source_hash"], entry["target_hash"]): entry
+        for entry in combined_entries
+    }
+    for entry in combined_entries:
+        entry["ids"] = []
+        entry["entity_ids"] = set()
+    for pk, entity_id, source_hash, target_hash in (
+        TranslationMemoryEntry.objects.filter(
+            locale=locale,
+            source_hash__in={entry["source_hash"] for entry in combined_entries},
+        )
+        .order_by("pk")
+        .values_list("pk", "entity_id", "source_hash", "target_hash")
+    ):
+        entry = entries_by_hash.get((source_hash, target_hash))
+        if entry is not None:
+            entry["ids"].append(pk)
+            if entity_id is not None:
+                entry["entity_ids"].add(entity_id)
+    for entry in combined_entries:
+        entry["entity_ids"] = ",".join(str(pk) for pk in sorted(entry["entity_ids"]))
 
     # For the inital load, render the entire tab. For subsequent requests
-    # (determined by the "page" attribute), only render the entries.
+    # (determined by the "after" attribute), only render the entries.
     template = (
         "teams/widgets/translation_memory_entries.html"
-        if "page" in request.GET
+        if "after" in request.GET
         else "teams/includes/translation_memory.html"
     )
 
@@ -388,7 +410,8 @@ def ajax_translation_memory(request, locale):
             "locale": locale,
             "search_query": search_query,
             "tm_entries": combined_entries,
-            "has_next": paginator.num_pages > page_number,
+            "has_next": has_next,
+            "next_after": combined_entries[-1]["pk"] if combined_entries else after,
         },
     )
 
@@ -448,9 +471,13 @@ def ajax_translation_memory_delete(request, locale):
 @require_AJAX
 @require_POST
 @permission_required_or_403("base.can_translate_locale", (Locale, "code", "locale"))
-@transaction.atomic
 def ajax_translation_memory_upload(request, locale):
-    """Upload Translation Memory entries from a .TMX file."""
+    """
+    Upload Translation Memory entries from a .TMX file.
+
+    The file is imported in the background, and the user is notified
+    of the result once done.
+    """
     try:
         file = request.FILES["tmx_file"]
     except MultiValueDictKeyError:
@@ -459,11 +486,12 @@ def ajax_translation_memory_upload(request, locale):
             status=400,
         )
 
-    if file.size > 20 * 1024 * 1024:
+    max_size = settings.TMX_UPLOAD_MAX_SIZE
+    if file.size > max_size * 1024 * 1024:
         return JsonResponse(
             {
                 "status": False,
-                "message": "File size limit exceeded. The maximum allowed size is 20 MB.",
+                "message": f"File size limit exceeded. The maximum allowed size is {max_size} MB.",
             },
             status=400,
         )
@@ -478,114 +506,17 @@ def ajax_translation_memory_upload(request, locale):
         )
 
     locale = get_object_or_404(Locale, code=locale)
-    code = locale.code
-
-    # Parse the TMX file
-    try:
-        tree = ET.parse(file)
-        root = tree.getroot()
-    except ET.ParseError as e:
-        return JsonResponse(
-            {"status": False, "message": f"Invalid XML file: {e}"}, status=400
-        )
-
-    # Extract TM entries
-    file_entries = []
-    srclang_pattern = re.compile(r"^en(?:[-_](us))?$", re.IGNORECASE)
-    ns = {"xml": "http://www.w3.org/XML/1998/namespace"}
-
-    header = root.find("header")
-    header_srclang = header.attrib.get("srclang", "") if header else ""
-
-    def get_seg_text(tu, lang, ns):
-        # Try to find <tuv> with the xml:lang attribute
-        seg = tu.find(f"./tuv[@xml:lang='{lang}']/seg", namespaces=ns)
-
-        # If not found, try the lang attribute
-        if seg is None:
-            seg = tu.find(f"./tuv[@lang='{lang}']/seg")
-
-        return seg.text.strip() if seg is not None and seg.text else None
-
-    tu_elements = root.findall(".//tu")
-    for tu in tu_elements:
-        try:
-            srclang = tu.attrib.get("srclang", header_srclang)
-            tu_str = ET.tostring(tu, encoding="unicode")
-
-            if not srclang_pattern.match(srclang):
-                log.info(f"Skipping <tu> with unsupported srclang: {tu_str}")
-                continue
-
-            source = get_seg_text(tu, srclang, ns)
-            target = get_seg_text(tu, code, ns)
-
-            if source and target:
-                file_entries.append({"source": source, "target": target})
-            else:
-                log.info(f"Skipping <tu> with missing or empty segment: {tu_str}")
-
-        except Exception as e:
-            log.info(f"Error processing <tu>: {e}")
-
-    if not file_entries:
-        return JsonResponse(
-            {"status": False, "message": "No valid translation entries found."},
-            status=400,
-        )
-
-    # Create TranslationMemoryEntry objects
-    tm_entries = [
-        TranslationMemoryEntry(
-            source=entry["source"],
-            target=entry["target"],
-            locale=locale,
-        )
-        for entry in file_entries
-    ]
-
-    # Filter out entries that already exist in the database
-    existing_combinations = set(
-        TranslationMemoryEntry.objects.filter(locale=locale).values_list(
-            "source", "target"
+    with transaction.atomic():
+        upload = TranslationMemoryUpload.objects.create(
+            locale=locale, user=request.user, name=file.name
         )
-    )
-    tm_entries_to_create = [
-        entry
-        for entry in tm_entries
-        if (entry.source, entry.target) not in existing_combinations
-    ]
-
-    created_entries = TranslationMemoryEntry.objects.bulk_create(
-        tm_entries_to_create, batch_size=1000
-    )
-
-    log_action(
-        ActionLog.ActionType.TM_ENTRIES_UPLOADED,
-        request.user,
-        tm_entries=created_entries,
-    )
-
-    parsed = len(file_entries)
-    skipped_on_parse = len(tu_elements) - parsed
-    imported = len(created_entries)
-    duplicates = parsed - len(tm_entries_to_create)
-
-    message = f"Importing TM entries complete. Imported: {imported}."
-    if imported == 0:
-        message = "No TM entries imported."
-
-    if duplicates:
-        message += f" Skipped duplicates: {duplicates}."
+        upload.write(file.chunks(UPLOAD_CHUNK_SIZE))
+    import_tmx_task.delay(upload.pk)
 
     return JsonResponse(
         {
             "status": True,
-            "message": message,
-            "parsed": parsed,
-            "skipped_on_parse": skipped_on_parse,
-            "imported": imported,
-            "duplicates": duplicates,
+            "message": "Importing TM entries. You will be notified when done.",
         }
     )
 
@@ -1,10 +1,18 @@
-import re
+from collections.abc import Iterable
+from copy import copy
+from uuid import uuid4
 
-from django.db import models
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import Prefetch, prefetch_related_objects
 
 from pontoon.base.models import Entity, Resource, TranslatedResource
 
 
+MATCHER_VERSION_KEY = "terminology:matcher_version"
+_END = ""
+
+
 def update_terminology_project_stats():
     resource = Resource.objects.current().get(project__slug="terminology")
     resource.total_strings = Entity.objects.filter(
@@ -14,18 +22,113 @@ def update_terminology_project_stats():
     TranslatedResource.objects.filter(resource=resource).calculate_stats()
 
 
-class TermQuerySet(models.QuerySet):
-    def for_string(self, string):
-        terms = []
-        available_terms = self.exclude(definition="").exclude(forbidden=True)
+def _fold(string: str) -> str:
+    """Lowercase `string`, keeping each character at its index."""
+    return "".join(lc if len(lc := ch.lower()) == 1 else ch for ch in string)
+
+
+def _is_word(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class TermMatcher:
+    """
+    Finds the terms that occur in a string starting at a word boundary,
+    like `re.search(r"\b" + re.escape(term.text), string)`,
+    ignoring case unless the term is case-sensitive.
+
+    All terms are compiled into two character tries,
+    for case-sensitive and case-insensitive matching,
+    which are walked from each word boundary of the string.
+    """
+
+    def __init__(self, terms: Iterable["Term"], version: str | None = None):
+        self.version = version
+        self.terms = list(terms)
+        self.cs_trie: dict = {}
+        self.ci_trie: dict = {}
+        for idx, term in enumerate(self.terms):
+            if term.case_sensitive:
+                node, text = self.cs_trie, term.text
+            else:
+                node, text = self.ci_trie, _fold(term.text)
+            for ch in text:
+                node = node.setdefault(ch, {})
+            node.setdefault(_END, []).append(idx)
+
+    def find(self, string: str) -> list["Term"]:
+        folded = _fold(string)
+        found: set[int] = set()
+        prev_is_word = False
+        for start in range(len(string) + 1):
+            next_is_word = start < len(string) and _is_word(string[start])
+            if prev_is_word != next_is_word:
+                self._walk(self.cs_trie, string, start, found)
+                self._walk(self.ci_trie, folded, start, found)
+            prev_is_word = next_is_word
+        return [self.terms[idx] for idx in sorted(found)]
+
+    @staticmethod
+    def _walk(node: dict, string: str, start: int, found: set[int]) -> None:
+        found.update(node.get(_END, ()))
+        for ch in string[start:]:
+            node = node.get(ch)
+            if node is None:
+                return
+            found.update(node.get(_END, ()))
+
+
+_matcher: TermMatcher | None = None
+
+
+def get_term_matcher() -> TermMatcher:
+    """
+    The process-level matcher for all terms with a definition
+    that are not forbidden.
 
-        for term in available_terms:
-            term_text = r"\b" + re.escape(term.text)
-            flags = 0 if term.case_sensitive else re.IGNORECASE
+    It's rebuilt when any process has saved or deleted a term since it was built.
+    """
+    global _matcher
+    version = cache.get(MATCHER_VERSION_KEY)
+    if version is None:
+        cache.add(MATCHER_VERSION_KEY, uuid4().hex, timeout=None)
+        version = cache.get(MATCHER_VERSION_KEY)
+    if _matcher is None or _matcher.version != version:
+        terms = Term.objects.exclude(definition="").exclude(forbidden=True)
+        _matcher = TermMatcher(terms.order_by("pk"), version)
+    return _matcher
 
-            if re.search(term_text, string, flags):
-                terms.append(term)
 
+def invalidate_term_matcher() -> None:
+    global _matcher
+    _matcher = None
+    cache.set(MATCHER_VERSION_KEY, uuid4().hex, timeout=None)
+
+
+class TermQuerySet(models.QuerySet):
+    def for_string(self, string, locale=None):
+        """
+        Terms with a definition that are not forbidden, and occur in `string`.
+
+        If `locale` is set, the terms' translations for it are prefetched,
+        for use by `Term.translation(locale)`.
+        """
+        if self.query.has_filters():
+            available_terms = self.exclude(definition="").exclude(forbidden=True)
+            terms = TermMatcher(available_terms.order_by("pk")).find(string)
+        else:
+            # Copies, as the matcher's terms are shared between requests
+            terms = [copy(term) for term in get_term_matcher().find(string)]
+
+        if locale is not None and terms:
+            prefetch_related_objects(
+                terms,
+                Prefetch(
+                    "translations",
+                    queryset=TermTranslation.objects.filter(locale=locale),
+                    to_attr="locale_translations",
+                ),
+            )
         return terms
 
     def delete(self, *args, **kwargs):
@@ -37,6 +140,7 @@ class TermQuerySet(models.QuerySet):
         update_terminology_project_stats()
 
         super().delete(*args, **kwargs)
+        transaction.on_commit(invalidate_term_matcher)
 
 
 class Term(models.Model):
@@ -82,6 +186,16 @@ class Term(models.Model):
         """
         if self.do_not_translate:
             return self.text
+        elif hasattr(self, "locale_translations"):
+            # Prefetched by TermQuerySet.for_string()
+            return next(
+                (
+                    tt.text
+                    for tt in self.locale_translations
+                    if tt.locale_id == locale.pk
+                ),
+                None,
+            )
         else:
             try:
                 return self.translations.get(locale=locale).text
@@ -224,6 +338,8 @@ class Term(models.Model):
         if created and self.localizable:
             self.handle_term_create()
 
+        transaction.on_commit(invalidate_term_matcher)
+
     def delete(self, *args, **kwargs):
         """
         Before deleting a Term, obsolete its Entity
@@ -232,6 +348,7 @@ class Term(models.Model):
         update_terminology_project_stats()
 
         super().delete(*args, **kwargs)
+        transaction.on_commit(invalidate_term_matcher)
 
     def __str__(self):
         return self.text
@@ -2,10 +2,13 @@ from unittest.mock import patch
 
 import pytest
 
-from pontoon.terminology.models import Term
+from pontoon.terminology.models import Term, TermMatcher
 from pontoon.test.factories import EntityFactory, TermFactory, TermTranslationFactory
 
 
+pytestmark = pytest.mark.usefixtures("term_matcher")
+
+
 @pytest.fixture
 @patch("pontoon.terminology.models.update_terminology_project_stats")
 def available_terms(_):
@@ -72,6 +75,63 @@ def test_terms_for_string(string, found_terms, available_terms):
         assert term.text == found_terms[i]
 
 
+@pytest.mark.django_db
+@patch("pontoon.terminology.models.update_terminology_project_stats")
+def test_terms_for_string_updated(
+    _, available_terms, django_capture_on_commit_callbacks
+):
+    """
+    The cached matcher is rebuilt when changes to terms are committed.
+    """
+    assert Term.objects.for_string("Find a new term here") == []
+
+    with django_capture_on_commit_callbacks(execute=True):
+        term = TermFactory.create(text="new term")
+    assert Term.objects.for_string("Find a new term here") == [term]
+
+    term.text = "new Term"
+    term.case_sensitive = True
+    with django_capture_on_commit_callbacks(execute=True):
+        term.save()
+    assert Term.objects.for_string("Find a new term here") == []
+    assert Term.objects.for_string("Find a new Term here") == [term]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        term.delete()
+    assert Term.objects.for_string("Find a new Term here") == []
+
+
+def test_term_matcher():
+    terms = [
+        Term(pk=1, text="student"),
+        Term(pk=2, text="student ambassador"),
+        Term(pk=3, text="Channel", case_sensitive=True),
+        Term(pk=4, text="-ish"),
+    ]
+    matcher = TermMatcher(terms)
+    assert matcher.find("Student ambassadors") == terms[:2]
+    assert matcher.find("students, channels") == [terms[0]]
+    assert matcher.find("Channel-ish") == [terms[2], terms[3]]
+    assert matcher.find("Channel -ish") == [terms[2]]
+    assert matcher.find("") == []
+
+
+@pytest.mark.django_db
+@patch("pontoon.terminology.models.update_terminology_project_stats")
+def test_terms_for_string_translations(
+    _, locale_a, locale_b, django_assert_num_queries
+):
+    term_a = TermFactory.create(text="term a")
+    term_b = TermFactory.create(text="term b")
+    TermTranslationFactory.create(locale=locale_a, term=term_a, text="a")
+    TermTranslationFactory.create(locale=locale_b, term=term_b, text="b")
+
+    Term.objects.for_string("")  # Build the matcher
+    with django_assert_num_queries(1):
+        terms = Term.objects.for_string("term a and term b", locale_a)
+        assert [term.translation(locale_a) for term in terms] == ["a", None]
+
+
 @pytest.mark.django_db
 @patch("pontoon.terminology.models.update_terminology_project_stats")
 def test_term_translation(_, locale_a):
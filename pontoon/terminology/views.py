@@ -26,7 +26,7 @@ def get_terms(request):
     locale = get_object_or_404(Locale, code=locale_code)
     payload = []
 
-    for term in Term.objects.for_string(source_string):
+    for term in Term.objects.for_string(source_string, locale):
         data = {
             "text": term.text,
             "part_of_speech": term.part_of_speech,
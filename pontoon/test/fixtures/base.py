@@ -2,9 +2,16 @@ import pytest
 
 from django.contrib.auth.models import User
 
+from pontoon.terminology.models import invalidate_term_matcher
 from pontoon.test import factories
 
 
+@pytest.fixture
+def term_matcher():
+    """Terms are rolled back after each test, so their cached matcher is reset."""
+    invalidate_term_matcher()
+
+
 @pytest.fixture
 def admin():
     """Admin - a superuser"""